@@ -1,25 +1,46 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List
+import time
 from datetime import datetime
 from decimal import Decimal
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
-from .money import Money
+from .money import Money, _from_minor
 from .transactions import Transaction
+from .ledger import ColumnarLedger, to_epoch_us
 from .exceptions import InsufficientFundsError, InvalidOperationError, CurrencyMismatchError
 from .mixins import JSONSerializable, Auditable
+from .interest import monthly_interest_minor
+
+# Interest rates shared by every account on the same product: one Decimal per distinct rate.
+_RATES: Dict[str, Decimal] = {}
+
+def intern_rate(rate) -> Decimal:
+    key = str(rate)
+    d = _RATES.get(key)
+    if d is None:
+        d = _RATES[key] = Decimal(key)
+    return d
 
 class Account(ABC):
-    """Abstract base account with encapsulated balance and ledger."""
+    """Abstract base account with encapsulated balance and ledger.
+
+    The hierarchy uses ``__slots__`` (no per-instance ``__dict__``): every
+    subclass must declare slots for the attributes it adds.
+    """
+    __slots__ = ("_id", "_owner", "_balance", "_ledger", "_on_change")
     bank_code: str = "FIC"
 
     def __init__(self, id: str, owner: str, opening_balance: Money):
-        if opening_balance.amount < 0:
+        if opening_balance.minor < 0:
             raise InvalidOperationError("Opening balance cannot be negative")
         self._id = id
         self._owner = owner
         self._balance: Money = opening_balance
-        self._ledger: List[Transaction] = [Transaction(opening_balance, datetime.utcnow(), "opening_balance")]
+        # Called as hook(account, delta_minor) after every balance change; set by Bank.add_account.
+        self._on_change: Optional[Callable[["Account", int], None]] = None
+        self._ledger = ColumnarLedger(opening_balance.currency)
+        self._ledger.append_raw(opening_balance.minor, time.time_ns() // 1000, "opening_balance")
 
     @property
     def id(self) -> str:
@@ -33,42 +54,122 @@ class Account(ABC):
     def balance(self) -> Money:
         return self._balance
 
+    @property
+    def ledger(self) -> ColumnarLedger:
+        """Read-only view of the ledger; supports len(), iteration and slicing."""
+        return self._ledger
+
+    def balance_at(self, ts: datetime) -> Money:
+        """Balance as of ``ts`` (naive UTC), including entries stamped exactly at ``ts``."""
+        return _from_minor(self._ledger.balance_at_us(to_epoch_us(ts)), self._balance.currency)
+
+    def transactions_between(self, start: datetime, end: datetime) -> List[Transaction]:
+        """Ledger entries stamped within [start, end] (naive UTC)."""
+        return self._ledger.between_us(to_epoch_us(start), to_epoch_us(end))
+
     @abstractmethod
     def account_type(self) -> str:
         ...
 
     def _append_txn(self, amount: Money, description: str) -> None:
-        self._ledger.append(Transaction(amount, datetime.utcnow(), description))
+        self._ledger.append_raw(amount.minor, time.time_ns() // 1000, description)
+
+    def _post(self, amount: Money, description: str) -> None:
+        """Apply a signed amount to the balance, record it and notify the change hook."""
+        self._balance = self._balance + amount
+        self._append_txn(amount, description)
+        if self._on_change is not None:
+            self._on_change(self, amount.minor)
+
+    def _post_minor(self, minor: int, description: str, ts_us: int) -> None:
+        """Like _post, for bulk writers that already hold minor units and a timestamp."""
+        self._balance = _from_minor(self._balance.minor + minor, self._balance.currency)
+        self._ledger.append_raw(minor, ts_us, description)
+        if self._on_change is not None:
+            self._on_change(self, minor)
 
     def deposit(self, money: Money) -> None:
-        if money.amount <= 0:
+        if money.minor <= 0:
             raise InvalidOperationError("Deposit amount must be positive")
         if money.currency != self._balance.currency:
             raise CurrencyMismatchError("Currency mismatch in deposit")
-        self._balance = self._balance + money
-        self._append_txn(money, "deposit")
+        self._post(money, "deposit")
         if hasattr(self, "_touch"):
             self._touch()  # type: ignore[attr-defined]
 
     def withdraw(self, money: Money) -> None:
-        if money.amount <= 0:
+        if money.minor <= 0:
             raise InvalidOperationError("Withdraw amount must be positive")
         if money.currency != self._balance.currency:
             raise CurrencyMismatchError("Currency mismatch in withdraw")
-        if self._balance.amount < money.amount:
+        if self._balance.minor < money.minor:
             raise InsufficientFundsError("Insufficient funds")
-        self._balance = self._balance - money
-        self._append_txn(Money(-money.amount, money.currency), "withdraw")
+        self._post(-money, "withdraw")
         if hasattr(self, "_touch"):
             self._touch()  # type: ignore[attr-defined]
 
-    def transfer(self, to: "Account", money: Money) -> None:
+    def _floor_minor(self) -> int:
+        """Lowest balance (minor units) a withdrawal may leave."""
+        return 0
+
+    def _validate_batch(self, ops: Iterable[Tuple[str, Money]]) -> List[Tuple[int, str]]:
+        """Check a whole batch against the running balance; returns (signed minor, description) per op."""
+        currency = self._balance.currency
+        floor = self._floor_minor()
+        balance = self._balance.minor
+        entries: List[Tuple[int, str]] = []
+        for op, money in ops:
+            if money.minor <= 0:
+                raise InvalidOperationError(f"{op} amount must be positive")
+            if money.currency != currency:
+                raise CurrencyMismatchError(f"Currency mismatch in {op}")
+            if op == "deposit":
+                balance += money.minor
+                entries.append((money.minor, op))
+            elif op == "withdraw":
+                balance -= money.minor
+                if balance < floor:
+                    raise InsufficientFundsError(f"Insufficient funds for batch {op} on {self._id}")
+                entries.append((-money.minor, op))
+            else:
+                raise InvalidOperationError(f"Unknown batch operation: {op}")
+        return entries
+
+    def _commit_batch(self, entries: List[Tuple[int, str]], ts_us: int) -> None:
+        # Validated entries only: append them in bulk, set the balance once, stamp once.
+        append, hook = self._ledger.append_raw, self._on_change
+        total = 0
+        for minor, description in entries:
+            append(minor, ts_us, description)
+            total += minor
+            if hook is not None:
+                hook(self, minor)
+        self._balance = _from_minor(self._balance.minor + total, self._balance.currency)
+        if entries and isinstance(self, Auditable):
+            self._updated_us = ts_us
+
+    def apply_batch(self, ops: Iterable[Tuple[str, Money]]) -> None:
+        """Apply ("deposit" | "withdraw", Money) operations all-or-nothing.
+
+        The whole batch is validated first (positivity, currency, funds at every
+        step); nothing is written unless every operation passes. Entries share
+        one timestamp.
+        """
+        entries = self._validate_batch(ops)
+        self._commit_batch(entries, time.time_ns() // 1000)
+
+    def transfer(self, to: "Account", money: Money, credit: Optional[Money] = None) -> None:
+        """Withdraw ``money`` here and deposit it into ``to``.
+
+        ``credit`` is what ``to`` receives when it differs from ``money``
+        (e.g. the FX-converted amount for an account in another currency).
+        """
         if to is self:
             raise InvalidOperationError("Cannot transfer to the same account")
         # Withdraw first; if it fails, nothing is changed.
         self.withdraw(money)
         try:
-            to.deposit(money)
+            to.deposit(money if credit is None else credit)
         except Exception as e:
             # rollback to maintain atomicity
             self.deposit(money)
@@ -81,13 +182,17 @@ class Account(ABC):
         return f"<{self.__class__.__name__} id={self._id} owner={self._owner} balance={self._balance}>"
 
 class InterestBearingAccount(Account, ABC):
+    __slots__ = ()
+
     @abstractmethod
     def apply_interest(self) -> None:
         ...
 
 class SavingsAccount(InterestBearingAccount, JSONSerializable, Auditable):
+    __slots__ = ("interest_rate", "_created_us", "_updated_us")
+
     def __init__(self, id: str, owner: str, opening_balance: Money, interest_rate: float):
-        self.interest_rate = Decimal(str(interest_rate))  # ensure Decimal, not float
+        self.interest_rate = intern_rate(interest_rate)  # ensure Decimal, not float; shared per rate
         super().__init__(id, owner, opening_balance)
         Auditable.__init__(self)
 
@@ -95,15 +200,15 @@ class SavingsAccount(InterestBearingAccount, JSONSerializable, Auditable):
         return "savings"
 
     def apply_interest(self) -> None:
-        # monthly pro-rated interest as Decimal
-        monthly_rate = (self.interest_rate / Decimal("12")) / Decimal("100")
-        inc = Money(self.balance.amount * monthly_rate, self.balance.currency)
-        if inc.amount > 0:
-            self._balance = self._balance + inc
-            self._append_txn(inc, "interest")
+        # monthly pro-rated interest, exact rational maths rounded half-up to minor units
+        inc = monthly_interest_minor(self._balance.minor, self.interest_rate)
+        if inc > 0:
+            self._post(_from_minor(inc, self._balance.currency), "interest")
             self._touch()
 
-class CheckingAccount(Account):
+class CheckingAccount(Account, JSONSerializable):
+    __slots__ = ("overdraft_limit",)
+
     def __init__(self, id: str, owner: str, opening_balance: Money, overdraft_limit: Money):
         self.overdraft_limit = overdraft_limit
         super().__init__(id, owner, opening_balance)
@@ -111,13 +216,15 @@ class CheckingAccount(Account):
     def account_type(self) -> str:
         return "checking"
 
+    def _floor_minor(self) -> int:
+        return -self.overdraft_limit.minor
+
     def withdraw(self, money: Money) -> None:
-        if money.amount <= 0:
+        if money.minor <= 0:
             raise InvalidOperationError("Withdraw amount must be positive")
         if money.currency != self.balance.currency:
             raise CurrencyMismatchError("Currency mismatch in withdraw")
-        projected = self.balance.amount - money.amount
-        if projected < -self.overdraft_limit.amount:
+        projected = self.balance.minor - money.minor
+        if projected < -self.overdraft_limit.minor:
             raise InsufficientFundsError("Overdraft limit exceeded")
-        self._balance = self._balance - money
-        self._append_txn(Money(-money.amount, money.currency), "withdraw")
+        self._post(-money, "withdraw")
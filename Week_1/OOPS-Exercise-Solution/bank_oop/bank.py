@@ -1,24 +1,116 @@
 from __future__ import annotations
-from typing import Dict
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from .accounts import Account
+from .fx import RateTable
 from .money import Money
-from .exceptions import AccountNotFoundError, InvalidOperationError, CurrencyMismatchError
+from .utils import stable_bucket
+from .exceptions import (BankError, AccountNotFoundError, InvalidOperationError, CurrencyMismatchError,
+                         InconsistentStateError, ExchangeRateError)
 
 class Bank:
-    def __init__(self, currency: str = "INR"):
+    def __init__(self, currency: str = "INR", consistency_check: bool = False,
+                 concurrent: bool = False, lock_stripes: int = 64, fx: Optional[RateTable] = None):
         self._accounts: Dict[str, Account] = {}
+        # Reporting currency; with an ``fx`` RateTable, accounts may also be held
+        # in any currency the table has a rate for.
         self._currency = currency
+        self._fx = fx
+        # Running aggregates in minor units, per currency, kept current by Account._on_change.
+        self._totals: Dict[str, int] = {}
+        self._type_totals: Dict[Tuple[str, str], int] = {}  # (account type, currency) -> minor
+        # When True, total_assets() recomputes from scratch and verifies the running totals.
+        self.consistency_check = consistency_check
+        # Concurrent mode: accounts map onto a fixed set of striped locks; the
+        # running totals get their own small lock.
+        self._stripes: Optional[List[threading.Lock]] = (
+            [threading.Lock() for _ in range(lock_stripes)] if concurrent else None
+        )
+        self._totals_lock = threading.Lock() if concurrent else nullcontext()
+        # Optional EventJournal (see persistence.BankStore); records every open and posting.
+        self._journal = None
 
     @classmethod
     def create_default(cls) -> "Bank":
         return cls()
 
+    def accepts_currency(self, currency: str) -> bool:
+        return currency == self._currency or (self._fx is not None and currency in self._fx)
+
     def add_account(self, account: Account) -> None:
         if account.id in self._accounts:
             raise InvalidOperationError(f"Duplicate account id: {account.id}")
-        if account.balance.currency != self._currency:
+        if not self.accepts_currency(account.balance.currency):
             raise CurrencyMismatchError("Bank currency mismatch with account")
         self._accounts[account.id] = account
+        account._on_change = self._on_balance_change
+        with self._totals_lock:
+            self._apply_delta(account, account.balance.minor)
+            if self._journal is not None:
+                self._journal.record_open(account)
+
+    def add_accounts(self, accounts: Iterable[Account]) -> int:
+        """Add many accounts: one validation pass, then a single insert and totals update.
+
+        All-or-nothing: if any account is a duplicate or in the wrong currency,
+        none are added. Returns the number of accounts added.
+        """
+        staged: Dict[str, Account] = {}
+        for account in accounts:
+            if account.id in self._accounts or account.id in staged:
+                raise InvalidOperationError(f"Duplicate account id: {account.id}")
+            if not self.accepts_currency(account.balance.currency):
+                raise CurrencyMismatchError("Bank currency mismatch with account")
+            staged[account.id] = account
+        with self._totals_lock:
+            for account in staged.values():
+                account._on_change = self._on_balance_change
+                self._apply_delta(account, account.balance.minor)
+                if self._journal is not None:
+                    self._journal.record_open(account)
+            self._accounts.update(staged)
+        return len(staged)
+
+    def _on_balance_change(self, account: Account, delta_minor: int) -> None:
+        with self._totals_lock:
+            self._apply_delta(account, delta_minor)
+            if self._journal is not None:
+                self._journal.record_post(account, delta_minor)
+
+    def _apply_delta(self, account: Account, delta_minor: int) -> None:
+        currency = account.balance.currency
+        self._totals[currency] = self._totals.get(currency, 0) + delta_minor
+        key = (account.account_type(), currency)
+        self._type_totals[key] = self._type_totals.get(key, 0) + delta_minor
+
+    def _stripe_ids(self, account_ids: Iterable[str]) -> List[int]:
+        # Sorted, de-duplicated stripe indices: the global lock order that prevents deadlock.
+        n = len(self._stripes)  # type: ignore[arg-type]
+        return sorted({stable_bucket(a, n) for a in account_ids})
+
+    @contextmanager
+    def _locked(self, stripe_ids: List[int]) -> Iterator[None]:
+        if self._stripes is None:
+            yield
+            return
+        locks = [self._stripes[i] for i in stripe_ids]
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def _locked_accounts(self, *account_ids: str):
+        if self._stripes is None:
+            return self._locked([])
+        return self._locked(self._stripe_ids(account_ids))
+
+    def _locked_all(self):
+        return self._locked(list(range(len(self._stripes))) if self._stripes is not None else [])
 
     def get(self, account_id: str) -> Account:
         try:
@@ -26,11 +118,138 @@ class Bank:
         except KeyError as e:
             raise AccountNotFoundError(account_id) from e
 
-    def monthly_process(self, strategy) -> None:
-        for acct in self._accounts.values():
-            if hasattr(strategy, "apply_month_end"):
-                strategy.apply_month_end(acct)
+    def deposit(self, account_id: str, money: Money) -> None:
+        acct = self.get(account_id)
+        with self._locked_accounts(account_id):
+            acct.deposit(money)
+
+    def withdraw(self, account_id: str, money: Money) -> None:
+        acct = self.get(account_id)
+        with self._locked_accounts(account_id):
+            acct.withdraw(money)
+
+    def transfer(self, from_id: str, to_id: str, money: Money) -> None:
+        """Move ``money`` between accounts; across currencies it is credited at the latest FX rate."""
+        src, dst = self.get(from_id), self.get(to_id)
+        credit = self._credit_for(dst, money)
+        with self._locked_accounts(from_id, to_id):
+            src.transfer(dst, money, credit)
+
+    def _credit_for(self, dst: Account, money: Money) -> Optional[Money]:
+        # Amount the destination receives, when it differs from what was sent.
+        if dst.balance.currency == money.currency or self._fx is None:
+            return None
+        return self._fx.convert(money, dst.balance.currency)
+
+    def transfer_many(self, ops: Iterable[Tuple[str, str, Money]]) -> List[Optional[Exception]]:
+        """Apply many (from_id, to_id, money) transfers.
+
+        Consecutive operations that need the same set of locks run under a single
+        acquisition. Operations are always applied in the given order, so the
+        outcome does not depend on how accounts map to lock stripes. Returns one
+        entry per operation: None on success, or the exception it raised.
+        """
+        ops = list(ops)
+        results: List[Optional[Exception]] = [None] * len(ops)
+        runs: List[Tuple[Tuple[int, ...], List[int]]] = []
+        for i, (from_id, to_id, _) in enumerate(ops):
+            key = tuple(self._stripe_ids((from_id, to_id))) if self._stripes is not None else ()
+            if runs and runs[-1][0] == key:
+                runs[-1][1].append(i)
+            else:
+                runs.append((key, [i]))
+        for key, indices in runs:
+            with self._locked(list(key)):
+                for i in indices:
+                    from_id, to_id, money = ops[i]
+                    try:
+                        dst = self.get(to_id)
+                        self.get(from_id).transfer(dst, money, self._credit_for(dst, money))
+                    except BankError as e:
+                        results[i] = e
+        return results
+
+    def apply_batch(self, ops: Iterable[Tuple[str, str, Money]]) -> int:
+        """Apply (op, account_id, money) deposits/withdrawals all-or-nothing.
+
+        Every account's operations are validated first (in batch order, against
+        its running balance); only if all pass are the entries written, with one
+        shared timestamp. A transfer is a withdraw/deposit pair in the same batch.
+        Returns the number of operations applied.
+        """
+        by_account: Dict[str, List[Tuple[str, Money]]] = {}
+        for op, account_id, money in ops:
+            by_account.setdefault(account_id, []).append((op, money))
+        accounts = [self.get(account_id) for account_id in by_account]
+        with self._locked_accounts(*by_account):
+            staged = [(acct, acct._validate_batch(by_account[acct.id])) for acct in accounts]
+            ts_us = time.time_ns() // 1000
+            for acct, entries in staged:
+                acct._commit_batch(entries, ts_us)
+        return sum(len(entries) for _, entries in staged)
+
+    def monthly_process(self, strategy, workers: int = 1) -> None:
+        """Run month-end for every account.
+
+        With ``workers > 1`` and a strategy that supports sharded computation
+        (``month_end_rows``/``compute_month_end``), the work is spread over a
+        process pool; otherwise it runs in this process. In concurrent mode all
+        account locks are held for the duration.
+        """
+        with self._locked_all():
+            if workers > 1 and hasattr(strategy, "compute_month_end"):
+                from .parallel import monthly_process_parallel
+                monthly_process_parallel(self._accounts, strategy, workers)
+                return
+            if hasattr(strategy, "apply_month_end_batch"):
+                strategy.apply_month_end_batch(self._accounts.values())
+                return
+            for acct in self._accounts.values():
+                if hasattr(strategy, "apply_month_end"):
+                    strategy.apply_month_end(acct)
+
+    def _sum_in(self, totals: Dict[str, int], currency: str) -> Money:
+        # Single-currency fast path; otherwise one precomputed cross rate per currency, rounded once.
+        if not totals:
+            return Money.from_minor(0, currency)
+        if len(totals) == 1 and currency in totals:
+            return Money.from_minor(totals[currency], currency)
+        if self._fx is None:
+            raise ExchangeRateError(f"No FX rate table to convert totals into {currency}")
+        return Money.from_minor(self._fx.latest().sum_minor(totals, currency), currency)
+
+    def total_assets(self, in_currency: Optional[str] = None) -> Money:
+        if self.consistency_check:
+            with self._locked_all():
+                self.verify_totals()
+        return self._sum_in(self._totals, in_currency or self._currency)
+
+    def assets_by_type(self, in_currency: Optional[str] = None) -> Dict[str, Money]:
+        grouped: Dict[str, Dict[str, int]] = {}
+        for (kind, currency), minor in self._type_totals.items():
+            grouped.setdefault(kind, {})[currency] = minor
+        target = in_currency or self._currency
+        return {kind: self._sum_in(totals, target) for kind, totals in grouped.items()}
+
+    def _recompute(self):
+        totals: Dict[str, int] = {}
+        by_type: Dict[Tuple[str, str], int] = {}
+        for a in self._accounts.values():
+            minor, currency = a.balance.minor, a.balance.currency
+            totals[currency] = totals.get(currency, 0) + minor
+            key = (a.account_type(), currency)
+            by_type[key] = by_type.get(key, 0) + minor
+        return totals, by_type
+
+    def verify_totals(self) -> None:
+        """Recompute totals from every account and raise if the running totals drifted."""
+        totals, by_type = self._recompute()
+        if totals != self._totals or by_type != self._type_totals:
+            raise InconsistentStateError(
+                f"running totals {self._totals} != recomputed {totals} (by type {self._type_totals} vs {by_type})"
+            )
 
-    def total_assets(self) -> Money:
-        total = sum((a.balance.amount for a in self._accounts.values()), start=Money(0, self._currency).amount)
-        return Money(total, self._currency)
+    def recompute_totals(self) -> Money:
+        """Rebuild the running totals from scratch (e.g. after mutating accounts outside the Bank)."""
+        self._totals, self._type_totals = self._recompute()
+        return self._sum_in(self._totals, self._currency)
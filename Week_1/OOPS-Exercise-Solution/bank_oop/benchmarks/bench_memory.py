@@ -0,0 +1,50 @@
+"""Memory benchmark: bytes per account, slotted hierarchy vs. the previous dict-based layout.
+
+Run with:
+    python -m bank_oop.benchmarks.bench_memory [N]
+"""
+from __future__ import annotations
+import sys
+import tracemalloc
+from datetime import datetime
+from decimal import Decimal
+
+from ..money import Money
+from ..ledger import ColumnarLedger
+from ..accounts import SavingsAccount
+
+class LegacySavingsAccount:
+    """Attribute layout of the original SavingsAccount (instance __dict__,
+    datetime audit stamps, a Decimal rate per account), kept only as a baseline."""
+
+    def __init__(self, id: str, owner: str, opening_balance: Money, interest_rate: float):
+        self.interest_rate = Decimal(str(interest_rate))
+        self._id = id
+        self._owner = owner
+        self._balance = opening_balance
+        self._ledger = ColumnarLedger(opening_balance.currency)
+        self._ledger.append_raw(opening_balance.minor, 0, "opening_balance")
+        self.created_at = datetime.utcnow()
+        self.updated_at = self.created_at
+        self._on_change = None
+
+def bytes_per_account(cls, n: int) -> float:
+    opening = Money(Decimal("100.00"))
+    ids = [f"S{i}" for i in range(n)]  # ids/owner strings are shared by both layouts; not measured
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    accounts = [cls(i, "owner", opening, interest_rate=6.5) for i in ids]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del accounts
+    return (after - before) / n
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    legacy = bytes_per_account(LegacySavingsAccount, n)
+    slotted = bytes_per_account(SavingsAccount, n)
+    print(f"{n} savings accounts: dict-based {legacy:.0f} B/account, slotted {slotted:.0f} B/account "
+          f"({(1 - slotted / legacy) * 100:.0f}% less)")
+
+if __name__ == "__main__":
+    main()
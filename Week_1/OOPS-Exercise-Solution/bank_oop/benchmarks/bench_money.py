@@ -0,0 +1,114 @@
+"""Micro-benchmark: integer minor-unit Money vs. the previous Decimal dataclass.
+
+Run with:
+    python -m bank_oop.benchmarks.bench_money
+"""
+from __future__ import annotations
+import timeit
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import List
+
+from ..money import Money
+from ..utils import quantize_2
+from ..accounts import SavingsAccount, CheckingAccount
+from ..transactions import Transaction
+
+@dataclass(frozen=True, slots=True)
+class DecimalMoney:
+    """The original Decimal-backed Money, kept here only as a baseline."""
+    amount: Decimal
+    currency: str = "INR"
+
+    def __post_init__(self):
+        if not isinstance(self.amount, Decimal):
+            object.__setattr__(self, "amount", Decimal(str(self.amount)))
+        object.__setattr__(self, "amount", quantize_2(self.amount))
+
+    def __add__(self, other: "DecimalMoney") -> "DecimalMoney":
+        return DecimalMoney(self.amount + other.amount, self.currency)
+
+    def __sub__(self, other: "DecimalMoney") -> "DecimalMoney":
+        return DecimalMoney(self.amount - other.amount, self.currency)
+
+    def __lt__(self, other: "DecimalMoney") -> bool:
+        return self.amount < other.amount
+
+class DecimalAccount:
+    """The original account operations over DecimalMoney and a list ledger, kept only as a baseline.
+
+    ``overdraft`` > 0 behaves like the old CheckingAccount; ``audited`` adds the
+    old Auditable ``_touch`` on deposits/withdrawals, as SavingsAccount had.
+    """
+
+    def __init__(self, balance: DecimalMoney, overdraft: Decimal = Decimal("0"), audited: bool = False):
+        self._balance = balance
+        self.overdraft = overdraft
+        self.audited = audited
+        self.updated_at = datetime.utcnow()
+        self._ledger: List[Transaction] = [Transaction(balance, datetime.utcnow(), "opening_balance")]
+
+    def _append_txn(self, amount: DecimalMoney, description: str) -> None:
+        self._ledger.append(Transaction(amount, datetime.utcnow(), description))  # type: ignore[arg-type]
+        if self.audited:
+            self.updated_at = datetime.utcnow()
+
+    def deposit(self, money: DecimalMoney) -> None:
+        if money.amount <= 0 or money.currency != self._balance.currency:
+            raise ValueError("bad deposit")
+        self._balance = self._balance + money
+        self._append_txn(money, "deposit")
+
+    def withdraw(self, money: DecimalMoney) -> None:
+        if money.amount <= 0 or money.currency != self._balance.currency:
+            raise ValueError("bad withdraw")
+        if self._balance.amount - money.amount < -self.overdraft:
+            raise ValueError("Insufficient funds")
+        self._balance = self._balance - money
+        self._append_txn(DecimalMoney(-money.amount, money.currency), "withdraw")
+
+    def transfer(self, to: "DecimalAccount", money: DecimalMoney) -> None:
+        self.withdraw(money)
+        try:
+            to.deposit(money)
+        except Exception:
+            self.deposit(money)
+            raise
+
+N = 100_000
+
+def _arith(cls) -> None:
+    bal = cls(Decimal("1000.00"))
+    step = cls(Decimal("1.25"))
+    for _ in range(N):
+        bal = bal + step
+        bal = bal - step
+        _ = bal < step
+
+def _accounts(legacy: bool = False) -> None:
+    if legacy:
+        a = DecimalAccount(DecimalMoney(Decimal("1000.00")), audited=True)
+        b = DecimalAccount(DecimalMoney(Decimal("1000.00")), overdraft=Decimal("50.00"))
+        amt = DecimalMoney(Decimal("1.25"))
+    else:
+        a = SavingsAccount("S1", "Asha", Money(Decimal("1000.00")), interest_rate=6.0)
+        b = CheckingAccount("C1", "Raj", Money(Decimal("1000.00")), overdraft_limit=Money(Decimal("50.00")))
+        amt = Money(Decimal("1.25"))
+    for _ in range(N // 10):
+        a.deposit(amt)
+        a.withdraw(amt)
+        a.transfer(b, amt)
+        b.transfer(a, amt)
+
+def main() -> None:
+    dec = min(timeit.repeat(lambda: _arith(DecimalMoney), number=1, repeat=3))
+    mnr = min(timeit.repeat(lambda: _arith(Money), number=1, repeat=3))
+    print(f"add/sub/compare x{N}: Decimal {dec:.3f}s, minor units {mnr:.3f}s, speedup {dec / mnr:.1f}x")
+    old = min(timeit.repeat(lambda: _accounts(legacy=True), number=1, repeat=3))
+    acc = min(timeit.repeat(_accounts, number=1, repeat=3))
+    print(f"deposit/withdraw/transfer x{N // 10}: Decimal {old:.3f}s, minor units {acc:.3f}s, "
+          f"speedup {old / acc:.1f}x ({acc / (N // 10) * 1e6:.1f} us per loop)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Benchmark suite: time and peak memory of the main bank_oop paths at a given scale.
+
+Run with:
+    python -m bank_oop.benchmarks.suite --scale 10k --out results.json
+    python -m bank_oop.benchmarks.suite --scale 10k --baseline bank_oop/benchmarks/baseline_10k.json
+
+Each timed run builds a fresh fixture untimed; scenarios are run round-robin
+and the best wall time of ``--repeat`` runs is reported. Each then runs once
+more under ``tracemalloc`` for peak memory
+(tracing slows the code, so the two are measured separately; ``--no-memory``
+skips that run). With ``--baseline`` the results are compared against a
+stored run and the exit status is 1 if any scenario is slower than
+``--threshold`` times its baseline by more than ``NOISE_FLOOR`` seconds.
+
+The defaults were measured: across 20 back-to-back runs of unchanged code at
+10k accounts on a shared machine, a scenario's best-of-5 time varied by up to
+1.8x (total_assets), and by up to 2x but under 10 ms for the ~10 ms ones.
+"""
+from __future__ import annotations
+import argparse
+import gc
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Tuple
+
+from ..bank import Bank
+from ..money import Money
+from ..accounts import SavingsAccount, CheckingAccount
+from ..strategies import SimpleInterestStrategy
+from ..serialization import dump_ndjson
+
+SCALES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+NOISE_FLOOR = 0.01  # seconds; smaller slowdowns are run-to-run noise
+THRESHOLD = 2.0
+REPEAT = 5
+
+def _bank(n: int) -> Bank:
+    bank = Bank()
+    overdraft = Money(Decimal("50.00"))
+    bank.add_accounts(
+        SavingsAccount(f"S{i}", "owner", Money(Decimal("1000.00")), interest_rate=6.0) if i % 2 == 0
+        else CheckingAccount(f"C{i}", "owner", Money(Decimal("1000.00")), overdraft_limit=overdraft)
+        for i in range(n)
+    )
+    return bank
+
+# Each scenario: fixture(n) -> state, run(state) -> None
+def _money_fixture(n: int) -> Tuple[Money, Money, int]:
+    return Money(Decimal("1000.00")), Money(Decimal("1.25")), n
+
+def _money_run(state: Tuple[Money, Money, int]) -> None:
+    bal, step, n = state
+    for _ in range(n):
+        bal = bal + step
+        bal = bal - step
+        _ = bal < step
+
+def _ops_fixture(n: int) -> Tuple[Bank, List[str]]:
+    bank = _bank(n)
+    return bank, list(bank._accounts)
+
+def _ops_run(state: Tuple[Bank, List[str]]) -> None:
+    bank, ids = state
+    amt = Money(Decimal("1.25"))
+    for i, a in enumerate(ids):
+        b = ids[i - 1]
+        bank.deposit(a, amt)
+        bank.withdraw(a, amt)
+        bank.transfer(a, b, amt)
+
+def _monthly_run(bank: Bank) -> None:
+    bank.monthly_process(SimpleInterestStrategy())
+
+def _total_run(bank: Bank) -> None:
+    # running totals are O(1); the full recomputation/verification is what scales
+    for _ in range(10):
+        bank.total_assets()
+        bank.verify_totals()
+
+def _serialize_run(bank: Bank) -> None:
+    dump_ndjson(bank._accounts.values(), io.StringIO())
+
+SCENARIOS: Dict[str, Tuple[Callable[[int], Any], Callable[[Any], None]]] = {
+    "money_arithmetic": (_money_fixture, _money_run),
+    "deposit_withdraw_transfer": (_ops_fixture, _ops_run),
+    "monthly_process": (_bank, _monthly_run),
+    "total_assets": (_bank, _total_run),
+    "serialize_ndjson": (_bank, _serialize_run),
+}
+
+def time_scenario(name: str, n: int) -> float:
+    """Wall time of one run on a fresh fixture.
+
+    Runs mutate their state (ledgers grow, interest compounds), so every timed
+    run builds its own fixture and measures the same work.
+    """
+    fixture, run = SCENARIOS[name]
+    state = fixture(n)
+    gc.collect()
+    gc.disable()  # as timeit does: collector pauses are noise, not the code under test
+    try:
+        start = time.perf_counter()
+        run(state)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+def peak_memory(name: str, n: int) -> int:
+    fixture, run = SCENARIOS[name]
+    state = fixture(n)
+    tracemalloc.start()
+    try:
+        run(state)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run_suite(n: int, names: List[str], memory: bool = True, repeat: int = REPEAT) -> Dict[str, Any]:
+    # Round-robin over the scenarios so a burst of load on the machine costs
+    # every scenario one slow run instead of all the runs of one scenario.
+    best = {name: float("inf") for name in names}
+    for _ in range(repeat):
+        for name in names:
+            best[name] = min(best[name], time_scenario(name, n))
+    results: Dict[str, Dict[str, Any]] = {}
+    for name in names:
+        results[name] = {"seconds": round(best[name], 6)}
+        if memory:
+            results[name]["peak_bytes"] = peak_memory(name, n)
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "accounts": n,
+        "results": results,
+    }
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Human-readable comparison lines; lines for regressions start with 'REGRESSION'."""
+    lines = []
+    if current["accounts"] != baseline["accounts"]:
+        lines.append(f"note: baseline has {baseline['accounts']} accounts, this run {current['accounts']}")
+    for name, cur in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            lines.append(f"{name}: no baseline")
+            continue
+        ratio = cur["seconds"] / base["seconds"] if base["seconds"] else float("inf")
+        slower = cur["seconds"] - base["seconds"]
+        tag = "REGRESSION" if ratio > threshold and slower > NOISE_FLOOR else "ok"
+        line = f"{tag} {name}: {cur['seconds']:.3f}s vs {base['seconds']:.3f}s ({ratio:.2f}x)"
+        if "peak_bytes" in cur and "peak_bytes" in base:
+            line += f", peak {cur['peak_bytes'] / 2**20:.1f} MiB vs {base['peak_bytes'] / 2**20:.1f} MiB"
+        lines.append(line)
+    return lines
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="10k")
+    parser.add_argument("--only", nargs="*", choices=sorted(SCENARIOS), help="run a subset of scenarios")
+    parser.add_argument("--out", help="write JSON results to this file")
+    parser.add_argument("--baseline", help="compare against a stored JSON result")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="slowdown ratio counted as a regression")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timed runs per scenario (best is kept)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory run")
+    args = parser.parse_args(argv)
+
+    report = run_suite(SCALES[args.scale], args.only or list(SCENARIOS), memory=not args.no_memory, repeat=args.repeat)
+    for name, r in report["results"].items():
+        peak = f", peak {r['peak_bytes'] / 2**20:.1f} MiB" if "peak_bytes" in r else ""
+        print(f"{name:<28}{r['seconds']:>10.3f}s{peak}")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            lines = compare(report, json.load(fh), args.threshold)
+        print("\n".join(lines))
+        if any(line.startswith("REGRESSION") for line in lines):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Streaming bulk import/export of accounts and ledgers.
+
+CSV (accounts only)::
+
+    type,id,owner,currency,balance,params
+    savings,S1,Asha,INR,100.00,6.5
+    checking,C1,Raj,INR,50.00,20.00
+
+``params`` is the interest rate (savings) or overdraft limit (checking).
+Balances must be allowed for the account type (no negative savings, checking
+no lower than minus its overdraft limit); any bad row fails the whole load
+with an error naming its line.
+
+The binary format (``serialization.dump_binary``) also carries full ledgers
+and is what ``export_binary`` writes; both directions stream one account at a time.
+"""
+from __future__ import annotations
+import csv
+from decimal import Decimal
+from typing import BinaryIO, Iterator, List, Optional, Set, TextIO
+
+from .accounts import Account, CheckingAccount
+from .bank import Bank
+from .ledger import description_of
+from .money import Money
+from .persistence import account_params, build_account
+from . import serialization
+from .exceptions import BankError, CurrencyMismatchError, InvalidOperationError
+
+CSV_HEADER = ["type", "id", "owner", "currency", "balance", "params"]
+
+# ---- CSV --------------------------------------------------------------------
+
+def _csv_account(row: List[str], bank: Bank, seen: Set[str]) -> Account:
+    if len(row) != len(CSV_HEADER):
+        raise InvalidOperationError(f"expected {len(CSV_HEADER)} fields, got {len(row)}")
+    kind, account_id, owner, currency, balance, params = row
+    # Validate before building any objects
+    if not bank.accepts_currency(currency):
+        raise CurrencyMismatchError(f"currency {currency} not accepted by the bank")
+    if account_id in seen or account_id in bank._accounts:
+        raise InvalidOperationError(f"duplicate account id {account_id}")
+    try:
+        balance_minor = Money(Decimal(balance), currency).minor
+        if kind == "checking":
+            params = Money(Decimal(params), currency).minor  # type: ignore[assignment]
+        acct = build_account(kind, account_id, owner, currency, balance_minor, params)
+    except (ArithmeticError, ValueError) as e:  # decimal.InvalidOperation is an ArithmeticError
+        raise InvalidOperationError(f"invalid amount in balance {balance!r} or params {params!r}") from e
+    seen.add(account_id)
+    return acct
+
+def _iter_csv_accounts(fh: TextIO, bank: Bank) -> Iterator[Account]:
+    seen: Set[str] = set()
+    reader = csv.reader(fh)
+    header = next(reader, None)
+    if header != CSV_HEADER:
+        raise InvalidOperationError(f"Expected CSV header {CSV_HEADER}, got {header}")
+    for line_no, row in enumerate(reader, start=2):
+        # Every failure reports the offending line, keeping its exception type
+        try:
+            acct = _csv_account(row, bank, seen)
+        except BankError as e:
+            raise type(e)(f"line {line_no}: {e}") from e
+        yield acct
+
+def load_csv(fh: TextIO, bank: Bank) -> int:
+    """Stream accounts from CSV into ``bank`` (all-or-nothing); returns the number loaded."""
+    return bank.add_accounts(_iter_csv_accounts(fh, bank))
+
+def export_csv(bank: Bank, accounts_fh: TextIO, ledger_fh: Optional[TextIO] = None) -> int:
+    """Stream accounts (and optionally ledger rows) to CSV without building Transaction objects.
+
+    Ledger rows are ``account_id,ts_us,amount,description``.
+    """
+    writer = csv.writer(accounts_fh)
+    writer.writerow(CSV_HEADER)
+    ledger_writer = csv.writer(ledger_fh) if ledger_fh is not None else None
+    if ledger_writer is not None:
+        ledger_writer.writerow(["account_id", "ts_us", "amount", "description"])
+    count = 0
+    for account in bank._accounts.values():
+        params = account_params(account)
+        if isinstance(account, CheckingAccount):
+            params = str(account.overdraft_limit.amount)
+        writer.writerow([account.account_type(), account.id, account.owner,
+                         account.balance.currency, str(account.balance.amount), params])
+        if ledger_writer is not None:
+            ledger = account.ledger
+            cur = ledger.currency
+            ledger_writer.writerows(
+                (account.id, ts, Money.from_minor(m, cur).amount, description_of(c))
+                for m, ts, c in zip(ledger.amounts, ledger.timestamps, ledger.codes)
+            )
+        count += 1
+    return count
+
+# ---- binary -----------------------------------------------------------------
+# The stream format is ``serialization.dump_binary``'s: accounts as length-prefixed
+# records with their ledgers as raw int64 columns.
+
+def export_binary(bank: Bank, fh: BinaryIO) -> int:
+    """Stream every account with its full ledger to ``fh``; returns the number written."""
+    return serialization.dump_binary(bank._accounts.values(), fh)
+
+def _iter_binary_accounts(fh: BinaryIO, bank: Bank) -> Iterator[Account]:
+    seen: Set[str] = set()
+    for acct in serialization.load_binary(fh):
+        if not isinstance(acct, Account):
+            raise InvalidOperationError(f"Expected an account record, got {type(acct).__name__}")
+        currency = acct.balance.currency
+        if not bank.accepts_currency(currency):
+            raise CurrencyMismatchError(f"account {acct.id}: currency {currency} not accepted by the bank")
+        if acct.id in seen or acct.id in bank._accounts:
+            raise InvalidOperationError(f"duplicate account id {acct.id}")
+        seen.add(acct.id)
+        yield acct
+
+def load_binary(fh: BinaryIO, bank: Bank) -> int:
+    """Stream accounts and ledgers written by ``export_binary`` into ``bank`` (all-or-nothing)."""
+    return bank.add_accounts(_iter_binary_accounts(fh, bank))
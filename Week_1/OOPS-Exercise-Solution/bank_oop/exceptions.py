@@ -12,3 +12,9 @@ class AccountNotFoundError(BankError):
 
 class InvalidOperationError(BankError):
     pass
+
+class InconsistentStateError(BankError):
+    """Running aggregates disagree with a full recomputation."""
+
+class ExchangeRateError(BankError):
+    """No exchange rate is available for a currency (or at the requested time)."""
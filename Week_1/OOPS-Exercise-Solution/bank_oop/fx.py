@@ -0,0 +1,119 @@
+from __future__ import annotations
+from bisect import bisect_right
+from datetime import datetime
+from decimal import Decimal
+from math import gcd
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .ledger import to_epoch_us
+from .money import Money, _from_minor, currency_exponent
+from .utils import round_half_up_div
+from .exceptions import ExchangeRateError
+
+class FxRates:
+    """Immutable set of exchange rates against one base currency, effective from ``as_of``.
+
+    ``rates[c]`` is how many units of ``c`` one unit of ``base`` buys. Every
+    cross rate is precomputed once as an exact minor-unit -> minor-unit ratio,
+    so a conversion is a dict lookup, an integer multiply and one half-up rounding.
+    """
+    __slots__ = ("base", "as_of", "rates", "_cross")
+
+    def __init__(self, base: str, rates: Mapping[str, Any], as_of: datetime):
+        self.base = base
+        self.as_of = as_of
+        self.rates: Dict[str, Decimal] = {base: Decimal(1)}
+        for currency, rate in rates.items():
+            rate = rate if isinstance(rate, Decimal) else Decimal(str(rate))
+            if rate <= 0:
+                raise ExchangeRateError(f"Rate for {currency} must be positive, got {rate}")
+            self.rates[currency] = rate
+        # (src, dst) -> (num, den): dst_minor = src_minor * num / den
+        ratios = {c: r.as_integer_ratio() for c, r in self.rates.items()}
+        self._cross: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        for src, (sn, sd) in ratios.items():
+            for dst, (dn, dd) in ratios.items():
+                num = dn * sd * 10 ** currency_exponent(dst)
+                den = dd * sn * 10 ** currency_exponent(src)
+                g = gcd(num, den)
+                self._cross[(src, dst)] = (num // g, den // g)
+
+    def __contains__(self, currency: str) -> bool:
+        return currency in self.rates
+
+    def cross(self, src: str, dst: str) -> Tuple[int, int]:
+        try:
+            return self._cross[(src, dst)]
+        except KeyError:
+            missing = src if src not in self.rates else dst
+            raise ExchangeRateError(f"No rate for {missing} (rates as of {self.as_of})") from None
+
+    def convert_minor(self, minor: int, src: str, dst: str) -> int:
+        if src == dst:
+            return minor
+        num, den = self.cross(src, dst)
+        return round_half_up_div(minor * num, den)
+
+    def convert(self, money: Money, currency: str) -> Money:
+        if money.currency == currency:
+            return money
+        return _from_minor(self.convert_minor(money.minor, money.currency, currency), currency)
+
+    def sum_minor(self, totals: Mapping[str, int], currency: str) -> int:
+        """Convert per-currency minor totals into ``currency`` and add them, rounding once."""
+        n, d = 0, 1
+        for src, minor in totals.items():
+            num, den = self.cross(src, currency)
+            n, d = n * den + minor * num * d, d * den
+        return round_half_up_div(n, d)
+
+    def __repr__(self) -> str:
+        return f"<FxRates base={self.base} as_of={self.as_of} currencies={len(self.rates)}>"
+
+class RateTable:
+    """In-memory FX rate history, one ``FxRates`` version per update timestamp.
+
+        fx = RateTable(base="USD")
+        fx.update({"INR": "83.10", "EUR": "0.92"})
+        Money(10, "USD").convert_to("INR", fx)    # latest rates
+        fx.at(some_datetime).convert(m, "EUR")      # rates in force at that time
+    """
+
+    def __init__(self, base: str = "USD"):
+        self.base = base
+        self._versions: List[FxRates] = []
+        self._stamps: List[int] = []  # epoch µs of each version, ascending
+
+    def update(self, rates: Mapping[str, Any], as_of: Optional[datetime] = None) -> FxRates:
+        """Publish a new version of the rates (times must not go backwards)."""
+        as_of = as_of or datetime.utcnow()
+        stamp = to_epoch_us(as_of)
+        if self._stamps and stamp < self._stamps[-1]:
+            raise ExchangeRateError(f"Rates as of {as_of} are older than the latest version")
+        version = FxRates(self.base, rates, as_of)
+        self._versions.append(version)
+        self._stamps.append(stamp)
+        return version
+
+    def latest(self) -> FxRates:
+        if not self._versions:
+            raise ExchangeRateError("Rate table is empty")
+        return self._versions[-1]
+
+    def at(self, ts: datetime) -> FxRates:
+        """The version in force at ``ts``."""
+        i = bisect_right(self._stamps, to_epoch_us(ts))
+        if i == 0:
+            raise ExchangeRateError(f"No rates as of {ts}")
+        return self._versions[i - 1]
+
+    def __contains__(self, currency: str) -> bool:
+        return bool(self._versions) and currency in self._versions[-1]
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def convert(self, money: Money, currency: str) -> Money:
+        if money.currency == currency:
+            return money
+        return self.latest().convert(money, currency)
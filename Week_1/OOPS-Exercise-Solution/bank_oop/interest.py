@@ -0,0 +1,79 @@
+from __future__ import annotations
+import time
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .utils import round_half_up_div as _round_half_up
+
+try:  # optional: vectorised path
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+CHUNK_SIZE = 65_536
+_INT64_SAFE = 2 ** 62
+
+def _monthly_ratio(annual_rate_pct: Decimal) -> Tuple[int, int]:
+    """Exact monthly rate as numerator/denominator: rate% / 12 / 100."""
+    num, den = annual_rate_pct.as_integer_ratio()
+    return num, den * 1200
+
+def monthly_interest_minor(balance_minor: int, annual_rate_pct: Decimal) -> int:
+    """One month of interest in minor units, rounded half-up from the exact value."""
+    num, den = _monthly_ratio(annual_rate_pct)
+    return _round_half_up(balance_minor * num, den)
+
+def _interest_chunk(balances: Sequence[int], num: int, den: int) -> List[int]:
+    if np is not None and balances:
+        arr = np.asarray(balances, dtype=np.int64)
+        peak = int(np.abs(arr).max())
+        if peak * 2 * max(abs(num), 1) + den < _INT64_SAFE:
+            n = arr * num
+            # half-up for both signs: sign(n) * ((2|n| + d) // 2d)
+            out = np.sign(n) * ((2 * np.abs(n) + den) // (2 * den))
+            return out.tolist()
+    return [_round_half_up(b * num, den) for b in balances]
+
+def compute_interest(balances: Sequence[int], annual_rate_pct: Decimal) -> List[int]:
+    """Monthly interest for many balances sharing one rate, in exact integer maths.
+
+    Uses NumPy int64 when installed and the values cannot overflow; otherwise
+    plain Python ints, processed in chunks of CHUNK_SIZE.
+    """
+    num, den = _monthly_ratio(annual_rate_pct)
+    out: List[int] = []
+    for start in range(0, len(balances), CHUNK_SIZE):
+        out.extend(_interest_chunk(balances[start:start + CHUNK_SIZE], num, den))
+    return out
+
+def interest_deltas(rows: Iterable[Tuple[str, int, Decimal]]) -> List[Tuple[str, int]]:
+    """Rows of (account_id, balance_minor, annual_rate_pct) -> (account_id, interest_minor) for credits > 0.
+
+    Rows are grouped by rate so each group is computed in a single vectorised call.
+    Pure function of its input, so it can run in a worker process.
+    """
+    groups: Dict[Decimal, Tuple[List[str], List[int]]] = {}
+    for account_id, balance_minor, rate in rows:
+        ids, balances = groups.setdefault(rate, ([], []))
+        ids.append(account_id)
+        balances.append(balance_minor)
+    out: List[Tuple[str, int]] = []
+    for rate, (ids, balances) in groups.items():
+        out.extend((i, inc) for i, inc in zip(ids, compute_interest(balances, rate)) if inc > 0)
+    return out
+
+def post_interest(accounts: Mapping[str, Any], deltas: Iterable[Tuple[str, int]], description: str = "interest",
+                  ts_us: Optional[int] = None) -> int:
+    """Write interest credits back to their accounts with one shared timestamp; returns the count.
+
+    Pass ``ts_us`` to share one timestamp across several calls (e.g. one per shard).
+    """
+    if ts_us is None:
+        ts_us = time.time_ns() // 1000
+    credited = 0
+    for account_id, inc in deltas:
+        acct = accounts[account_id]
+        acct._post_minor(inc, description, ts_us)
+        acct._touch()
+        credited += 1
+    return credited
@@ -0,0 +1,159 @@
+from __future__ import annotations
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Union, overload
+
+from .money import _from_minor
+from .transactions import Transaction
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Descriptions are interned once per process and stored in ledgers as small int codes.
+_descriptions: List[str] = []
+_codes: Dict[str, int] = {}
+_intern_lock = threading.Lock()
+
+def description_code(description: str) -> int:
+    code = _codes.get(description)
+    if code is None:
+        # Double-checked: the lock is only taken for new descriptions, and a code
+        # is published in _codes only after its entry is in _descriptions.
+        with _intern_lock:
+            code = _codes.get(description)
+            if code is None:
+                code = len(_descriptions)
+                _descriptions.append(description)
+                _codes[description] = code
+    return code
+
+def description_of(code: int) -> str:
+    return _descriptions[code]
+
+def description_table() -> List[str]:
+    """Copy of the code -> description table (index = code)."""
+    return list(_descriptions)
+
+def to_epoch_us(ts: datetime) -> int:
+    """Naive-UTC datetime -> integer microseconds since the Unix epoch."""
+    return (ts - _EPOCH) // _MICROSECOND
+
+def from_epoch_us(us: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=us)
+
+class ColumnarLedger:
+    """Compact append-only ledger for one currency.
+
+    Amounts (minor units) and timestamps (epoch microseconds) are kept in
+    int64 ``array`` columns and descriptions as interned codes, so an entry
+    costs about 20 bytes. ``Transaction`` objects are only built when read.
+
+    Every ``CHECKPOINT_INTERVAL`` entries the running balance is saved, so the
+    balance at any point in time is one binary search on the (non-decreasing)
+    timestamp column plus a replay of at most ``CHECKPOINT_INTERVAL - 1`` amounts.
+    """
+    __slots__ = ("currency", "amounts", "timestamps", "codes", "checkpoints", "_running")
+
+    CHECKPOINT_INTERVAL = 1024
+
+    def __init__(self, currency: str):
+        self.currency = currency
+        self.amounts = array("q")
+        self.timestamps = array("q")
+        self.codes = array("I")
+        # checkpoints[j] = sum of the first (j + 1) * CHECKPOINT_INTERVAL amounts
+        self.checkpoints = array("q")
+        self._running = 0
+
+    @classmethod
+    def from_columns(cls, currency: str, amounts: array, timestamps: array, codes: array) -> "ColumnarLedger":
+        """Build a ledger from ready-made columns (bulk load / restore); checkpoints are rebuilt in one pass."""
+        if not len(amounts) == len(timestamps) == len(codes):
+            raise ValueError("ledger columns must have equal length")
+        ledger = cls(currency)
+        ledger.amounts = amounts
+        ledger.timestamps = timestamps
+        ledger.codes = codes
+        running = 0
+        interval = cls.CHECKPOINT_INTERVAL
+        for i, minor in enumerate(amounts, 1):
+            running += minor
+            if i % interval == 0:
+                ledger.checkpoints.append(running)
+        ledger._running = running
+        return ledger
+
+    def append(self, txn: Transaction) -> None:
+        if txn.amount.currency != self.currency:
+            raise ValueError(f"Ledger currency is {self.currency}, got {txn.amount.currency}")
+        self.append_raw(txn.amount.minor, to_epoch_us(txn.timestamp), txn.description)
+
+    def append_raw(self, minor: int, ts_us: int, description: str) -> None:
+        self.amounts.append(minor)
+        self.timestamps.append(ts_us)
+        self.codes.append(description_code(description))
+        self._running += minor
+        if len(self.amounts) % self.CHECKPOINT_INTERVAL == 0:
+            self.checkpoints.append(self._running)
+
+    def prefix_sum(self, count: int) -> int:
+        """Sum of the first ``count`` amounts, i.e. the balance after that many entries."""
+        j = count // self.CHECKPOINT_INTERVAL
+        base = self.checkpoints[j - 1] if j else 0
+        return base + sum(self.amounts[j * self.CHECKPOINT_INTERVAL:count])
+
+    def balance_at_us(self, ts_us: int) -> int:
+        """Balance (minor units) including every entry stamped at or before ``ts_us``."""
+        return self.prefix_sum(bisect_right(self.timestamps, ts_us))
+
+    def between_us(self, start_us: int, end_us: int) -> List[Transaction]:
+        """Entries with start_us <= timestamp <= end_us."""
+        lo = bisect_left(self.timestamps, start_us)
+        hi = bisect_right(self.timestamps, end_us)
+        return self[lo:hi]
+
+    def _make(self, i: int) -> Transaction:
+        return Transaction(
+            _from_minor(self.amounts[i], self.currency),
+            from_epoch_us(self.timestamps[i]),
+            _descriptions[self.codes[i]],
+        )
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def __iter__(self) -> Iterator[Transaction]:
+        for i in range(len(self.amounts)):
+            yield self._make(i)
+
+    @overload
+    def __getitem__(self, index: int) -> Transaction: ...
+    @overload
+    def __getitem__(self, index: slice) -> List[Transaction]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Transaction, List[Transaction]]:
+        if isinstance(index, slice):
+            return [self._make(i) for i in range(*index.indices(len(self.amounts)))]
+        n = len(self.amounts)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("ledger index out of range")
+        return self._make(index)
+
+    def __repr__(self) -> str:
+        return f"<ColumnarLedger currency={self.currency} entries={len(self)}>"
+
+def encode_ledger(ledger: ColumnarLedger) -> Dict[str, Any]:
+    """JSON-friendly columns; descriptions as a small per-ledger table, codes as indices into it."""
+    local: Dict[int, int] = {}
+    codes = [local.setdefault(c, len(local)) for c in ledger.codes]
+    return {"a": ledger.amounts.tolist(), "ts": ledger.timestamps.tolist(), "c": codes,
+            "d": [description_of(c) for c in local]}
+
+def decode_ledger(data: Dict[str, Any], currency: str) -> ColumnarLedger:
+    remap = [description_code(d) for d in data["d"]]
+    return ColumnarLedger.from_columns(currency, array("q", data["a"]), array("q", data["ts"]),
+                                       array("I", [remap[c] for c in data["c"]]))
@@ -1,32 +1,93 @@
 from __future__ import annotations
 import json
-from typing import Any, Dict, TypeVar, Type
+import time
+from typing import Any, Dict, Iterator, TypeVar, Type
 from datetime import datetime
 
+from .ledger import from_epoch_us, to_epoch_us
+from .exceptions import InvalidOperationError
+
 T = TypeVar("T")
 
+def _public_fields(obj: Any) -> Iterator[str]:
+    """Public attribute names of ``obj``: slots along the MRO, declared ``_json_fields``, then ``__dict__``."""
+    seen = set()
+    for klass in type(obj).__mro__:
+        names = list(klass.__dict__.get("__slots__", ())) + list(klass.__dict__.get("_json_fields", ()))
+        for name in names:
+            if not name.startswith("_") and name not in seen and hasattr(obj, name):
+                seen.add(name)
+                yield name
+    for name in getattr(obj, "__dict__", {}):
+        if not name.startswith("_") and name not in seen:
+            yield name
+
 class JSONSerializable:
-    """Mixin providing JSON serialization using public API."""
+    """Mixin providing JSON serialization.
+
+    Classes with a schema in ``serialization`` (Money, Transaction, the account
+    types) round-trip exactly, ledger included; others fall back to their
+    public attributes. A subclass of a class with a schema must register its
+    own (``serialization.register_serializer``) rather than lose state silently.
+    """
+    __slots__ = ()
+
     def to_json(self) -> str:
-        data = {}
+        from . import serialization
+        serializer = serialization.find_serializer(type(self))
+        if serializer is not None:
+            return json.dumps(serializer.to_dict(self), separators=(",", ":"))
+        for base in type(self).__mro__[1:]:
+            if serialization.find_serializer(base) is not None:
+                raise InvalidOperationError(
+                    f"{type(self).__name__} has no serializer of its own (its base {base.__name__} does)")
+        data: Dict[str, Any] = {}
         # naive approach: collect public attrs (no leading underscore)
-        for k, v in self.__dict__.items():
-            if not k.startswith("_"):
-                data[k] = v if isinstance(v, (int, float, str, bool, type(None))) else str(v)
+        for k in _public_fields(self):
+            v = getattr(self, k)
+            data[k] = v if isinstance(v, (int, float, str, bool, type(None))) else str(v)
         return json.dumps(data, default=str)
 
     @classmethod
     def from_json(cls: Type[T], data: str) -> T:
         obj = json.loads(data)
+        if "t" in obj:
+            from . import serialization
+            result = serialization.from_dict(obj)
+            if not isinstance(result, cls):
+                raise InvalidOperationError(f"JSON holds a {type(result).__name__}, not a {cls.__name__}")
+            return result
         return cls(**obj)  # type: ignore[arg-type]
 
 class Auditable:
-    """Mixin adding audit timestamps."""
+    """Mixin adding audit timestamps.
+
+    Timestamps are stored as integer epoch microseconds; the concrete class
+    must declare ``_created_us`` and ``_updated_us`` in its ``__slots__``.
+    ``created_at``/``updated_at`` are naive-UTC datetimes built on access.
+    """
+    __slots__ = ()
+    _json_fields = ("created_at", "updated_at")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.created_at: datetime = datetime.utcnow()
-        self.updated_at: datetime = self.created_at
+        self._created_us = self._updated_us = time.time_ns() // 1000
+
+    @property
+    def created_at(self) -> datetime:
+        return from_epoch_us(self._created_us)
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self._created_us = to_epoch_us(value)
+
+    @property
+    def updated_at(self) -> datetime:
+        return from_epoch_us(self._updated_us)
+
+    @updated_at.setter
+    def updated_at(self, value: datetime) -> None:
+        self._updated_us = to_epoch_us(value)
 
     def _touch(self):
-        from datetime import datetime as _dt
-        self.updated_at = _dt.utcnow()
+        self._updated_us = time.time_ns() // 1000
@@ -1,26 +1,63 @@
 from __future__ import annotations
-from dataclasses import dataclass
 from decimal import Decimal, getcontext, ROUND_HALF_UP
-from functools import total_ordering
-from typing import Any
+from typing import Any, Dict
 from .exceptions import CurrencyMismatchError
-from .utils import quantize_2
 
 getcontext().prec = 28
 
-@total_ordering
-@dataclass(frozen=True, slots=True)
+# Number of minor-unit digits per currency (paise, cents, ...). Unknown currencies use 2.
+CURRENCY_EXPONENTS: Dict[str, int] = {"INR": 2, "USD": 2, "EUR": 2, "GBP": 2, "JPY": 0, "KWD": 3}
+DEFAULT_EXPONENT = 2
+
+_ONE = Decimal(1)
+
+def currency_exponent(currency: str) -> int:
+    return CURRENCY_EXPONENTS.get(currency, DEFAULT_EXPONENT)
+
 class Money:
-    """Represents money with currency using Decimal for precision."""
-    amount: Decimal
-    currency: str = "INR"
-
-    def __post_init__(self):
-        if not isinstance(self.amount, Decimal):
-            object.__setattr__(self, "amount", Decimal(str(self.amount)))
-        object.__setattr__(self, "amount", quantize_2(self.amount))
-        if not isinstance(self.currency, str) or not self.currency:
+    """Represents money with currency as an exact integer count of minor units.
+
+    ``amount`` is still exposed as a quantized ``Decimal``; arithmetic and
+    comparisons work on the integer ``minor`` value only.
+    """
+    __slots__ = ("minor", "currency")
+
+    minor: int
+    currency: str
+
+    def __init__(self, amount: Any, currency: str = "INR"):
+        if not isinstance(currency, str) or not currency:
             raise ValueError("currency must be a non-empty string")
+        exp = currency_exponent(currency)
+        if isinstance(amount, int):
+            minor = amount * 10 ** exp
+        else:
+            if not isinstance(amount, Decimal):
+                amount = Decimal(str(amount))
+            minor = int(amount.scaleb(exp).quantize(_ONE, rounding=ROUND_HALF_UP))
+        _set_minor(self, minor)
+        _set_currency(self, currency)
+
+    @staticmethod
+    def from_minor(minor: int, currency: str = "INR") -> "Money":
+        """Build Money straight from minor units, skipping Decimal parsing."""
+        return _from_minor(minor, currency)
+
+    @property
+    def amount(self) -> Decimal:
+        return Decimal(self.minor).scaleb(-currency_exponent(self.currency))
+
+    def convert_to(self, currency: str, rates: Any) -> "Money":
+        """Convert using an ``fx.RateTable`` (latest rates) or an ``fx.FxRates`` version."""
+        if currency == self.currency:
+            return self
+        return rates.convert(self, currency)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Money is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Money is immutable")
 
     def _check_currency(self, other: "Money") -> None:
         if self.currency != other.currency:
@@ -30,25 +67,57 @@ class Money:
         if not isinstance(other, Money):
             return NotImplemented
         self._check_currency(other)
-        return Money(self.amount + other.amount, self.currency)
+        return _from_minor(self.minor + other.minor, self.currency)
 
     def __sub__(self, other: "Money") -> "Money":
         if not isinstance(other, Money):
             return NotImplemented
         self._check_currency(other)
-        return Money(self.amount - other.amount, self.currency)
+        return _from_minor(self.minor - other.minor, self.currency)
+
+    def __neg__(self) -> "Money":
+        return _from_minor(-self.minor, self.currency)
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Money):
             return False
-        return self.currency == other.currency and self.amount == other.amount
+        return self.currency == other.currency and self.minor == other.minor
+
+    def __hash__(self) -> int:
+        return hash((self.minor, self.currency))
 
     def __lt__(self, other: "Money") -> bool:
         self._check_currency(other)
-        return self.amount < other.amount
+        return self.minor < other.minor
+
+    def __le__(self, other: "Money") -> bool:
+        self._check_currency(other)
+        return self.minor <= other.minor
+
+    def __gt__(self, other: "Money") -> bool:
+        self._check_currency(other)
+        return self.minor > other.minor
+
+    def __ge__(self, other: "Money") -> bool:
+        self._check_currency(other)
+        return self.minor >= other.minor
+
+    def __reduce__(self):
+        return (_from_minor, (self.minor, self.currency))
 
     def __repr__(self) -> str:
         return f"Money(amount={self.amount}, currency='{self.currency}')"
 
     def __str__(self) -> str:
         return f"{self.currency} {self.amount}"
+
+# Slot setters bypass the immutability guard in __setattr__; used only while building instances.
+_set_minor = Money.minor.__set__  # type: ignore[attr-defined]
+_set_currency = Money.currency.__set__  # type: ignore[attr-defined]
+_new = object.__new__
+
+def _from_minor(minor: int, currency: str) -> Money:
+    m = _new(Money)
+    _set_minor(m, minor)
+    _set_currency(m, currency)
+    return m
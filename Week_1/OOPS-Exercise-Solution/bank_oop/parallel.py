@@ -0,0 +1,33 @@
+from __future__ import annotations
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from .accounts import Account
+from .interest import post_interest
+from .utils import stable_bucket
+
+def monthly_process_parallel(accounts: Dict[str, Account], strategy, workers: int) -> None:
+    """Month-end across a process pool.
+
+    The strategy turns accounts into compact rows (``month_end_rows``); rows
+    are sharded by id hash and each shard runs ``compute_month_end`` in a
+    worker, returning (account_id, delta_minor) pairs. The parent merges the
+    deltas in shard order under one timestamp, so the result is deterministic
+    and matches the serial batch path exactly.
+    """
+    rows, others = strategy.month_end_rows(accounts.values())
+    for account in others:
+        strategy.apply_month_end(account)
+    if not rows:
+        return
+    shards: List[list] = [[] for _ in range(workers)]
+    for row in rows:
+        shards[stable_bucket(row[0], workers)].append(row)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(strategy.compute_month_end, shards))
+    # One timestamp for the whole run, as on the serial path, so balance_at and
+    # statements cannot see some shards' interest and not others'.
+    ts_us = time.time_ns() // 1000
+    for deltas in results:
+        post_interest(accounts, deltas, ts_us=ts_us)
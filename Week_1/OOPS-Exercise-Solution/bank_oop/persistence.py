@@ -0,0 +1,264 @@
+from __future__ import annotations
+import json
+import os
+import struct
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .accounts import Account, SavingsAccount, CheckingAccount
+from .bank import Bank
+from .ledger import ColumnarLedger, decode_ledger, description_of, encode_ledger
+from .money import Money
+from .mixins import Auditable
+from .exceptions import InvalidOperationError
+
+SNAPSHOT_FILE = "snapshot.bin"
+JOURNAL_FILE = "journal.ndjson"
+SNAPSHOT_VERSION = 2
+
+# ---- account (de)construction ---------------------------------------------
+
+def account_params(account: Account) -> Any:
+    """Type-specific constructor argument, in a JSON-friendly form."""
+    if isinstance(account, SavingsAccount):
+        return str(account.interest_rate)
+    if isinstance(account, CheckingAccount):
+        return account.overdraft_limit.minor
+    raise InvalidOperationError(f"Cannot persist account type {type(account).__name__}")
+
+def build_account(kind: str, account_id: str, owner: str, currency: str, balance_minor: int, params: Any) -> Account:
+    """Rebuild an account whose ledger is a single opening entry equal to ``balance_minor``.
+
+    Balances below what the account type allows (negative savings, checking
+    beyond its overdraft limit) raise InvalidOperationError.
+    """
+    # Constructors reject negative openings; an overdrawn checking balance is restored afterwards.
+    opening = Money.from_minor(max(balance_minor, 0), currency)
+    acct: Account
+    if kind == "savings":
+        acct = SavingsAccount(account_id, owner, opening, interest_rate=Decimal(params))  # type: ignore[arg-type]
+    elif kind == "checking":
+        acct = CheckingAccount(account_id, owner, opening, overdraft_limit=Money.from_minor(params, currency))
+    else:
+        raise InvalidOperationError(f"Unknown account type: {kind}")
+    if balance_minor < 0:
+        if balance_minor < acct._floor_minor():
+            raise InvalidOperationError(
+                f"Balance {Money.from_minor(balance_minor, currency)} is below the {kind} account's limit")
+        opened_us = acct.ledger.timestamps[0]
+        acct._balance = Money.from_minor(balance_minor, currency)
+        acct._ledger = ColumnarLedger(currency)
+        acct._ledger.append_raw(balance_minor, opened_us, "opening_balance")
+    return acct
+
+# ---- journal ----------------------------------------------------------------
+
+class EventJournal:
+    """Append-only NDJSON journal of account events.
+
+    Events are buffered and written ``batch_size`` at a time, so the per-operation
+    cost is one small dict and a ``json.dumps``. Up to ``batch_size - 1`` events
+    can be lost on a crash unless ``flush()`` is called; ``fsync=True`` also
+    forces each batch to disk.
+    """
+
+    def __init__(self, path: Union[str, Path], seq: int = 0, batch_size: int = 256, fsync: bool = False):
+        self.path = Path(path)
+        self.seq = seq
+        self.batch_size = batch_size
+        self.fsync = fsync
+        self._buf: List[str] = []
+        self._fh = open(self.path, "a", encoding="utf-8")
+
+    def _append(self, event: Dict[str, Any]) -> None:
+        self.seq += 1
+        event["s"] = self.seq
+        self._buf.append(json.dumps(event, separators=(",", ":")) + "\n")
+        if len(self._buf) >= self.batch_size:
+            self.flush()
+
+    def record_open(self, account: Account) -> None:
+        # The whole ledger goes with the open event: accounts added with history
+        # (bulk loads, add_accounts, accounts used before add_account) keep it on replay.
+        event = {
+            "e": "open", "id": account.id, "type": account.account_type(), "owner": account.owner,
+            "cur": account.balance.currency, "bal": account.balance.minor,
+            "p": account_params(account), "ledger": encode_ledger(account.ledger),
+        }
+        if isinstance(account, Auditable):
+            event["created"], event["updated"] = account._created_us, account._updated_us  # type: ignore[attr-defined]
+        self._append(event)
+
+    def record_post(self, account: Account, delta_minor: int) -> None:
+        ledger = account.ledger
+        self._append({
+            "e": "post", "id": account.id, "d": delta_minor,
+            "ts": ledger.timestamps[-1], "desc": description_of(ledger.codes[-1]),
+        })
+
+    def flush(self) -> None:
+        if self._buf:
+            self._fh.write("".join(self._buf))
+            self._buf.clear()
+        self._fh.flush()
+        if self.fsync:
+            os.fsync(self._fh.fileno())
+
+    def truncate(self) -> None:
+        """Drop all journal contents (after a snapshot has captured them)."""
+        self.flush()
+        self._fh.close()
+        self._fh = open(self.path, "w", encoding="utf-8")
+
+    def close(self) -> None:
+        self.flush()
+        self._fh.close()
+
+    @staticmethod
+    def scan(path: Union[str, Path]) -> Iterator[Tuple[Dict[str, Any], int]]:
+        """Yield ``(event, end_offset)`` for each intact line, stopping at a torn one."""
+        p = Path(path)
+        if not p.exists():
+            return
+        offset = 0
+        with open(p, "rb") as fh:
+            for line in fh:
+                try:
+                    event = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    break  # torn final write from a crash; everything before it is intact
+                offset += len(line)
+                yield event, offset
+
+    @staticmethod
+    def read(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+        for event, _ in EventJournal.scan(path):
+            yield event
+
+    @staticmethod
+    def trim(path: Union[str, Path], length: int) -> None:
+        """Cut the journal back to its first ``length`` intact bytes, ending on a newline.
+
+        Without this, appends after recovery would land on a torn final line
+        and be lost with it on the next recovery.
+        """
+        p = Path(path)
+        if not p.exists():
+            return
+        with open(p, "r+b") as fh:
+            fh.truncate(length)
+            if length:
+                fh.seek(length - 1)
+                if fh.read(1) != b"\n":
+                    fh.write(b"\n")
+
+# ---- snapshots --------------------------------------------------------------
+# Layout: SNAPSHOT_MAGIC, <I n> JSON header {version, seq, currency}, then every
+# account in the ``serialization.dump_binary`` stream format (raw ledger columns).
+
+SNAPSHOT_MAGIC = b"BKOPSNAP"
+_U32 = struct.Struct("<I")
+
+def write_snapshot(bank: Bank, path: Union[str, Path], seq: int) -> None:
+    """Write a binary snapshot of every account (balances and full ledgers) atomically.
+
+    The caller must keep the bank quiescent (e.g. hold ``bank._locked_all()``).
+    """
+    from .serialization import dump_binary
+    header = json.dumps({"version": SNAPSHOT_VERSION, "seq": seq, "currency": bank._currency}).encode()
+    tmp = Path(str(path) + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(SNAPSHOT_MAGIC)
+        fh.write(_U32.pack(len(header)))
+        fh.write(header)
+        dump_binary(bank._accounts.values(), fh)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+def read_snapshot(path: Union[str, Path], **bank_kwargs) -> tuple:
+    """Load a snapshot written by ``write_snapshot``; returns (bank, seq)."""
+    from .serialization import _read_exact, load_binary
+    with open(path, "rb") as fh:
+        if fh.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+            raise InvalidOperationError(f"Not a bank_oop snapshot: {path}")
+        (size,) = _U32.unpack(_read_exact(fh, _U32.size))
+        header = json.loads(_read_exact(fh, size))
+        if header.get("version") != SNAPSHOT_VERSION:
+            raise InvalidOperationError(f"Unsupported snapshot version: {header.get('version')}")
+        bank = Bank(currency=header["currency"], **bank_kwargs)
+        bank.add_accounts(load_binary(fh))
+    return bank, header["seq"]
+
+# ---- store ------------------------------------------------------------------
+
+class BankStore:
+    """Snapshot + journal persistence for one ``Bank`` in a directory.
+
+        store = BankStore("data/")
+        bank = store.open()          # latest snapshot + journal tail
+        bank.deposit("S1", Money(10))
+        store.snapshot(bank)         # periodic; truncates the journal
+        store.close()
+    """
+
+    def __init__(self, directory: Union[str, Path], batch_size: int = 256, fsync: bool = False):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.fsync = fsync
+        self.journal: Optional[EventJournal] = None
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.directory / SNAPSHOT_FILE
+
+    @property
+    def journal_path(self) -> Path:
+        return self.directory / JOURNAL_FILE
+
+    def open(self, **bank_kwargs) -> Bank:
+        """Recover the bank (snapshot, then journal events newer than it) and start journaling."""
+        if self.snapshot_path.exists():
+            bank, seq = read_snapshot(self.snapshot_path, **bank_kwargs)
+        else:
+            bank, seq = Bank(**bank_kwargs), 0
+        intact = 0
+        for event, intact in EventJournal.scan(self.journal_path):
+            if event["s"] <= seq:
+                continue
+            if event["e"] == "open":
+                acct = build_account(event["type"], event["id"], event["owner"], event["cur"], event["bal"], event["p"])
+                if "ledger" in event:
+                    acct._ledger = decode_ledger(event["ledger"], event["cur"])
+                else:  # journals written before ledgers were journaled
+                    acct._ledger = ColumnarLedger(event["cur"])
+                    acct._ledger.append_raw(event["bal"], event["ts"], "opening_balance")
+                if "created" in event:
+                    acct._created_us, acct._updated_us = event["created"], event["updated"]  # type: ignore[attr-defined]
+                bank.add_account(acct)
+            else:
+                acct = bank.get(event["id"])
+                acct._post_minor(event["d"], event["desc"], event["ts"])
+                if isinstance(acct, Auditable):
+                    acct._updated_us = event["ts"]
+            seq = event["s"]
+        EventJournal.trim(self.journal_path, intact)
+        self.journal = EventJournal(self.journal_path, seq=seq, batch_size=self.batch_size, fsync=self.fsync)
+        bank._journal = self.journal
+        return bank
+
+    def snapshot(self, bank: Bank) -> None:
+        if self.journal is None:
+            raise InvalidOperationError("BankStore.open() must be called first")
+        # No mutations (hence no journal events) while the snapshot is taken
+        with bank._locked_all():
+            self.journal.flush()
+            write_snapshot(bank, self.snapshot_path, self.journal.seq)
+            self.journal.truncate()
+
+    def close(self) -> None:
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
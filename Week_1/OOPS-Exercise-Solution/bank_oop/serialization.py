@@ -0,0 +1,204 @@
+"""Schema-driven serialisation for Money, Transaction and accounts.
+
+Each supported class gets one ``Serializer``, built once at import from a
+field schema: the attribute getters and per-field encoders are resolved
+once, so encoding an object is a single pass over a tuple of prebuilt
+accessors (no ``__dict__`` walk, no ``isinstance`` chains).
+
+    dump_ndjson(bank._accounts.values(), fh)        # one JSON object per line
+    for acct in load_ndjson(fh): ...
+
+    dump_binary(accounts, fh); list(load_binary(fh))  # length-prefixed records,
+                                                      # ledgers as raw int64 columns
+"""
+from __future__ import annotations
+import json
+import struct
+from array import array
+from operator import attrgetter
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Type
+
+from .accounts import Account, SavingsAccount, CheckingAccount
+from .ledger import (ColumnarLedger, decode_ledger, description_code, description_table, encode_ledger,
+                     from_epoch_us, to_epoch_us)
+from .money import Money, _from_minor
+from .persistence import build_account
+from .transactions import Transaction
+from .exceptions import InvalidOperationError
+
+# ---- field codecs -------------------------------------------------------------
+
+def _enc_money(m: Money) -> List[Any]:
+    return [m.minor, m.currency]
+
+def _dec_money(v: List[Any]) -> Money:
+    return _from_minor(v[0], v[1])
+
+# (key, getter, encoder or None)
+Field = Tuple[str, Callable[[Any], Any], Optional[Callable[[Any], Any]]]
+
+class Serializer:
+    """Encoder/decoder for one class, compiled once from its field schema."""
+    __slots__ = ("cls", "tag", "fields", "_decode")
+
+    def __init__(self, cls: type, tag: str, fields: List[Tuple[str, str, Optional[Callable]]],
+                 decode: Callable[[Dict[str, Any]], Any]):
+        self.cls = cls
+        self.tag = tag
+        self.fields: Tuple[Field, ...] = tuple((key, attrgetter(attr), enc) for key, attr, enc in fields)
+        self._decode = decode
+
+    def to_dict(self, obj: Any, ledger: bool = True) -> Dict[str, Any]:
+        d: Dict[str, Any] = {"t": self.tag}
+        for key, get, enc in self.fields:
+            if key == "ledger" and not ledger:
+                continue
+            v = get(obj)
+            d[key] = v if enc is None else enc(v)
+        return d
+
+    def from_dict(self, d: Dict[str, Any]) -> Any:
+        return self._decode(d)
+
+def _dec_transaction(d: Dict[str, Any]) -> Transaction:
+    return Transaction(_dec_money(d["amount"]), from_epoch_us(d["ts"]), d["desc"])
+
+def _dec_account(d: Dict[str, Any]) -> Account:
+    balance = _dec_money(d["balance"])
+    params = d["rate"] if d["t"] == "savings" else d["overdraft"][0]
+    acct = build_account(d["t"], d["id"], d["owner"], balance.currency, balance.minor, params)
+    if "ledger" in d:
+        acct._ledger = decode_ledger(d["ledger"], balance.currency)
+    if "created" in d:
+        acct._created_us, acct._updated_us = d["created"], d["updated"]  # type: ignore[attr-defined]
+    return acct
+
+_ACCOUNT_FIELDS: List[Tuple[str, str, Optional[Callable]]] = [
+    ("id", "_id", None), ("owner", "_owner", None), ("balance", "_balance", _enc_money),
+]
+_LEDGER_FIELD = ("ledger", "_ledger", encode_ledger)
+
+_SERIALIZERS: Dict[type, Serializer] = {
+    Money: Serializer(Money, "money", [("v", "minor", None), ("cur", "currency", None)],
+                      lambda d: _from_minor(d["v"], d["cur"])),
+    Transaction: Serializer(Transaction, "txn", [("amount", "amount", _enc_money), ("ts", "timestamp", to_epoch_us),
+                                                 ("desc", "description", None)], _dec_transaction),
+    SavingsAccount: Serializer(SavingsAccount, "savings", _ACCOUNT_FIELDS + [
+        ("rate", "interest_rate", str), ("created", "_created_us", None), ("updated", "_updated_us", None),
+        _LEDGER_FIELD], _dec_account),
+    CheckingAccount: Serializer(CheckingAccount, "checking", _ACCOUNT_FIELDS + [
+        ("overdraft", "overdraft_limit", _enc_money), _LEDGER_FIELD], _dec_account),
+}
+_BY_TAG: Dict[str, Serializer] = {s.tag: s for s in _SERIALIZERS.values()}
+
+def find_serializer(cls: Type[Any]) -> Optional[Serializer]:
+    """The serializer registered for exactly ``cls`` (subclasses need their own), or None."""
+    return _SERIALIZERS.get(cls)
+
+def serializer_for(cls: Type[Any]) -> Serializer:
+    serializer = find_serializer(cls)
+    if serializer is None:
+        raise InvalidOperationError(f"No serializer for {cls.__name__}")
+    return serializer
+
+def register_serializer(serializer: Serializer) -> None:
+    """Add a schema for another class (e.g. an Account subclass); its tag must be unique."""
+    if serializer.tag in _BY_TAG and _BY_TAG[serializer.tag].cls is not serializer.cls:
+        raise InvalidOperationError(f"Serializer tag {serializer.tag!r} is already used")
+    _SERIALIZERS[serializer.cls] = serializer
+    _BY_TAG[serializer.tag] = serializer
+
+def to_dict(obj: Any, ledger: bool = True) -> Dict[str, Any]:
+    return serializer_for(type(obj)).to_dict(obj, ledger)
+
+def from_dict(d: Dict[str, Any]) -> Any:
+    serializer = _BY_TAG.get(d.get("t"))  # type: ignore[arg-type]
+    if serializer is None:
+        raise InvalidOperationError(f"Unknown record type: {d.get('t')}")
+    return serializer.from_dict(d)
+
+# ---- NDJSON -------------------------------------------------------------------
+
+def dump_ndjson(objs: Iterable[Any], fh: TextIO, ledger: bool = True) -> int:
+    """Write one JSON object per line, streaming; returns the number written."""
+    dumps = json.JSONEncoder(separators=(",", ":")).encode
+    count = 0
+    for obj in objs:
+        fh.write(dumps(to_dict(obj, ledger)))
+        fh.write("\n")
+        count += 1
+    return count
+
+def load_ndjson(fh: TextIO) -> Iterator[Any]:
+    for line in fh:
+        if line.strip():
+            yield from_dict(json.loads(line))
+
+# ---- binary -------------------------------------------------------------------
+# Stream: MAGIC, then records of <B kind><I len><payload>, ending with kind 0.
+#   kind 1: JSON object (to_dict without ledger)
+#   kind 2: JSON account header, followed by <I n> and the raw ledger columns
+#           (n*int64 amounts, n*int64 timestamps, n*uint32 description codes)
+#   kind 3: JSON list of descriptions appended to the stream's code table;
+#           written before any account whose ledger uses a new code.
+
+MAGIC = b"BKOPSER1"
+_HEAD = struct.Struct("<BI")
+_U32 = struct.Struct("<I")
+
+def _read_exact(fh: BinaryIO, n: int) -> bytes:
+    data = fh.read(n)
+    if len(data) != n:
+        raise InvalidOperationError("Truncated serialised stream")
+    return data
+
+def dump_binary(objs: Iterable[Any], fh: BinaryIO) -> int:
+    """Write objects as length-prefixed records, accounts with raw ledger columns; returns the count."""
+    fh.write(MAGIC)
+    count = 0
+    known = 0  # descriptions already sent
+    for obj in objs:
+        payload = json.dumps(to_dict(obj, ledger=False), separators=(",", ":")).encode()
+        if isinstance(obj, Account):
+            table = description_table()
+            if len(table) > known:
+                new = json.dumps(table[known:]).encode()
+                fh.write(_HEAD.pack(3, len(new)))
+                fh.write(new)
+                known = len(table)
+            ledger = obj.ledger
+            fh.write(_HEAD.pack(2, len(payload)))
+            fh.write(payload)
+            fh.write(_U32.pack(len(ledger)))
+            fh.write(ledger.amounts.tobytes())
+            fh.write(ledger.timestamps.tobytes())
+            fh.write(ledger.codes.tobytes())
+        else:
+            fh.write(_HEAD.pack(1, len(payload)))
+            fh.write(payload)
+        count += 1
+    fh.write(_HEAD.pack(0, 0))
+    return count
+
+def load_binary(fh: BinaryIO) -> Iterator[Any]:
+    if _read_exact(fh, len(MAGIC)) != MAGIC:
+        raise InvalidOperationError("Not a bank_oop serialised stream")
+    remap: List[int] = []
+    while True:
+        kind, size = _HEAD.unpack(_read_exact(fh, _HEAD.size))
+        if kind == 0:
+            return
+        if kind == 3:
+            remap.extend(description_code(d) for d in json.loads(_read_exact(fh, size)))
+            continue
+        obj = from_dict(json.loads(_read_exact(fh, size)))
+        if kind == 2:
+            (n,) = _U32.unpack(_read_exact(fh, 4))
+            amounts, stamps, codes = array("q"), array("q"), array("I")
+            amounts.frombytes(_read_exact(fh, 8 * n))
+            stamps.frombytes(_read_exact(fh, 8 * n))
+            codes.frombytes(_read_exact(fh, 4 * n))
+            if remap != list(range(len(remap))):
+                codes = array("I", [remap[c] for c in codes])
+            obj._ledger = ColumnarLedger.from_columns(obj.balance.currency, amounts, stamps, codes)
+        yield obj
@@ -0,0 +1,84 @@
+"""Streaming account statements.
+
+``statement_lines`` walks the ledger columns lazily, so a statement over
+millions of entries never holds more than one line in memory; the writers
+emit each line as soon as it is produced, to any object with ``write``
+(a file, ``sys.stdout``, ``socket.makefile("w")``, ...).
+
+    with open("S1.csv", "w", newline="") as fh:
+        write_statement_csv(account, fh, start=datetime(2025, 1, 1), end=datetime(2025, 1, 31))
+"""
+from __future__ import annotations
+import csv
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, Optional, TextIO, Tuple
+
+from .accounts import Account
+from .ledger import description_of, from_epoch_us, to_epoch_us
+from .money import Money, _from_minor
+
+@dataclass(frozen=True, slots=True)
+class StatementLine:
+    """One ledger entry with the balance after it."""
+    timestamp: datetime
+    description: str
+    amount: Money
+    balance: Money
+
+def _bounds(account: Account, start: Optional[datetime], end: Optional[datetime]) -> Tuple[int, int]:
+    ts = account.ledger.timestamps
+    lo = bisect_left(ts, to_epoch_us(start)) if start is not None else 0
+    hi = bisect_right(ts, to_epoch_us(end)) if end is not None else len(ts)
+    return lo, max(lo, hi)
+
+def opening_balance(account: Account, start: Optional[datetime] = None) -> Money:
+    """Balance before the first entry stamped at or after ``start``."""
+    lo, _ = _bounds(account, start, None)
+    return _from_minor(account.ledger.prefix_sum(lo), account.balance.currency)
+
+def statement_lines(account: Account, start: Optional[datetime] = None,
+                    end: Optional[datetime] = None) -> Iterator[StatementLine]:
+    """Entries stamped within [start, end] (naive UTC, either bound optional) with running balances.
+
+    The range is fixed when iteration starts; entries posted while iterating are not included.
+    """
+    ledger = account.ledger
+    currency = account.balance.currency
+    lo, hi = _bounds(account, start, end)
+    running = ledger.prefix_sum(lo)  # checkpointed: no replay from the first entry
+    amounts, stamps, codes = ledger.amounts, ledger.timestamps, ledger.codes
+    for i in range(lo, hi):
+        minor = amounts[i]
+        running += minor
+        yield StatementLine(from_epoch_us(stamps[i]), description_of(codes[i]),
+                            _from_minor(minor, currency), _from_minor(running, currency))
+
+# ---- formatters ---------------------------------------------------------------
+
+def write_statement_csv(account: Account, out: TextIO, start: Optional[datetime] = None,
+                        end: Optional[datetime] = None) -> int:
+    """Write ``timestamp,description,amount,balance`` rows incrementally; returns the number of entries."""
+    writer = csv.writer(out)
+    writer.writerow(["timestamp", "description", "amount", "balance"])
+    count = 0
+    for line in statement_lines(account, start, end):
+        writer.writerow([line.timestamp.isoformat(), line.description, line.amount.amount, line.balance.amount])
+        count += 1
+    return count
+
+def write_statement_text(account: Account, out: TextIO, start: Optional[datetime] = None,
+                         end: Optional[datetime] = None) -> int:
+    """Write a human-readable statement with opening and closing balances; returns the number of entries."""
+    opening = opening_balance(account, start)
+    out.write(f"Statement for {account.id} ({account.owner}, {account.account_type()})\n")
+    out.write(f"Period: {start or 'start'} to {end or 'now'}\n")
+    out.write(f"Opening balance: {opening}\n")
+    closing, count = opening, 0
+    for line in statement_lines(account, start, end):
+        out.write(f"{line.timestamp:%Y-%m-%d %H:%M:%S}  {line.description:<20} "
+                  f"{line.amount.amount:>14}  {line.balance.amount:>14}\n")
+        closing, count = line.balance, count + 1
+    out.write(f"Closing balance: {closing}\n")
+    return count
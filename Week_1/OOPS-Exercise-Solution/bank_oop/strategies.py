@@ -1,13 +1,50 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from .accounts import Account, InterestBearingAccount
+from typing import Iterable, List, Tuple
+from decimal import Decimal
+from .accounts import Account, InterestBearingAccount, SavingsAccount
+from .interest import interest_deltas, post_interest
 
 class InterestStrategy(ABC):
     @abstractmethod
     def apply_month_end(self, account: Account) -> None:
         ...
 
+    def apply_month_end_batch(self, accounts: Iterable[Account]) -> None:
+        """Month-end for many accounts; override to process them in bulk."""
+        for account in accounts:
+            self.apply_month_end(account)
+
 class SimpleInterestStrategy(InterestStrategy):
     def apply_month_end(self, account: Account) -> None:
         if isinstance(account, InterestBearingAccount):
             account.apply_interest()
+
+    def month_end_rows(self, accounts: Iterable[Account]) -> Tuple[List[Tuple[str, int, Decimal]], List[Account]]:
+        """Split accounts into compact (id, balance_minor, rate) rows and accounts needing apply_month_end.
+
+        Accounts using the stock SavingsAccount interest rule become rows; anything
+        that overrides apply_interest keeps its own logic. A subclass that overrides
+        apply_month_end gets every account passed to it, as before batching existed.
+        """
+        rows: List[Tuple[str, int, Decimal]] = []
+        others: List[Account] = []
+        if type(self).apply_month_end is not SimpleInterestStrategy.apply_month_end:
+            return rows, list(accounts)
+        for account in accounts:
+            if getattr(type(account), "apply_interest", None) is SavingsAccount.apply_interest:
+                rows.append((account.id, account.balance.minor, account.interest_rate))  # type: ignore[attr-defined]
+            else:
+                others.append(account)
+        return rows, others
+
+    def compute_month_end(self, rows: List[Tuple[str, int, Decimal]]) -> List[Tuple[str, int]]:
+        """Pure computation of (account_id, interest_minor) credits; safe to run in a worker process."""
+        return interest_deltas(rows)
+
+    def apply_month_end_batch(self, accounts: Iterable[Account]) -> None:
+        accounts = list(accounts)
+        rows, others = self.month_end_rows(accounts)
+        for account in others:
+            self.apply_month_end(account)
+        post_interest({a.id: a for a in accounts}, self.compute_month_end(rows))
@@ -32,3 +32,13 @@ class TestAccounts(unittest.TestCase):
         self.sav.apply_interest()
         # Monthly interest on 100 at 6% p.a. = 0.5
         self.assertEqual(self.sav.balance.amount, Decimal("100.50"))
+
+    def test_slotted_layout(self):
+        self.assertFalse(hasattr(self.sav, "__dict__"))
+        self.assertFalse(hasattr(self.chk, "__dict__"))
+        other = SavingsAccount("S2", "Meera", self.opening, interest_rate=6.0)
+        self.assertIs(other.interest_rate, self.sav.interest_rate)  # interned per rate
+        self.assertIsInstance(self.sav._created_us, int)
+        self.sav.updated_at = datetime(2025, 1, 1, 12, 30)
+        self.assertEqual(self.sav.updated_at, datetime(2025, 1, 1, 12, 30))
+        self.assertIn('"rate":"6.0"', self.sav.to_json())
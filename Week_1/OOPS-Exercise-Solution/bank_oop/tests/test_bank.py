@@ -4,6 +4,7 @@ from bank_oop.bank import Bank
 from bank_oop.money import Money
 from bank_oop.accounts import SavingsAccount, CheckingAccount
 from bank_oop.strategies import SimpleInterestStrategy
+from bank_oop.exceptions import InconsistentStateError
 
 class TestBank(unittest.TestCase):
     def test_add_and_total(self):
@@ -20,3 +21,27 @@ class TestBank(unittest.TestCase):
         bank.add_account(s)
         bank.monthly_process(SimpleInterestStrategy())
         self.assertEqual(s.balance.amount, Decimal("100.50"))
+
+    def test_running_totals_follow_mutations(self):
+        bank = Bank(consistency_check=True)
+        s = SavingsAccount("S1","Abinash", Money(Decimal("100.00")), interest_rate=6.0)
+        c = CheckingAccount("C1","Rahul", Money(Decimal("50.00")), overdraft_limit=Money(Decimal("20.00")))
+        bank.add_account(s); bank.add_account(c)
+        s.deposit(Money(Decimal("10.00")))
+        c.withdraw(Money(Decimal("60.00")))
+        s.transfer(c, Money(Decimal("5.00")))
+        bank.monthly_process(SimpleInterestStrategy())
+        self.assertEqual(bank.total_assets().amount, Decimal("100.53"))
+        by_type = bank.assets_by_type()
+        self.assertEqual(by_type["savings"].amount, Decimal("105.53"))
+        self.assertEqual(by_type["checking"].amount, Decimal("-5.00"))
+
+    def test_consistency_check_detects_drift(self):
+        bank = Bank(consistency_check=True)
+        s = SavingsAccount("S1","Abinash", Money(Decimal("100.00")), interest_rate=6.0)
+        bank.add_account(s)
+        s._balance = Money(Decimal("1.00"))  # bypasses the change hook
+        with self.assertRaises(InconsistentStateError):
+            bank.total_assets()
+        self.assertEqual(bank.recompute_totals().amount, Decimal("1.00"))
+        self.assertEqual(bank.total_assets().amount, Decimal("1.00"))
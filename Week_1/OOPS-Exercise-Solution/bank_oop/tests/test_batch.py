@@ -0,0 +1,53 @@
+import unittest
+from decimal import Decimal
+from bank_oop.bank import Bank
+from bank_oop.money import Money
+from bank_oop.accounts import SavingsAccount, CheckingAccount
+from bank_oop.exceptions import InsufficientFundsError, InvalidOperationError, AccountNotFoundError
+
+def M(s):
+    return Money(Decimal(s))
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.bank = Bank(consistency_check=True)
+        self.bank.add_account(SavingsAccount("S1", "Asha", M("100.00"), interest_rate=6.0))
+        self.bank.add_account(CheckingAccount("C1", "Raj", M("10.00"), overdraft_limit=M("50.00")))
+
+    def test_account_batch_single_timestamp(self):
+        acct = self.bank.get("S1")
+        acct.apply_batch([("deposit", M("5.00")), ("withdraw", M("105.00")), ("deposit", M("1.00"))])
+        self.assertEqual(acct.balance, M("1.00"))
+        self.assertEqual(len(acct.ledger), 4)
+        self.assertEqual(len(set(acct.ledger.timestamps[1:])), 1)
+        self.assertEqual(self.bank.total_assets(), M("11.00"))
+
+    def test_account_batch_is_all_or_nothing(self):
+        acct = self.bank.get("S1")
+        with self.assertRaises(InsufficientFundsError):
+            # funds are checked at every step, not just on the final balance
+            acct.apply_batch([("withdraw", M("150.00")), ("deposit", M("100.00"))])
+        with self.assertRaises(InvalidOperationError):
+            acct.apply_batch([("deposit", M("1.00")), ("refund", M("1.00"))])
+        self.assertEqual(acct.balance, M("100.00"))
+        self.assertEqual(len(acct.ledger), 1)
+
+    def test_bank_batch(self):
+        n = self.bank.apply_batch([
+            ("withdraw", "S1", M("30.00")), ("deposit", "C1", M("30.00")),
+            ("withdraw", "C1", M("85.00")),  # uses the overdraft
+        ])
+        self.assertEqual(n, 3)
+        self.assertEqual(self.bank.get("C1").balance, M("-45.00"))
+        self.assertEqual(self.bank.total_assets(), M("25.00"))
+
+    def test_bank_batch_rolls_back_every_account(self):
+        with self.assertRaises(InsufficientFundsError):
+            self.bank.apply_batch([("deposit", "S1", M("1.00")), ("withdraw", "C1", M("60.01"))])
+        with self.assertRaises(AccountNotFoundError):
+            self.bank.apply_batch([("deposit", "S1", M("1.00")), ("deposit", "X", M("1.00"))])
+        self.assertEqual(self.bank.get("S1").balance, M("100.00"))
+        self.assertEqual(len(self.bank.get("S1").ledger), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import io
+import unittest
+from decimal import Decimal
+from bank_oop.bank import Bank
+from bank_oop.money import Money
+from bank_oop.accounts import SavingsAccount, CheckingAccount
+from bank_oop.bulk import load_csv, export_csv, load_binary, export_binary
+from bank_oop.exceptions import CurrencyMismatchError, InvalidOperationError
+
+CSV = """type,id,owner,currency,balance,params
+savings,S1,Asha,INR,100.00,6.5
+checking,C1,Raj,INR,50.00,20.00
+"""
+
+def _state(bank):
+    return {a.id: (a.balance, list(a.ledger)) for a in bank._accounts.values()}
+
+class TestBulk(unittest.TestCase):
+    def test_load_csv(self):
+        bank = Bank()
+        self.assertEqual(load_csv(io.StringIO(CSV), bank), 2)
+        self.assertEqual(bank.get("S1").interest_rate, Decimal("6.5"))
+        self.assertEqual(bank.get("C1").overdraft_limit, Money(Decimal("20.00")))
+        self.assertEqual(bank.total_assets(), Money(Decimal("150.00")))
+        bank.verify_totals()
+
+    def test_load_csv_rejects_bad_rows_atomically(self):
+        bank = Bank()
+        with self.assertRaises(InvalidOperationError):
+            load_csv(io.StringIO(CSV + "savings,S1,Dup,INR,1.00,1\n"), bank)
+        with self.assertRaises(CurrencyMismatchError):
+            load_csv(io.StringIO(CSV + "savings,S2,Usd,USD,1.00,1\n"), bank)
+        self.assertEqual(len(bank._accounts), 0)
+        self.assertEqual(bank.total_assets(), Money(0))
+
+    def test_load_csv_validates_balances_and_reports_lines(self):
+        bad_rows = {
+            "savings,S2,A,INR,-500.00,6.5": "line 4: Balance",
+            "checking,C2,B,INR,-900.00,20.00": "line 4: Balance",
+            "savings,S2,A,INR,abc,6.5": "line 4: invalid amount",
+            "savings,S2,A,INR,1.00,x": "line 4: invalid amount",
+            "loan,L1,A,INR,1.00,1": "line 4: Unknown account type",
+            "savings,S2,A,INR": "line 4: expected 6 fields",
+        }
+        for row, message in bad_rows.items():
+            bank = Bank()
+            with self.assertRaises(InvalidOperationError) as ctx:
+                load_csv(io.StringIO(CSV + row + "\n"), bank)
+            self.assertTrue(str(ctx.exception).startswith(message), (row, str(ctx.exception)))
+            self.assertEqual(len(bank._accounts), 0)
+
+    def test_load_csv_overdrawn_checking_ledger_matches_balance(self):
+        bank = Bank()
+        load_csv(io.StringIO(CSV + "checking,C2,B,INR,-15.00,20.00\n"), bank)
+        acct = bank.get("C2")
+        self.assertEqual(acct.balance, Money(Decimal("-15.00")))
+        self.assertEqual([t.amount for t in acct.ledger], [Money(Decimal("-15.00"))])
+        bank.verify_totals()
+
+    def test_csv_round_trip(self):
+        bank = Bank()
+        load_csv(io.StringIO(CSV), bank)
+        bank.withdraw("C1", Money(Decimal("60.00")))
+        accounts, ledger = io.StringIO(), io.StringIO()
+        self.assertEqual(export_csv(bank, accounts, ledger), 2)
+        restored = Bank()
+        load_csv(io.StringIO(accounts.getvalue()), restored)
+        self.assertEqual(restored.get("C1").balance, Money(Decimal("-10.00")))
+        self.assertIn("C1,", ledger.getvalue())
+        self.assertIn("-60.00,withdraw", ledger.getvalue())
+
+    def test_binary_round_trip_with_ledgers(self):
+        bank = Bank()
+        bank.add_account(SavingsAccount("S1", "Asha", Money(Decimal("100.00")), interest_rate=6.0))
+        bank.add_account(CheckingAccount("C1", "Raj", Money(Decimal("10.00")), overdraft_limit=Money(Decimal("50.00"))))
+        bank.transfer("C1", "S1", Money(Decimal("30.00")))
+        buf = io.BytesIO()
+        self.assertEqual(export_binary(bank, buf), 2)
+        buf.seek(0)
+        restored = Bank()
+        self.assertEqual(load_binary(buf, restored), 2)
+        self.assertEqual(_state(restored), _state(bank))
+        self.assertEqual(restored.total_assets(), bank.total_assets())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import random
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from bank_oop.bank import Bank
+from bank_oop.money import Money
+from bank_oop.accounts import SavingsAccount
+from bank_oop.exceptions import InsufficientFundsError, AccountNotFoundError
+
+class TestConcurrentBank(unittest.TestCase):
+    def setUp(self):
+        self.bank = Bank(concurrent=True, lock_stripes=8)
+        for i in range(20):
+            self.bank.add_account(SavingsAccount(f"S{i}", "A", Money(Decimal("100.00")), interest_rate=5.0))
+
+    def test_parallel_transfers_conserve_money(self):
+        def worker(seed):
+            rnd = random.Random(seed)
+            for _ in range(500):
+                a, b = rnd.sample(range(20), 2)
+                try:
+                    self.bank.transfer(f"S{a}", f"S{b}", Money(Decimal(rnd.randint(1, 30))))
+                except InsufficientFundsError:
+                    pass
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(worker, range(8)))
+        self.bank.consistency_check = True
+        self.assertEqual(self.bank.total_assets().amount, Decimal("2000.00"))
+        self.assertTrue(all(self.bank.get(f"S{i}").balance.minor >= 0 for i in range(20)))
+
+    def test_transfer_many_reports_per_item_results(self):
+        m = Money(Decimal("60.00"))
+        results = self.bank.transfer_many([("S0", "S1", m), ("S0", "S2", m), ("S3", "S4", m)])
+        self.assertIsNone(results[0])
+        self.assertIsInstance(results[1], InsufficientFundsError)
+        self.assertIsNone(results[2])
+        self.assertEqual(self.bank.get("S0").balance.amount, Decimal("40.00"))
+
+    def test_transfer_many_keeps_order_of_dependent_operations(self):
+        # Op 2 only succeeds if op 1 (which shares no lock set with it) has already run
+        ops = [("S1", "S0", Money(Decimal("50.00"))), ("S2", "S1", Money(Decimal("100.00"))),
+               ("S1", "S0", Money(Decimal("150.00")))]
+        for kwargs in ({}, {"concurrent": True, "lock_stripes": 1}, {"concurrent": True, "lock_stripes": 64}):
+            bank = Bank(**kwargs)
+            for i in range(3):
+                bank.add_account(SavingsAccount(f"S{i}", "A", Money(Decimal("100.00")), interest_rate=5.0))
+            self.assertEqual(bank.transfer_many(ops), [None, None, None], kwargs)
+            self.assertEqual(bank.get("S0").balance.amount, Decimal("300.00"))
+
+    def test_new_descriptions_get_one_code_across_threads(self):
+        from bank_oop.ledger import description_code, description_of
+        names = [f"concurrent-intern-{i}" for i in range(2000)]
+        start = threading.Barrier(8)
+        def worker(_):
+            start.wait()
+            return [description_code(name) for name in names]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(worker, range(8)))
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertTrue(all(codes == results[0] for codes in results))
+        self.assertEqual([description_of(code) for code in results[0]], names)
+
+    def test_unknown_account(self):
+        with self.assertRaises(AccountNotFoundError):
+            self.bank.deposit("missing", Money(Decimal("1.00")))
@@ -0,0 +1,51 @@
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from bank_oop.bank import Bank
+from bank_oop.fx import RateTable
+from bank_oop.money import Money
+from bank_oop.accounts import SavingsAccount, CheckingAccount
+from bank_oop.exceptions import CurrencyMismatchError, ExchangeRateError
+
+class TestFx(unittest.TestCase):
+    def setUp(self):
+        self.fx = RateTable(base="USD")
+        self.fx.update({"INR": "83.00", "EUR": "0.92", "JPY": "150"}, as_of=datetime(2025, 1, 1))
+
+    def test_convert_to_uses_cross_rates(self):
+        self.assertEqual(Money(Decimal("10.00"), "USD").convert_to("INR", self.fx), Money(Decimal("830.00"), "INR"))
+        # INR -> EUR goes through the precomputed cross rate: 100 / 83 * 0.92 = 1.1084...
+        self.assertEqual(Money(100, "INR").convert_to("EUR", self.fx), Money(Decimal("1.11"), "EUR"))
+        # minor-unit exponents differ: 1.00 USD -> 150 JPY
+        self.assertEqual(Money(1, "USD").convert_to("JPY", self.fx), Money(150, "JPY"))
+        with self.assertRaises(ExchangeRateError):
+            Money(1, "GBP").convert_to("INR", self.fx)
+
+    def test_versions_by_timestamp(self):
+        self.fx.update({"INR": "84.00"}, as_of=datetime(2025, 2, 1))
+        self.assertEqual(self.fx.at(datetime(2025, 1, 15)).convert(Money(1, "USD"), "INR"), Money(83, "INR"))
+        self.assertEqual(Money(1, "USD").convert_to("INR", self.fx), Money(84, "INR"))
+        with self.assertRaises(ExchangeRateError):
+            self.fx.at(datetime(2024, 12, 31))
+        with self.assertRaises(ExchangeRateError):
+            self.fx.update({"INR": "80"}, as_of=datetime(2025, 1, 10))
+
+    def test_multi_currency_bank_totals(self):
+        bank = Bank(currency="INR", fx=self.fx, consistency_check=True)
+        bank.add_account(SavingsAccount("S1", "Asha", Money(Decimal("830.00"), "INR"), interest_rate=5))
+        bank.add_account(CheckingAccount("C1", "Raj", Money(Decimal("10.00"), "USD"), overdraft_limit=Money(0, "USD")))
+        self.assertEqual(bank.total_assets(), Money(Decimal("1660.00"), "INR"))
+        self.assertEqual(bank.total_assets(in_currency="USD"), Money(Decimal("20.00"), "USD"))
+        self.assertEqual(bank.assets_by_type(in_currency="USD")["checking"], Money(10, "USD"))
+        bank.transfer("S1", "C1", Money(83, "INR"))
+        self.assertEqual(bank.get("C1").balance, Money(11, "USD"))
+        self.assertEqual(bank.total_assets(), Money(Decimal("1660.00"), "INR"))
+
+    def test_single_currency_bank_rejects_foreign_accounts(self):
+        with self.assertRaises(CurrencyMismatchError):
+            Bank().add_account(SavingsAccount("S1", "A", Money(1, "USD"), interest_rate=5))
+        with self.assertRaises(CurrencyMismatchError):
+            Bank(fx=self.fx).add_account(SavingsAccount("S1", "A", Money(1, "GBP"), interest_rate=5))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from decimal import Decimal
+from bank_oop import interest
+from bank_oop.bank import Bank
+from bank_oop.money import Money
+from bank_oop.accounts import SavingsAccount, CheckingAccount
+from bank_oop.strategies import InterestStrategy, SimpleInterestStrategy
+
+class TestInterestEngine(unittest.TestCase):
+    def test_exact_half_up_rounding(self):
+        # 6.00 at 1% p.a. is exactly 0.005 -> 0.01
+        self.assertEqual(interest.monthly_interest_minor(600, Decimal("1")), 1)
+        self.assertEqual(interest.monthly_interest_minor(10000, Decimal("6")), 50)
+        self.assertEqual(interest.monthly_interest_minor(-600, Decimal("1")), -1)
+
+    def test_vectorised_matches_scalar_with_and_without_numpy(self):
+        balances = list(range(-5000, 5000, 7)) + [10 ** 15, 123456789]
+        rate = Decimal("3.75")
+        expected = [interest.monthly_interest_minor(b, rate) for b in balances]
+        self.assertEqual(interest.compute_interest(balances, rate), expected)
+        saved = interest.np
+        interest.np = None
+        try:
+            self.assertEqual(interest.compute_interest(balances, rate), expected)
+        finally:
+            interest.np = saved
+
+    def test_batch_month_end_matches_per_account(self):
+        def build():
+            bank = Bank(consistency_check=True)
+            for i in range(50):
+                bank.add_account(SavingsAccount(f"S{i}", "A", Money(Decimal(i * 37) + Decimal("0.55")), interest_rate=[4.0, 5.5, 7.25][i % 3]))
+            bank.add_account(CheckingAccount("C1", "R", Money(Decimal("10.00")), overdraft_limit=Money(Decimal("5.00"))))
+            return bank
+        batch, serial = build(), build()
+        batch.monthly_process(SimpleInterestStrategy())
+        for acct in serial._accounts.values():
+            SimpleInterestStrategy().apply_month_end(acct)
+        for acct_id, acct in serial._accounts.items():
+            self.assertEqual(batch.get(acct_id).balance, acct.balance)
+            self.assertEqual(len(batch.get(acct_id)), len(acct))
+        self.assertEqual(batch.total_assets(), serial.recompute_totals())
+
+    def test_custom_strategy_still_called_per_account(self):
+        seen = []
+        class Tagging(InterestStrategy):
+            def apply_month_end(self, account):
+                seen.append(account.id)
+        bank = Bank()
+        bank.add_account(SavingsAccount("S1", "A", Money(Decimal("1.00")), interest_rate=1.0))
+        bank.monthly_process(Tagging())
+        self.assertEqual(seen, ["S1"])
+
+    def test_parallel_month_end_matches_serial(self):
+        def build():
+            bank = Bank(consistency_check=True)
+            for i in range(200):
+                bank.add_account(SavingsAccount(f"S{i}", "A", Money(Decimal(i * 13) + Decimal("0.45")), interest_rate=[4.0, 6.5][i % 2]))
+            bank.add_account(CheckingAccount("C1", "R", Money(Decimal("10.00")), overdraft_limit=Money(Decimal("5.00"))))
+            return bank
+        parallel, serial = build(), build()
+        parallel.monthly_process(SimpleInterestStrategy(), workers=2)
+        serial.monthly_process(SimpleInterestStrategy())
+        for acct_id, acct in serial._accounts.items():
+            self.assertEqual(parallel.get(acct_id).balance, acct.balance)
+            self.assertEqual(len(parallel.get(acct_id)), len(acct))
+        self.assertEqual(parallel.total_assets(), serial.total_assets())
+        # every shard's credits carry the run's single timestamp
+        credited = [parallel.get(f"S{i}").ledger for i in range(200) if len(parallel.get(f"S{i}")) == 2]
+        self.assertGreater(len(credited), 100)
+        self.assertEqual(len({ledger.timestamps[-1] for ledger in credited}), 1)
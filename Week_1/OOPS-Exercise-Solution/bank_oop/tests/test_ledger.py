@@ -0,0 +1,49 @@
+import unittest
+from decimal import Decimal
+from datetime import datetime
+from bank_oop.money import Money
+from bank_oop.ledger import ColumnarLedger, to_epoch_us
+from bank_oop.transactions import Transaction
+from bank_oop.accounts import SavingsAccount
+
+class TestColumnarLedger(unittest.TestCase):
+    def test_round_trip_and_slicing(self):
+        ledger = ColumnarLedger("INR")
+        ts = datetime(2025, 1, 31, 12, 30, 15, 123456)
+        txns = [Transaction(Money(Decimal(i)), ts, f"d{i % 2}") for i in range(5)]
+        for t in txns:
+            ledger.append(t)
+        self.assertEqual(len(ledger), 5)
+        self.assertEqual(list(ledger), txns)
+        self.assertEqual(ledger[-1], txns[-1])
+        self.assertEqual(ledger[1:4], txns[1:4])
+        with self.assertRaises(IndexError):
+            _ = ledger[5]
+
+    def test_account_uses_columnar_ledger(self):
+        s = SavingsAccount("S1", "Asha", Money(Decimal("100.00")), interest_rate=6.0)
+        s.withdraw(Money(Decimal("25.50")))
+        entries = list(s.ledger)
+        self.assertEqual([t.description for t in entries], ["opening_balance", "withdraw"])
+        self.assertEqual(entries[1].amount, Money(Decimal("-25.50")))
+        self.assertIsInstance(entries[1].timestamp, datetime)
+
+    def test_balance_at_uses_checkpoints(self):
+        ledger = ColumnarLedger("INR")
+        for i in range(3000):
+            ledger.append_raw(i, i * 1_000_000, "deposit")
+        self.assertEqual(len(ledger.checkpoints), 3000 // ColumnarLedger.CHECKPOINT_INTERVAL)
+        for k in (0, 1, 1023, 1024, 1025, 2999, 3000):
+            self.assertEqual(ledger.prefix_sum(k), sum(range(k)))
+        self.assertEqual(ledger.balance_at_us(2047 * 1_000_000), sum(range(2048)))
+        self.assertEqual(ledger.balance_at_us(-1), 0)
+
+    def test_account_balance_at_and_between(self):
+        s = SavingsAccount("S1", "Asha", Money(Decimal("100.00")), interest_rate=6.0)
+        opened = s.ledger[0].timestamp
+        s._ledger.append_raw(5000, to_epoch_us(datetime(2999, 1, 1)), "deposit")
+        self.assertEqual(s.balance_at(opened).amount, Decimal("100.00"))
+        self.assertEqual(s.balance_at(datetime(3000, 1, 1)).amount, Decimal("150.00"))
+        self.assertEqual(s.balance_at(datetime(1999, 1, 1)).amount, Decimal("0.00"))
+        window = s.transactions_between(datetime(2998, 1, 1), datetime(2999, 1, 1))
+        self.assertEqual([t.description for t in window], ["deposit"])
@@ -19,3 +19,25 @@ class TestMoney(unittest.TestCase):
         m = Money(Decimal("1.20"), "INR")
         self.assertIn("INR", repr(m))
         self.assertIn("1.20", str(m))
+
+    def test_minor_units_and_rounding(self):
+        m = Money(Decimal("10.345"), "INR")
+        self.assertEqual(m.minor, 1035)
+        self.assertEqual(m.amount, Decimal("10.35"))
+        self.assertEqual(Money(7, "USD").minor, 700)
+        self.assertEqual(Money(Decimal("99.5"), "JPY").minor, 100)
+
+    def test_from_minor_and_negation(self):
+        m = Money.from_minor(-2000, "INR")
+        self.assertEqual(m.amount, Decimal("-20.00"))
+        self.assertEqual(-m, Money(Decimal("20.00"), "INR"))
+
+    def test_immutable_and_hashable(self):
+        m = Money(Decimal("1.00"))
+        with self.assertRaises(AttributeError):
+            m.minor = 5  # type: ignore[misc]
+        self.assertEqual(len({m, Money(Decimal("1.00"))}), 1)
+
+    def test_compare_diff_currency_raises(self):
+        with self.assertRaises(CurrencyMismatchError):
+            _ = Money(Decimal("1.00"), "INR") < Money(Decimal("2.00"), "USD")
@@ -0,0 +1,85 @@
+import tempfile
+import unittest
+from decimal import Decimal
+from bank_oop.money import Money
+from bank_oop.accounts import SavingsAccount, CheckingAccount
+from bank_oop.persistence import BankStore
+from bank_oop.strategies import SimpleInterestStrategy
+
+def _state(bank):
+    return {a.id: (a.balance, list(a.ledger)) for a in bank._accounts.values()}
+
+class TestPersistence(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _populate(self, bank):
+        bank.add_account(SavingsAccount("S1", "Asha", Money(Decimal("100.00")), interest_rate=6.0))
+        bank.add_account(CheckingAccount("C1", "Raj", Money(Decimal("10.00")), overdraft_limit=Money(Decimal("50.00"))))
+        bank.deposit("S1", Money(Decimal("25.00")))
+        bank.transfer("C1", "S1", Money(Decimal("30.00")))
+
+    def test_recover_from_journal_only(self):
+        store = BankStore(self.tmp.name, batch_size=2)
+        bank = store.open()
+        self._populate(bank)
+        store.close()
+        restored = BankStore(self.tmp.name).open()
+        self.assertEqual(_state(restored), _state(bank))
+        self.assertEqual(restored.get("C1").balance.amount, Decimal("-20.00"))
+        self.assertEqual(restored.total_assets(), bank.total_assets())
+
+    def test_journal_keeps_history_of_accounts_added_with_ledgers(self):
+        import io
+        from bank_oop.bank import Bank
+        from bank_oop.bulk import export_binary, load_binary
+        source = Bank()
+        self._populate(source)
+        blob = io.BytesIO()
+        export_binary(source, blob)
+        store = BankStore(self.tmp.name)
+        bank = store.open()
+        load_binary(io.BytesIO(blob.getvalue()), bank)
+        used = SavingsAccount("S2", "Mira", Money(Decimal("5.00")), interest_rate=4.0)
+        used.deposit(Money(Decimal("1.00")))  # history before add_account
+        bank.add_account(used)
+        store.close()
+        restored = BankStore(self.tmp.name).open()
+        self.assertEqual(len(restored.get("S1").ledger), 3)
+        self.assertEqual(_state(restored), _state(bank))
+        self.assertEqual(restored.get("S2")._updated_us, used._updated_us)
+
+    def test_recover_from_snapshot_plus_tail(self):
+        store = BankStore(self.tmp.name)
+        bank = store.open()
+        self._populate(bank)
+        store.snapshot(bank)
+        bank.monthly_process(SimpleInterestStrategy())
+        bank.withdraw("S1", Money(Decimal("1.00")))
+        store.close()
+        store2 = BankStore(self.tmp.name)
+        restored = store2.open(consistency_check=True)
+        self.assertEqual(_state(restored), _state(bank))
+        self.assertEqual(restored.total_assets(), bank.total_assets())
+        # keeps journaling after recovery
+        restored.deposit("C1", Money(Decimal("5.00")))
+        store2.close()
+        again = BankStore(self.tmp.name).open()
+        self.assertEqual(again.get("C1").balance.amount, Decimal("-15.00"))
+
+    def test_recovers_twice_after_a_torn_tail(self):
+        store = BankStore(self.tmp.name)
+        bank = store.open()
+        self._populate(bank)
+        store.close()
+        with open(store.journal_path, "a", encoding="utf-8") as fh:
+            fh.write('{"e":"post","id":"S1","d":9')  # crash mid-write
+        store = BankStore(self.tmp.name)
+        bank = store.open()
+        bank.deposit("S1", Money(Decimal("10.00")))
+        bank.deposit("S1", Money(Decimal("20.00")))
+        store.close()
+        restored = BankStore(self.tmp.name).open()
+        self.assertEqual(restored.get("S1").balance.amount, Decimal("185.00"))
+        self.assertEqual(_state(restored), _state(bank))
@@ -0,0 +1,74 @@
+import io
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from bank_oop.money import Money
+from bank_oop.transactions import Transaction
+from bank_oop.accounts import SavingsAccount, CheckingAccount
+from bank_oop.serialization import (to_dict, from_dict, dump_ndjson, load_ndjson, dump_binary, load_binary,
+                                   Serializer, find_serializer, register_serializer)
+from bank_oop.exceptions import InvalidOperationError
+
+def _same_account(tc, a, b):
+    tc.assertIs(type(a), type(b))
+    tc.assertEqual((a.id, a.owner, a.balance), (b.id, b.owner, b.balance))
+    tc.assertEqual(list(a.ledger), list(b.ledger))
+
+class TestSerialization(unittest.TestCase):
+    def setUp(self):
+        self.sav = SavingsAccount("S1", "Asha", Money(Decimal("100.00")), interest_rate=6.5)
+        self.chk = CheckingAccount("C1", "Raj", Money(Decimal("10.00")), overdraft_limit=Money(Decimal("50.00")))
+        self.chk.transfer(self.sav, Money(Decimal("30.00")))
+
+    def test_value_round_trip(self):
+        m = Money(Decimal("12.34"), "USD")
+        self.assertEqual(from_dict(to_dict(m)), m)
+        t = Transaction(m, datetime(2025, 1, 2, 3, 4, 5, 6), "deposit")
+        self.assertEqual(from_dict(to_dict(t)), t)
+
+    def test_account_json_round_trip(self):
+        restored = SavingsAccount.from_json(self.sav.to_json())
+        _same_account(self, restored, self.sav)
+        self.assertEqual(restored.interest_rate, Decimal("6.5"))
+        self.assertEqual(restored.created_at, self.sav.created_at)
+        restored = CheckingAccount.from_json(self.chk.to_json())
+        _same_account(self, restored, self.chk)
+        self.assertEqual(restored.balance, Money(Decimal("-20.00")))
+        self.assertEqual(restored.overdraft_limit, self.chk.overdraft_limit)
+
+    def test_ndjson_stream(self):
+        buf = io.StringIO()
+        self.assertEqual(dump_ndjson([self.sav, self.chk, Money(5)], buf), 3)
+        buf.seek(0)
+        sav, chk, money = list(load_ndjson(buf))
+        _same_account(self, sav, self.sav)
+        _same_account(self, chk, self.chk)
+        self.assertEqual(money, Money(5))
+
+    def test_binary_stream(self):
+        buf = io.BytesIO()
+        dump_binary([self.sav, Money(7), self.chk], buf)
+        buf.seek(0)
+        sav, money, chk = list(load_binary(buf))
+        _same_account(self, sav, self.sav)
+        _same_account(self, chk, self.chk)
+        self.assertEqual(money, Money(7))
+
+    def test_from_json_checks_the_decoded_type(self):
+        with self.assertRaises(InvalidOperationError):
+            SavingsAccount.from_json(self.chk.to_json())
+
+    def test_subclasses_need_their_own_serializer(self):
+        class PremiumSavings(SavingsAccount):
+            __slots__ = ()
+
+        acct = PremiumSavings("P1", "Vik", Money(Decimal("10.00")), interest_rate=7.0)
+        with self.assertRaises(InvalidOperationError):
+            acct.to_json()
+        register_serializer(Serializer(PremiumSavings, "premium", [("id", "_id", None)],
+                                       lambda d: PremiumSavings(d["id"], "Vik", Money(Decimal("10.00")), 7.0)))
+        self.assertIs(find_serializer(PremiumSavings).cls, PremiumSavings)
+        self.assertEqual(PremiumSavings.from_json(acct.to_json()).id, "P1")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import io
+import unittest
+from decimal import Decimal
+from bank_oop.money import Money
+from bank_oop.accounts import SavingsAccount
+from bank_oop.ledger import from_epoch_us
+from bank_oop.statements import statement_lines, opening_balance, write_statement_csv, write_statement_text
+
+class TestStatements(unittest.TestCase):
+    def setUp(self):
+        self.acct = SavingsAccount("S1", "Asha", Money(Decimal("100.00")), interest_rate=6.0)
+        # deterministic timestamps: one entry per second after the opening entry
+        base = self.acct.ledger.timestamps[0]
+        for i in range(1, 3001):
+            self.acct._post_minor(100 if i % 3 else -50, "deposit" if i % 3 else "withdraw", base + i * 1_000_000)
+        self.ts = lambda i: from_epoch_us(base + i * 1_000_000)
+
+    def test_running_balance_matches_ledger(self):
+        lines = list(statement_lines(self.acct))
+        self.assertEqual(len(lines), len(self.acct.ledger))
+        self.assertEqual(lines[-1].balance, self.acct.balance)
+        self.assertEqual(lines[0].description, "opening_balance")
+
+    def test_period_filter(self):
+        lines = list(statement_lines(self.acct, start=self.ts(2000), end=self.ts(2009)))
+        self.assertEqual(len(lines), 10)
+        self.assertEqual(lines[0].timestamp, self.ts(2000))
+        self.assertEqual(opening_balance(self.acct, self.ts(2000)), self.acct.balance_at(self.ts(1999)))
+        self.assertEqual(lines[-1].balance, self.acct.balance_at(self.ts(2009)))
+
+    def test_writers_stream(self):
+        out = io.StringIO()
+        self.assertEqual(write_statement_csv(self.acct, out, start=self.ts(1), end=self.ts(3)), 3)
+        rows = out.getvalue().splitlines()
+        self.assertEqual(rows[0], "timestamp,description,amount,balance")
+        self.assertTrue(rows[-1].endswith(",withdraw,-0.50,101.50"))
+        out = io.StringIO()
+        write_statement_text(self.acct, out, start=self.ts(1), end=self.ts(3))
+        self.assertIn("Opening balance: INR 100.00", out.getvalue())
+        self.assertIn("Closing balance: INR 101.50", out.getvalue())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,3 +14,23 @@ class TestStrategies(unittest.TestCase):
         # Savings should grow, checking unchanged
         assert s.balance.amount == Decimal("100.50")
         assert c.balance.amount == Decimal("100.00")
+
+    def test_overridden_apply_month_end_is_called_for_every_account(self):
+        from bank_oop.bank import Bank
+
+        class Flat(SimpleInterestStrategy):
+            def __init__(self):
+                self.calls = 0
+
+            def apply_month_end(self, account):
+                self.calls += 1
+                account.deposit(Money(Decimal("1.00")))
+
+        bank = Bank()
+        bank.add_account(SavingsAccount("S1", "Asha", Money(Decimal("100.00")), interest_rate=6.0))
+        bank.add_account(CheckingAccount("C1", "Raj", Money(Decimal("100.00")), overdraft_limit=Money(Decimal("50.00"))))
+        for workers in (1, 2):
+            strat = Flat()
+            bank.monthly_process(strat, workers=workers)
+            assert strat.calls == 2
+        assert bank.get("S1").balance.amount == Decimal("102.00")
@@ -1,4 +1,15 @@
+import zlib
 from decimal import Decimal, ROUND_HALF_UP
 
 def quantize_2(amount: Decimal) -> Decimal:
     return amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+def stable_bucket(key: str, buckets: int) -> int:
+    """Bucket for a string key that is identical across processes and runs (unlike hash())."""
+    return zlib.crc32(key.encode()) % buckets
+
+def round_half_up_div(n: int, d: int) -> int:
+    """n / d rounded half away from zero, in exact integer maths (d > 0)."""
+    if n >= 0:
+        return (2 * n + d) // (2 * d)
+    return -((-2 * n + d) // (2 * d))
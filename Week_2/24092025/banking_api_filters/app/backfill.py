@@ -0,0 +1,68 @@
+"""Backfill opening ledger rows for balances that predate the transaction ledger.
+
+Every balance change now writes a ``completed`` Transaction row, so an
+account's balance equals the sum of its completed transactions. Accounts
+whose balance was set before that (or seeded directly) get one
+"Opening balance" row for the difference, dated just before their earliest
+transaction. Safe to re-run: reconciled accounts are skipped.
+
+    python -m app.backfill
+"""
+from datetime import datetime, timedelta
+from sqlalchemy import func, insert, select # type: ignore
+from sqlalchemy.orm import Session # type: ignore
+from .database import SessionLocal
+from .models.account import Account
+from .models.transaction import Transaction
+
+OPENING_DESCRIPTION = "Opening balance"
+BATCH_SIZE = 1000
+TOLERANCE = 1e-9
+
+def backfill_opening_balances(db: Session, batch_size: int = BATCH_SIZE) -> int:
+    """Insert the missing opening rows; returns how many accounts were backfilled."""
+    completed = (
+        select(
+            Transaction.account_id,
+            func.sum(Transaction.amount).label("total"),
+            func.min(Transaction.date).label("first"),
+        )
+        .where(Transaction.status == "completed")
+        .group_by(Transaction.account_id)
+        .subquery()
+    )
+    # One aggregate pass over the ledger, joined to accounts, streamed in batches
+    query = (
+        select(Account.id, Account.balance, completed.c.total, completed.c.first)
+        .outerjoin(completed, completed.c.account_id == Account.id)
+        .order_by(Account.id)
+    )
+    now = datetime.utcnow()
+    count = 0
+    result = db.execute(query.execution_options(yield_per=batch_size))
+    # Each partition's inserts only touch accounts already read, so writing
+    # while the cursor is open cannot change the rows still to come
+    for partition in result.partitions():
+        rows = [
+            {
+                "account_id": account_id,
+                "amount": balance - (total or 0.0),
+                "status": "completed",
+                "date": first - timedelta(microseconds=1) if first else now,
+                "description": OPENING_DESCRIPTION,
+            }
+            for account_id, balance, total, first in partition
+            if abs(balance - (total or 0.0)) > TOLERANCE
+        ]
+        if rows:
+            db.execute(insert(Transaction.__table__), rows)
+            count += len(rows)
+    db.commit()
+    return count
+
+if __name__ == "__main__":
+    session = SessionLocal()
+    try:
+        print(f"Backfilled {backfill_opening_balances(session)} account(s)")
+    finally:
+        session.close()
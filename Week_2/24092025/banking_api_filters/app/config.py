@@ -3,6 +3,8 @@ from pydantic_settings import BaseSettings, SettingsConfigDict # type: ignore
 class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///./bank.db"
     APP_NAME: str = "Personal Banking API"
+    # How long an Idempotency-Key and its stored response are kept
+    IDEMPOTENCY_TTL_SECONDS: int = 24 * 60 * 60
     model_config = SettingsConfigDict(env_file=".env", env_ignore_empty=True)
 
 settings = Settings()
@@ -7,6 +7,11 @@ engine = create_engine(settings.DATABASE_URL, connect_args=connect_args)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# Session.info flag: while set, repositories flush their writes but leave the
+# commit to the caller, which can then add rows of its own (e.g. a stored
+# idempotent response) to the same transaction.
+DEFER_COMMIT = "defer_commit"
+
 def get_db():
     db = SessionLocal()
     try:
@@ -1,7 +1,10 @@
 from fastapi import FastAPI # type: ignore
 from .routers.account_router import router as account_router
-from .database import Base, engine
+from .database import Base, SessionLocal, engine
 from .config import settings
+from .metrics import concurrency_metrics
+from .migrations import run_migrations
+from .repositories.idempotency_repository import IdempotencyRepository
 from app.routers import scheduled_payment
 
 app = FastAPI(title=settings.APP_NAME)
@@ -11,6 +14,14 @@ app.include_router(scheduled_payment.router, tags=["Scheduled Payments"])
 def on_startup():
     # Auto-create tables (for demo convenience)
     Base.metadata.create_all(bind=engine)
+    # Bring databases created by older versions up to the current schema
+    run_migrations(engine)
+    # Drop Idempotency-Keys older than the TTL (also swept periodically while running)
+    db = SessionLocal()
+    try:
+        IdempotencyRepository(db).purge_expired(settings.IDEMPOTENCY_TTL_SECONDS)
+    finally:
+        db.close()
 
 @app.get("/")
 def root():
@@ -18,6 +29,11 @@ def root():
 
 app.include_router(account_router)
 
+@app.get("/metrics/concurrency")
+def concurrency_stats():
+    """Optimistic-concurrency counters: operations, retries, conflicts (409s) and their rates."""
+    return concurrency_metrics.snapshot()
+
 
 # === API Versioning: minimal additive change ===
 # New: mount the existing routers under /api/v1 while keeping backward-compatible routes.
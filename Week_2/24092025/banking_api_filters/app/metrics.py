@@ -0,0 +1,33 @@
+import threading
+from typing import Dict
+
+class ConcurrencyMetrics:
+    """Thread-safe counters for optimistic-concurrency retries."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {"operations": 0, "retries": 0, "conflicts": 0}
+
+    def record(self, retries: int, conflict: bool = False) -> None:
+        with self._lock:
+            self._counts["operations"] += 1
+            self._counts["retries"] += retries
+            if conflict:
+                self._counts["conflicts"] += 1
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            counts = dict(self._counts)
+        ops = counts["operations"]
+        return {
+            **counts,
+            "retry_rate": counts["retries"] / ops if ops else 0.0,
+            "conflict_rate": counts["conflicts"] / ops if ops else 0.0,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            for key in self._counts:
+                self._counts[key] = 0
+
+concurrency_metrics = ConcurrencyMetrics()
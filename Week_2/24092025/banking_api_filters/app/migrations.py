@@ -0,0 +1,62 @@
+"""Minimal schema migrations.
+
+``Base.metadata.create_all`` creates missing tables but never alters existing
+ones, so columns/indexes added after a database was created are applied here.
+Each migration runs once and is recorded in ``schema_migrations``; migrations
+must also be no-ops on a fresh database that ``create_all`` already built.
+"""
+from typing import Callable, List, Tuple
+from sqlalchemy import inspect, text # type: ignore
+from sqlalchemy.engine import Connection, Engine # type: ignore
+from .models.transaction import Transaction
+
+def _columns(conn: Connection, table: str) -> set:
+    inspector = inspect(conn)
+    if not inspector.has_table(table):
+        return set()  # create_all will build it with every column
+    return {c["name"] for c in inspector.get_columns(table)}
+
+def _add_account_version(conn: Connection) -> None:
+    columns = _columns(conn, "accounts")
+    if columns and "version" not in columns:
+        conn.execute(text("ALTER TABLE accounts ADD COLUMN version INTEGER NOT NULL DEFAULT 1"))
+
+def _transaction_listing_indexes(conn: Connection) -> None:
+    if not inspect(conn).has_table("transactions"):
+        return
+    # The single-column status/date indexes never serve an account-scoped listing;
+    # the composite ones replace them.
+    conn.execute(text("DROP INDEX IF EXISTS ix_transactions_status"))
+    conn.execute(text("DROP INDEX IF EXISTS ix_transactions_date"))
+    for index in Transaction.__table__.indexes:
+        index.create(conn, checkfirst=True)
+
+def _transaction_date_fractions(conn: Connection) -> None:
+    # Rows dated by SQLite's CURRENT_TIMESTAMP lack the ".ffffff" that SQLAlchemy
+    # writes, so they compare out of order against cursor bounds on date.
+    if conn.dialect.name != "sqlite" or not inspect(conn).has_table("transactions"):
+        return
+    conn.execute(text("UPDATE transactions SET date = date || '.000000' WHERE length(date) = 19"))
+
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "accounts.version for optimistic concurrency", _add_account_version),
+    (2, "composite indexes for transaction listing", _transaction_listing_indexes),
+    (3, "uniform text form for SQLite transaction dates", _transaction_date_fractions),
+]
+
+def run_migrations(engine: Engine) -> List[int]:
+    """Apply pending migrations in order; returns the ids applied."""
+    applied: List[int] = []
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations (id INTEGER PRIMARY KEY, description VARCHAR NOT NULL)"
+        ))
+        done = {row[0] for row in conn.execute(text("SELECT id FROM schema_migrations"))}
+        for migration_id, description, apply in MIGRATIONS:
+            if migration_id in done:
+                continue
+            apply(conn)
+            conn.execute(text("INSERT INTO schema_migrations (id, description) VALUES (:id, :d)"),
+                         {"id": migration_id, "d": description})
+            applied.append(migration_id)
+    return applied
@@ -8,3 +8,8 @@ class Account(Base):
     balance = Column(Float, default=0.0, nullable=False)
     # To handle KYC compliance status
     kyc_compliant = Column(Boolean, default=False, nullable=False)
+    # Optimistic concurrency: bumped on every write; ORM updates only match the
+    # version they read (UPDATE ... WHERE id = ? AND version = ?).
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
+    __mapper_args__ = {"version_id_col": version}
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime # type: ignore
+from ..database import Base
+
+class IdempotencyKey(Base):
+    __tablename__ = "idempotency_keys"
+    # The client's key is the primary key: one indexed lookup per request
+    key = Column(String, primary_key=True)
+    fingerprint = Column(String, nullable=False)  # sha256 of method, path and body
+    status_code = Column(Integer, nullable=True)  # only NULL on rows left by older versions; treated as free
+    response_body = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, index=True)
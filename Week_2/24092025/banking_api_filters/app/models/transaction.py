@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey # type: ignore
+from datetime import datetime
+from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Index # type: ignore
 from sqlalchemy.sql import func # type: ignore
 from ..database import Base
 
@@ -7,6 +8,20 @@ class Transaction(Base):
     id = Column(Integer, primary_key=True, index=True)
     account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False, index=True)
     amount = Column(Float, nullable=False)
-    status = Column(String, nullable=False, index=True)  # e.g., 'completed', 'pending', 'failed'
-    date = Column(DateTime, nullable=False, server_default=func.now(), index=True)
+    status = Column(String, nullable=False)  # e.g., 'completed', 'pending', 'failed'
+    # Set in Python so every stored value has the same text form as a cursor's bound
+    # date (SQLite's CURRENT_TIMESTAMP has no fraction and sorts before it).
+    date = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
     description = Column(String, nullable=True)
+
+    # Listing is always WHERE account_id = ? [AND status = ?] ORDER BY <sort>, id.
+    # One index per (filter, sort) shape lets SQLite filter and walk rows already
+    # in order (either direction), so no temporary sort is needed; the
+    # account_id index above serves sortBy=id without a status filter.
+    __table_args__ = (
+        Index("ix_transactions_account_date", "account_id", "date", "id"),
+        Index("ix_transactions_account_status_date", "account_id", "status", "date", "id"),
+        Index("ix_transactions_account_amount", "account_id", "amount", "id"),
+        Index("ix_transactions_account_status_amount", "account_id", "status", "amount", "id"),
+        Index("ix_transactions_account_status", "account_id", "status", "id"),
+    )
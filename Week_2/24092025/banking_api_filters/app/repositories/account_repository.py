@@ -1,8 +1,15 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
 from fastapi import Depends # type: ignore
+from sqlalchemy import bindparam, insert, update # type: ignore
 from sqlalchemy.orm import Session # type: ignore
-from ..database import get_db
+from sqlalchemy.orm.exc import StaleDataError # type: ignore
+from ..database import DEFER_COMMIT, get_db
 from ..models.account import Account
+from ..models.transaction import Transaction
+
+# (account_id, signed amount, description)
+LedgerEntry = Tuple[int, float, str]
 
 class AccountRepository:
     def __init__(self, db: Session = Depends(get_db)):
@@ -25,24 +32,174 @@ class AccountRepository:
         self.db.refresh(account)
         return account
 
+    def _change_balance(self, account_id: int, delta: float) -> Optional[Account]:
+        """Single conditional UPDATE ... RETURNING; does not commit.
+
+        Debits only match while the balance covers them, so concurrent
+        withdrawals cannot overdraw. Returns None if no row matched.
+        """
+        stmt = (
+            update(Account)
+            .where(Account.id == account_id)
+            .values(balance=Account.balance + delta, version=Account.version + 1)
+            .returning(Account)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        if delta < 0:
+            stmt = stmt.where(Account.balance >= -delta)
+        return self.db.execute(stmt).scalar_one_or_none()
+
+    def _append_ledger(self, entries: Iterable[LedgerEntry]) -> None:
+        """Insert one completed Transaction row per entry in the current transaction; does not commit.
+
+        A single multi-row INSERT, so a transfer's two legs (or a whole batch)
+        cost one statement.
+        """
+        now = datetime.utcnow()
+        rows = [
+            {"account_id": account_id, "amount": amount, "status": "completed", "date": now, "description": description}
+            for account_id, amount, description in entries
+        ]
+        if rows:
+            self.db.execute(insert(Transaction.__table__), rows)
+
+    def _commit_detached(self, *accounts: Optional[Account]) -> None:
+        # RETURNING already gave us the committed values; detaching keeps them
+        # loaded instead of expiring them and re-SELECTing on first access.
+        for acct in accounts:
+            if acct is not None:
+                self.db.expunge(acct)
+        if not self.db.info.get(DEFER_COMMIT):
+            self.db.commit()
+
+    def _exists(self, account_id: int) -> bool:
+        return self.db.query(Account.id).filter(Account.id == account_id).first() is not None
+
+    def deposit(self, account_id: int, amount: float) -> Optional[Account]:
+        """Atomically credit ``amount``; returns the updated account or None if not found."""
+        acct = self._change_balance(account_id, amount)
+        if acct is not None:
+            self._append_ledger([(account_id, amount, "Deposit")])
+        self._commit_detached(acct)
+        return acct
+
+    def withdraw(self, account_id: int, amount: float) -> Optional[Account]:
+        """Atomically debit ``amount`` if funds allow; None if not found, ValueError if insufficient."""
+        acct = self._change_balance(account_id, -amount)
+        if acct is None:
+            self.db.rollback()
+            if self._exists(account_id):
+                raise ValueError("Insufficient funds")
+            return None
+        self._append_ledger([(account_id, -amount, "Withdrawal")])
+        self._commit_detached(acct)
+        return acct
+
     def transfer_atomic(self, from_id: int, to_id: int, amount: float):
         if amount <= 0:
             raise ValueError("Transfer amount must be positive")
-        from_acct = self.get_by_id(from_id)
-        to_acct = self.get_by_id(to_id)
-        if not from_acct or not to_acct:
-            raise ValueError("Source or destination account not found")
-        if from_acct.id == to_acct.id:
+        if from_id == to_id:
             raise ValueError("Cannot transfer to the same account")
-        if from_acct.balance < amount:
-            raise ValueError("Insufficient funds in source account")
-        # Perform updates atomically using the same session/commit
-        from_acct.balance -= amount
-        to_acct.balance += amount
-        self.db.add(from_acct); self.db.add(to_acct)
+        # Both conditional updates run in one transaction, in ascending id order
+        # (a consistent lock order for databases with row locks).
+        deltas = {from_id: -amount, to_id: amount}
+        updated = {}
+        for account_id in sorted(deltas):
+            acct = self._change_balance(account_id, deltas[account_id])
+            if acct is None:
+                self.db.rollback()
+                if not self._exists(from_id) or not self._exists(to_id):
+                    raise ValueError("Source or destination account not found")
+                raise ValueError("Insufficient funds in source account")
+            updated[account_id] = acct
+        self._append_ledger([
+            (from_id, -amount, f"Transfer to account {to_id}"),
+            (to_id, amount, f"Transfer from account {from_id}"),
+        ])
+        self._commit_detached(*updated.values())
+        return updated[from_id], updated[to_id]
+
+    def apply_postings(self, ops) -> List[dict]:
+        """Apply many deposit/withdraw/transfer operations in one transaction.
+
+        Affected rows are read (and locked, on databases that support
+        SELECT ... FOR UPDATE) in ascending id order, every operation is applied
+        in order against those balances, and all changed balances are written
+        with one executemany UPDATE, and their ledger rows with one INSERT. An
+        operation that fails validation is reported in its result and skipped;
+        the others still apply.
+
+        The UPDATE is compare-and-swap on the versions read (SQLite ignores
+        FOR UPDATE): if another writer changed an account in between,
+        StaleDataError is raised before anything is committed, for the caller
+        to roll back and retry.
+        """
+        ids = set()
+        for op in ops:
+            ids.add(op.account_id)
+            if op.to_account_id is not None:
+                ids.add(op.to_account_id)
+        rows = (
+            self.db.query(Account.id, Account.balance, Account.version)
+            .filter(Account.id.in_(ids))
+            .order_by(Account.id)
+            .with_for_update()
+            .all()
+        )
+        balances: Dict[int, float] = {row.id: row.balance for row in rows}
+        versions: Dict[int, int] = {row.id: row.version for row in rows}
+        changed = set()
+        entries: List[LedgerEntry] = []
+        results: List[dict] = []
+        for index, op in enumerate(ops):
+            error = self._posting_error(op, balances)
+            if error:
+                results.append({"index": index, "ok": False, "error": error})
+                continue
+            if op.type == "deposit":
+                balances[op.account_id] += op.amount
+                touched = [op.account_id]
+                entries.append((op.account_id, op.amount, "Deposit"))
+            elif op.type == "withdraw":
+                balances[op.account_id] -= op.amount
+                touched = [op.account_id]
+                entries.append((op.account_id, -op.amount, "Withdrawal"))
+            else:
+                balances[op.account_id] -= op.amount
+                balances[op.to_account_id] += op.amount
+                touched = [op.account_id, op.to_account_id]
+                entries.append((op.account_id, -op.amount, f"Transfer to account {op.to_account_id}"))
+                entries.append((op.to_account_id, op.amount, f"Transfer from account {op.account_id}"))
+            changed.update(touched)
+            results.append({"index": index, "ok": True, "balances": [balances[i] for i in touched]})
+        if changed:
+            table = Account.__table__
+            stmt = (
+                update(table)
+                .where(table.c.id == bindparam("_id"), table.c.version == bindparam("_version"))
+                .values(balance=bindparam("_balance"), version=table.c.version + 1)
+            )
+            params = [{"_id": i, "_version": versions[i], "_balance": balances[i]} for i in sorted(changed)]
+            if self.db.execute(stmt, params).rowcount != len(params):
+                raise StaleDataError("An account in the batch was modified concurrently")
+        self._append_ledger(entries)
         self.db.commit()
-        self.db.refresh(from_acct); self.db.refresh(to_acct)
-        return from_acct, to_acct
+        return results
+
+    @staticmethod
+    def _posting_error(op, balances: Dict[int, float]) -> Optional[str]:
+        if op.amount <= 0:
+            return "Amount must be positive"
+        if op.account_id not in balances:
+            return "Account not found"
+        if op.type == "transfer":
+            if op.to_account_id is None or op.to_account_id not in balances:
+                return "Destination account not found"
+            if op.to_account_id == op.account_id:
+                return "Cannot transfer to the same account"
+        if op.type in ("withdraw", "transfer") and balances[op.account_id] < op.amount:
+            return "Insufficient funds"
+        return None
 
     def set_kyc_flag(self, account_id: int, value: bool):
         """Update the kyc_compliant flag; returns Account or None if not found."""
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import update # type: ignore
+from sqlalchemy.exc import IntegrityError # type: ignore
+from sqlalchemy.orm import Session # type: ignore
+from ..models.idempotency_key import IdempotencyKey
+
+class IdempotencyRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, key: str) -> Optional[IdempotencyKey]:
+        return self.db.get(IdempotencyKey, key)
+
+    def save(self, key: str, fingerprint: str, status_code: int, response_body: str,
+             replaces: Optional[datetime] = None) -> bool:
+        """Store the response and commit it together with the session's pending writes.
+
+        ``replaces`` is the ``created_at`` of an existing (expired or abandoned)
+        row to overwrite; the row is only replaced if it is still that one.
+        Returns False, with everything rolled back, if another request stored
+        the key first.
+        """
+        values = dict(fingerprint=fingerprint, status_code=status_code,
+                      response_body=response_body, created_at=datetime.utcnow())
+        try:
+            if replaces is None:
+                self.db.add(IdempotencyKey(key=key, **values))
+            else:
+                # Compare-and-swap on created_at: of two requests reclaiming the
+                # same row, only the first one's UPDATE matches.
+                result = self.db.execute(
+                    update(IdempotencyKey)
+                    .where(IdempotencyKey.key == key, IdempotencyKey.created_at == replaces)
+                    .values(**values)
+                )
+                if result.rowcount != 1:
+                    self.db.rollback()
+                    return False
+            self.db.commit()
+            return True
+        except IntegrityError:
+            self.db.rollback()
+            return False
+
+    def purge_expired(self, ttl_seconds: int) -> int:
+        cutoff = datetime.utcnow() - timedelta(seconds=ttl_seconds)
+        deleted = self.db.query(IdempotencyKey).filter(IdempotencyKey.created_at < cutoff).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted
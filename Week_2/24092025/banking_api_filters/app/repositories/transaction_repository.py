@@ -1,55 +1,128 @@
-from typing import List, Optional, Tuple
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
 from sqlalchemy.orm import Session # type: ignore
-from sqlalchemy import desc, asc # type: ignore
+from sqlalchemy import desc, asc, literal, tuple_ # type: ignore
 from ..models.transaction import Transaction
 
 MAX_LIMIT = 100
 
-def list_by_account(
+COLUMN_MAP = {
+    "date": Transaction.date,
+    "amount": Transaction.amount,
+    "id": Transaction.id,
+    "status": Transaction.status,
+}
+
+def parse_sort(sort_by: Optional[str]) -> Tuple[str, str]:
+    """Return (field, direction) for a 'field:direction' string; defaults to date:desc."""
+    if not sort_by:
+        return "date", "desc"
+    try:
+        field, direction = sort_by.split(":")
+        field = field.strip().lower()
+        direction = direction.strip().lower()
+    except ValueError:
+        field, direction = sort_by.strip().lower(), "asc"
+    if field not in COLUMN_MAP:
+        field = "date"
+    return field, "desc" if direction == "desc" else "asc"
+
+def _filtered(db: Session, account_id: int, status: Optional[str]):
+    # Finding all the records for a specific account
+    query = db.query(Transaction).filter(Transaction.account_id == account_id)
+
+    # Filtering
+    if status:
+        # Only show transactions with a specific status. or even you will consider type as international or domestic
+        query = query.filter(Transaction.status == status)
+    return query
+
+def _ordered(query, field: str, direction: str):
+    # Sort column plus id as a unique tie-breaker, both in the same direction,
+    # so every row has a stable position that a cursor can point at.
+    order = desc if direction == "desc" else asc
+    if field == "id":
+        return query.order_by(order(Transaction.id))
+    return query.order_by(order(COLUMN_MAP[field]), order(Transaction.id))
+
+# ---- cursors ----------------------------------------------------------------
+# A cursor is the (sort value, id) of the last row on a page, plus the sort it
+# belongs to, as url-safe base64 JSON. Clients treat it as opaque.
+
+def encode_cursor(row: Transaction, field: str, direction: str) -> str:
+    value: Any = getattr(row, field)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([field, direction, value, row.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, field: str, direction: str) -> Tuple[Any, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        c_field, c_dir, value, last_id = json.loads(base64.urlsafe_b64decode(padded))
+        if field == "date":
+            value = datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if (c_field, c_dir) != (field, direction):
+        raise ValueError("Cursor does not match the requested sortBy")
+    return value, int(last_id)
+
+def _after(query, field: str, direction: str, value: Any, last_id: int, status: Optional[str] = None):
+    # Rows strictly after (value, last_id) in the page order: an index range scan, not an offset.
+    # A row-value comparison, unlike the equivalent OR, is planned as one range on the
+    # (account_id, [status,] field, id) index, so the rows still come out in order.
+    # Sorting by the filtered status leaves only id varying, so compare on id alone.
+    if field == "id" or (field == "status" and status):
+        return query.filter(Transaction.id < last_id if direction == "desc" else Transaction.id > last_id)
+    key = tuple_(COLUMN_MAP[field], Transaction.id)
+    bound = tuple_(literal(value, COLUMN_MAP[field].type), literal(last_id))
+    return query.filter(key < bound if direction == "desc" else key > bound)
+
+def list_page_by_account(
     db: Session,
     account_id: int,
     status: Optional[str] = None,
     sort_by: Optional[str] = None,
     page: int = 1,
     limit: int = 25,
-) -> List[Transaction]:
+    cursor: Optional[str] = None,
+) -> Tuple[List[Transaction], Optional[str]]:
+    """One page of transactions and the cursor for the next page (None on the last page).
+
+    With ``cursor`` the page starts right after the row it encodes and ``page``
+    is ignored, so every page costs the same regardless of depth.
+    """
     # Enforce sensible pagination defaults & caps
     if limit is None:
         limit = 25
     limit = max(1, min(limit, MAX_LIMIT))
     page = max(1, page)
-    offset = (page - 1) * limit
-
-    # Finding all the records for a specific account
-    query = db.query(Transaction).filter(Transaction.account_id == account_id)
 
-    # Filtering
-    if status:
-        # Only show transactions with a specific status. or even you will consider type as international or domestic
-        query = query.filter(Transaction.status == status)
+    field, direction = parse_sort(sort_by)
+    query = _filtered(db, account_id, status)
+    if cursor:
+        value, last_id = decode_cursor(cursor, field, direction)
+        query = _after(query, field, direction, value, last_id, status)
+    query = _ordered(query, field, direction)
+    if not cursor and page > 1:
+        query = query.offset((page - 1) * limit)
+    # Pagination: one extra row tells us whether a next page exists
+    rows = query.limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1], field, direction)
+    return rows, None
 
-    # Sorting
-    # Expected format: field:direction (e.g., "date:desc", "amount:asc")
-    sort_col = Transaction.date
-    sort_dir = desc
-    if sort_by:
-        try:
-            field, direction = sort_by.split(":")
-            field = field.strip().lower()
-            direction = direction.strip().lower()
-        except ValueError:
-            field, direction = sort_by.strip().lower(), "asc"
-
-        column_map = {
-            "date": Transaction.date,
-            "amount": Transaction.amount,
-            "id": Transaction.id,
-            "status": Transaction.status,
-        }
-        sort_col = column_map.get(field, Transaction.date)
-        sort_dir = desc if direction == "desc" else asc
-
-    query = query.order_by(sort_dir(sort_col))
-
-    # Pagination
-    return query.offset(offset).limit(limit).all()
+def list_by_account(
+    db: Session,
+    account_id: int,
+    status: Optional[str] = None,
+    sort_by: Optional[str] = None,
+    page: int = 1,
+    limit: int = 25,
+) -> List[Transaction]:
+    rows, _ = list_page_by_account(db, account_id, status, sort_by, page, limit)
+    return rows
@@ -1,10 +1,12 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException # type: ignore
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException # type: ignore
+from fastapi.responses import JSONResponse # type: ignore
 from pydantic import BaseModel # type: ignore
-from ..services.account_service import AccountService
-from ..schemas.account_schema import AccountCreate, AccountOut, TransferRequest, KYCStatusOut, KYCStatusUpdate
+from ..services.account_service import AccountService, ConcurrencyConflictError
+from ..services.idempotency_service import IdempotencyService
+from ..schemas.account_schema import (AccountCreate, AccountOut, TransferRequest, KYCStatusOut, KYCStatusUpdate,
+                                      BatchPostingRequest, PostingResult)
 
-from typing import Optional
 router = APIRouter(prefix="/accounts", tags=["Accounts"])
 
 @router.post("/", response_model=AccountOut)
@@ -25,34 +27,81 @@ def get_all_accounts(service: AccountService = Depends()):
 class AmountRequest(BaseModel):
     amount: float
 
+def _idempotent(idem: IdempotencyService, key: Optional[str], fingerprint: str, action):
+    """Run ``action`` (returns a JSON-able body or raises HTTPException) honouring an Idempotency-Key."""
+    if key is None:
+        return action()
+    status_code, body, replayed = idem.execute(key, fingerprint, action)
+    headers = {"Idempotent-Replayed": "true"} if replayed else {}
+    return JSONResponse(status_code=status_code, content=body, headers=headers)
+
+def _account_body(account) -> dict:
+    return AccountOut.model_validate(account).model_dump()
+
 @router.post("/{account_id}/deposit", response_model=AccountOut)
-def deposit_money(account_id: int, request: AmountRequest, service: AccountService = Depends()):
-    try:
-        updated_account = service.deposit(account_id, request.amount)
+def deposit_money(
+    account_id: int,
+    request: AmountRequest,
+    service: AccountService = Depends(),
+    idem: IdempotencyService = Depends(),
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key"),
+):
+    def action():
+        try:
+            updated_account = service.deposit(account_id, request.amount)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         if not updated_account:
             raise HTTPException(status_code=404, detail="Account not found")
-        return updated_account
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        return _account_body(updated_account)
+    fingerprint = idem.fingerprint("POST", f"/accounts/{account_id}/deposit", request.model_dump())
+    return _idempotent(idem, idempotency_key, fingerprint, action)
 
 @router.post("/{account_id}/withdraw", response_model=AccountOut)
-def withdraw_money(account_id: int, request: AmountRequest, service: AccountService = Depends()):
-    try:
-        updated_account = service.withdraw(account_id, request.amount)
+def withdraw_money(
+    account_id: int,
+    request: AmountRequest,
+    service: AccountService = Depends(),
+    idem: IdempotencyService = Depends(),
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key"),
+):
+    def action():
+        try:
+            updated_account = service.withdraw(account_id, request.amount)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         if not updated_account:
             raise HTTPException(status_code=404, detail="Account not found")
-        return updated_account
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        return _account_body(updated_account)
+    fingerprint = idem.fingerprint("POST", f"/accounts/{account_id}/withdraw", request.model_dump())
+    return _idempotent(idem, idempotency_key, fingerprint, action)
 
 
 @router.post("/transfer", response_model=List[AccountOut])
-def transfer_money(request: TransferRequest, service: AccountService = Depends()):
+def transfer_money(
+    request: TransferRequest,
+    service: AccountService = Depends(),
+    idem: IdempotencyService = Depends(),
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key"),
+):
+    def action():
+        try:
+            from_acct, to_acct = service.transfer(request.from_account_id, request.to_account_id, request.amount)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return [_account_body(from_acct), _account_body(to_acct)]
+    fingerprint = idem.fingerprint("POST", "/accounts/transfer", request.model_dump())
+    return _idempotent(idem, idempotency_key, fingerprint, action)
+
+@router.post("/postings:batch", response_model=List[PostingResult])
+def batch_postings(request: BatchPostingRequest, service: AccountService = Depends()):
+    """Apply up to 10,000 deposit/withdraw/transfer operations in one transaction.
+    Operations run in order; each gets its own result (failed ones are skipped, the rest still apply).
+    """
     try:
-        from_acct, to_acct = service.transfer(request.from_account_id, request.to_account_id, request.amount)
-        return [from_acct, to_acct]
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        return service.apply_postings(request.operations)
+    except ConcurrencyConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
 
 @router.get("/{account_id}/kyc-status", response_model=KYCStatusOut)
 def get_kyc_status(account_id: int, service: AccountService = Depends()):
@@ -74,33 +123,46 @@ def set_kyc_status(
         else kyc_compliant if kyc_compliant is not None
         else True
     )
-    acct = service.set_kyc_compliant(account_id, new_value)
+    try:
+        acct = service.set_kyc_compliant(account_id, new_value)
+    except ConcurrencyConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     if not acct:
         raise HTTPException(status_code=404, detail="Account not found")
     return KYCStatusOut(account_id=acct.id, kyc_compliant=acct.kyc_compliant)
 
-from fastapi import Query # type: ignore
+from fastapi import Query, Response # type: ignore
 from ..services.transaction_service import TransactionService
 from ..schemas.transaction_schema import TransactionOut
 
 @router.get("/{account_id}/transactions", response_model=List[TransactionOut])
 def list_transactions(
     account_id: int,
+    response: Response,
     status: str | None = Query(default=None, description="Filter by status, e.g., completed"),
     sortBy: str | None = Query(default=None, description="Sort by 'field:direction', e.g., date:desc"),
-    page: int = Query(default=1, ge=1, description="Page number (1-based)"),
+    page: int = Query(default=1, ge=1, description="Page number (1-based); ignored when cursor is given"),
     limit: int = Query(default=25, ge=1, le=100, description="Page size; default 25; max 100"),
+    cursor: str | None = Query(default=None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
     service: TransactionService = Depends(),
 ):
     """Return transactions for an account with optional filtering, sorting, and pagination.
     - status: filter by transaction status (e.g., completed, pending, failed)
     - sortBy: sort by 'date', 'amount', 'id', or 'status' with ':asc' or ':desc'
     - page/limit: pagination with sensible defaults and max limit cap
+    - cursor: keyset pagination; pass the previous page's X-Next-Cursor header (same sortBy/status)
     """
-    return service.list_transactions(
-        account_id=account_id,
-        status=status,
-        sort_by=sortBy,
-        page=page,
-        limit=limit,
-    )
+    try:
+        items, next_cursor = service.list_transactions_page(
+            account_id=account_id,
+            status=status,
+            sort_by=sortBy,
+            page=page,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
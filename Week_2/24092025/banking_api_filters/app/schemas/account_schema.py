@@ -1,3 +1,4 @@
+from typing import List, Literal, Optional
 from pydantic import BaseModel, ConfigDict, Field # type: ignore
 
 class AccountCreate(BaseModel):
@@ -8,6 +9,7 @@ class AccountOut(BaseModel):
     owner_name: str
     balance: float
     kyc_compliant: bool
+    version: int = 1
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -26,3 +28,23 @@ class KYCStatusUpdate(BaseModel):
     Default is True to support the common 'mark compliant' action without a body.
     """
     kyc_compliant: bool = Field(default=True, description="Set to True to mark KYC compliant, False to mark non-compliant")
+
+
+MAX_BATCH_POSTINGS = 10_000
+
+class PostingOp(BaseModel):
+    """One operation in a batch: deposit/withdraw use account_id; transfer also needs to_account_id."""
+    type: Literal["deposit", "withdraw", "transfer"]
+    account_id: int
+    amount: float
+    to_account_id: Optional[int] = None
+
+class BatchPostingRequest(BaseModel):
+    operations: List[PostingOp] = Field(..., min_length=1, max_length=MAX_BATCH_POSTINGS)
+
+class PostingResult(BaseModel):
+    index: int
+    ok: bool
+    error: Optional[str] = None
+    # Balances right after this operation (source first for transfers)
+    balances: List[float] = []
@@ -1,8 +1,18 @@
+import random
+import time
 from fastapi import Depends # type: ignore
+from sqlalchemy.orm.exc import StaleDataError # type: ignore
+from ..metrics import concurrency_metrics
 from ..repositories.account_repository import AccountRepository
 from ..schemas.account_schema import AccountCreate
 from ..models.account import Account
 
+MAX_RETRIES = 5
+RETRY_BACKOFF = 0.002  # seconds; doubled (with jitter) on each retry
+
+class ConcurrencyConflictError(Exception):
+    """An optimistic update kept losing to concurrent writers."""
+
 class AccountService:
     def __init__(self, repo: AccountRepository = Depends()):
         self.repo = repo
@@ -20,27 +30,20 @@ class AccountService:
     def deposit(self, account_id: int, amount: float):
         if amount <= 0:
             raise ValueError("Deposit amount must be positive")
-        account = self.repo.get_by_id(account_id)
-        if not account:
-            return None
-        account.balance += amount
-        return self.repo.update(account)
+        return self.repo.deposit(account_id, amount)
 
     def withdraw(self, account_id: int, amount: float):
         if amount <= 0:
             raise ValueError("Withdraw amount must be positive")
-        account = self.repo.get_by_id(account_id)
-        if not account:
-            return None
-        if account.balance - amount < 0:
-            raise ValueError("Insufficient funds")
-        account.balance -= amount
-        return self.repo.update(account)
-
+        return self.repo.withdraw(account_id, amount)
 
     def transfer(self, from_account_id: int, to_account_id: int, amount: float):
         return self.repo.transfer_atomic(from_account_id, to_account_id, amount)
 
+    def apply_postings(self, operations):
+        """Per-operation results; the whole batch is re-run on a concurrent write (see _with_retry)."""
+        return self._with_retry(lambda: self.repo.apply_postings(operations))
+
     def is_kyc_compliant(self, account_id: int) -> bool | None:
         acct = self.repo.get_by_id(account_id)
         if not acct:
@@ -49,4 +52,26 @@ class AccountService:
 
     def set_kyc_compliant(self, account_id: int, value: bool):
         """Returns the updated account or None if not found."""
-        return self.repo.set_kyc_flag(account_id, value)
+        return self._with_retry(lambda: self.repo.set_kyc_flag(account_id, value))
+
+    def _with_retry(self, operation):
+        """Run a read-modify-write ``operation`` whose commit is version-checked.
+
+        A version mismatch (another writer got there first) rolls back and
+        re-runs it on fresh data, up to MAX_RETRIES times with jittered
+        backoff; after that ConcurrencyConflictError is raised (HTTP 409).
+        """
+        retries = 0
+        while True:
+            try:
+                result = operation()
+            except StaleDataError:
+                self.repo.db.rollback()
+                if retries >= MAX_RETRIES:
+                    concurrency_metrics.record(retries, conflict=True)
+                    raise ConcurrencyConflictError("Account was modified concurrently; please retry")
+                retries += 1
+                time.sleep(random.uniform(0, RETRY_BACKOFF * 2 ** retries))
+                continue
+            concurrency_metrics.record(retries)
+            return result
@@ -0,0 +1,74 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional, Tuple
+from fastapi import Depends, HTTPException # type: ignore
+from sqlalchemy.orm import Session # type: ignore
+from ..config import settings
+from ..database import DEFER_COMMIT, get_db
+from ..models.idempotency_key import IdempotencyKey
+from ..repositories.idempotency_repository import IdempotencyRepository
+
+PURGE_EVERY = 1000  # expired keys are swept after this many new keys
+
+class IdempotencyService:
+    """Runs money-moving actions at most once per Idempotency-Key.
+
+    The action's writes and its response (success or HTTP error) are committed
+    in one transaction, so a key is stored if and only if its money moved.
+    Repeats with the same key and payload get the stored response without
+    running the action; a different payload with the same key is rejected with
+    422. If two requests with one new or expired key race, the second one's
+    commit fails on the key (a unique conflict, or a reclaimed row that no
+    longer matches), its writes roll back and it replays the first response.
+    """
+    _new_keys = 0
+
+    def __init__(self, db: Session = Depends(get_db)):
+        # Same request-scoped session as the repositories the action uses
+        self.repo = IdempotencyRepository(db)
+        self.ttl = settings.IDEMPOTENCY_TTL_SECONDS
+
+    @staticmethod
+    def fingerprint(method: str, path: str, body: Any) -> str:
+        raw = json.dumps([method, path, body], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def execute(self, key: str, fingerprint: str, action: Callable[[], Any]) -> Tuple[int, Any, bool]:
+        """Returns (status_code, body, replayed)."""
+        existing = self.repo.get(key)
+        if existing is None:
+            return self._run(key, fingerprint, action)
+        expired = existing.created_at < datetime.utcnow() - timedelta(seconds=self.ttl)
+        if expired or existing.status_code is None:
+            return self._run(key, fingerprint, action, replaces=existing.created_at)
+        return self._replay(existing, fingerprint)
+
+    @staticmethod
+    def _replay(row: Optional[IdempotencyKey], fingerprint: str) -> Tuple[int, Any, bool]:
+        if row is None:  # the racing request's key was purged in between
+            raise HTTPException(status_code=409, detail="Concurrent request with this Idempotency-Key; please retry")
+        if row.fingerprint != fingerprint:
+            raise HTTPException(status_code=422, detail="Idempotency-Key was already used with a different request")
+        return row.status_code, json.loads(row.response_body), True
+
+    def _run(self, key: str, fingerprint: str, action: Callable[[], Any],
+             replaces: Optional[datetime] = None) -> Tuple[int, Any, bool]:
+        db = self.repo.db
+        db.info[DEFER_COMMIT] = True
+        try:
+            status_code, body = 200, action()
+        except HTTPException as e:
+            db.rollback()  # an error response is stored without any writes
+            status_code, body = e.status_code, {"detail": e.detail}
+        except Exception:
+            db.rollback()  # nothing moved, nothing stored: the client may retry with the same key
+            raise
+        finally:
+            db.info.pop(DEFER_COMMIT, None)
+        if not self.repo.save(key, fingerprint, status_code, json.dumps(body), replaces=replaces):
+            return self._replay(self.repo.get(key), fingerprint)
+        IdempotencyService._new_keys += 1
+        if IdempotencyService._new_keys % PURGE_EVERY == 0:
+            self.repo.purge_expired(self.ttl)
+        return status_code, body, False
@@ -1,8 +1,8 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from fastapi import Depends
 from sqlalchemy.orm import Session
 from ..database import get_db
-from ..repositories.transaction_repository import list_by_account
+from ..repositories.transaction_repository import list_by_account, list_page_by_account
 from ..models.transaction import Transaction
 
 class TransactionService:
@@ -18,3 +18,14 @@ class TransactionService:
         limit: int = 25,
     ) -> List[Transaction]:
         return list_by_account(self.db, account_id, status, sort_by, page, limit)
+
+    def list_transactions_page(
+        self,
+        account_id: int,
+        status: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        page: int = 1,
+        limit: int = 25,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Transaction], Optional[str]]:
+        return list_page_by_account(self.db, account_id, status, sort_by, page, limit, cursor)
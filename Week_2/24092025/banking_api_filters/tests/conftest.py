@@ -0,0 +1,31 @@
+import os
+import shutil
+import tempfile
+
+# Point the app at a throwaway SQLite file before anything imports app.config,
+# so test runs never write to the tracked bank.db or depend on earlier runs.
+_TEST_DB_DIR = tempfile.mkdtemp(prefix="banking-api-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_TEST_DB_DIR, 'test.db')}"
+
+import app.main  # noqa: E402,F401  (registers every model on Base)
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.migrations import run_migrations  # noqa: E402
+from app.models.account import Account  # noqa: E402
+
+def pytest_sessionstart(session):
+    # Tests bypass the app's startup hook, so create and migrate the schema here.
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+
+def pytest_sessionfinish(session, exitstatus):
+    engine.dispose()
+    shutil.rmtree(_TEST_DB_DIR, ignore_errors=True)
+
+def make_accounts(*balances, owner="Test Owner", kyc_compliant=True):
+    """Create accounts (KYC-compliant by default) with the given balances; returns their ids."""
+    db = SessionLocal()
+    accts = [Account(owner_name=owner, balance=b, kyc_compliant=kyc_compliant) for b in balances]
+    db.add_all(accts); db.commit()
+    ids = [a.id for a in accts]
+    db.close()
+    return ids
@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+from fastapi.testclient import TestClient # type: ignore
+from app.main import app
+from app.database import SessionLocal
+from app.models.account import Account
+from app.repositories.account_repository import AccountRepository
+from .conftest import make_accounts
+
+client = TestClient(app)
+
+def balance_of(account_id):
+    db = SessionLocal()
+    try:
+        return db.query(Account).filter(Account.id == account_id).one().balance
+    finally:
+        db.close()
+
+def with_repo(fn):
+    db = SessionLocal()
+    try:
+        return fn(AccountRepository(db))
+    finally:
+        db.close()
+
+def test_concurrent_deposits_do_not_lose_updates():
+    (account_id,) = make_accounts(0.0, owner="Atomic Test")
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: with_repo(lambda r: r.deposit(account_id, 1.0)), range(80)))
+    assert balance_of(account_id) == 80.0
+
+def test_concurrent_withdrawals_never_overdraw():
+    (account_id,) = make_accounts(100.0, owner="Atomic Test")
+
+    def attempt(_):
+        try:
+            return with_repo(lambda r: r.withdraw(account_id, 10.0)) is not None
+        except ValueError:
+            return False
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(attempt, range(30)))
+    assert sum(results) == 10
+    assert balance_of(account_id) == 0.0
+
+def test_transfer_endpoint_is_all_or_nothing():
+    a, b = make_accounts(50.0, 0.0, owner="Atomic Test")
+    resp = client.post("/accounts/transfer", json={"from_account_id": a, "to_account_id": b, "amount": 20.0})
+    assert resp.status_code == 200
+    assert [x["balance"] for x in resp.json()] == [30.0, 20.0]
+    resp = client.post("/accounts/transfer", json={"from_account_id": a, "to_account_id": b, "amount": 31.0})
+    assert resp.status_code == 400
+    resp = client.post("/accounts/transfer", json={"from_account_id": b, "to_account_id": 10**9, "amount": 1.0})
+    assert resp.status_code == 400
+    assert (balance_of(a), balance_of(b)) == (30.0, 20.0)
+    assert client.post(f"/accounts/{a}/withdraw", json={"amount": 31.0}).status_code == 400
+    assert client.post(f"/accounts/{a}/deposit", json={"amount": 5.0}).json()["balance"] == 35.0
+    assert client.post("/accounts/999999999/deposit", json={"amount": 5.0}).status_code == 404
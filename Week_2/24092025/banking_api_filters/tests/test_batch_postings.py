@@ -0,0 +1,65 @@
+from fastapi.testclient import TestClient # type: ignore
+from app.main import app
+from app.database import SessionLocal
+from .conftest import make_accounts
+
+client = TestClient(app)
+
+def test_batch_applies_in_order_with_per_item_results():
+    a, b = make_accounts(100.0, 0.0)
+    ops = [
+        {"type": "deposit", "account_id": b, "amount": 10.0},
+        {"type": "transfer", "account_id": a, "to_account_id": b, "amount": 60.0},
+        {"type": "withdraw", "account_id": a, "amount": 50.0},        # only 40 left: fails
+        {"type": "withdraw", "account_id": b, "amount": 70.0},        # uses the transfer above
+        {"type": "deposit", "account_id": 10**9, "amount": 1.0},      # unknown account
+        {"type": "transfer", "account_id": a, "to_account_id": a, "amount": 1.0},
+        {"type": "deposit", "account_id": a, "amount": -5.0},
+    ]
+    resp = client.post("/accounts/postings:batch", json={"operations": ops})
+    assert resp.status_code == 200
+    results = resp.json()
+    assert [r["ok"] for r in results] == [True, True, False, True, False, False, False]
+    assert results[1]["balances"] == [40.0, 70.0]
+    assert results[2]["error"] == "Insufficient funds"
+    assert client.get(f"/accounts/{a}").json()["balance"] == 40.0
+    assert client.get(f"/accounts/{b}").json()["balance"] == 0.0
+
+def test_large_payroll_batch():
+    (payer,) = make_accounts(1_000_000.0)
+    payees = make_accounts(*([0.0] * 200))
+    ops = [{"type": "transfer", "account_id": payer, "to_account_id": p, "amount": 2500.0} for p in payees] * 2
+    results = client.post("/accounts/postings:batch", json={"operations": ops}).json()
+    assert all(r["ok"] for r in results)
+    assert client.get(f"/accounts/{payer}").json()["balance"] == 0.0
+    assert client.get(f"/accounts/{payees[-1]}").json()["balance"] == 5000.0
+
+def test_batch_rejects_empty_request():
+    assert client.post("/accounts/postings:batch", json={"operations": []}).status_code == 422
+
+def test_batch_does_not_overwrite_a_concurrent_deposit():
+    from app.repositories.account_repository import AccountRepository
+    from app.services.account_service import AccountService
+    from app.schemas.account_schema import PostingOp
+    (a,) = make_accounts(100.0)
+    db = SessionLocal()
+    repo = AccountRepository(db)
+    check = repo._posting_error
+    interleaved = []
+
+    def posting_error_with_concurrent_write(op, balances):
+        # Runs after the batch read its balances and before it writes them
+        if not interleaved:
+            interleaved.append(True)
+            with_other = SessionLocal()
+            AccountRepository(with_other).deposit(a, 50.0)
+            with_other.close()
+        return check(op, balances)
+
+    repo._posting_error = posting_error_with_concurrent_write
+    results = AccountService(repo).apply_postings([PostingOp(type="deposit", account_id=a, amount=10.0)])
+    db.close()
+    assert results[0]["ok"] and results[0]["balances"] == [160.0]
+    assert client.get(f"/accounts/{a}").json()["balance"] == 160.0
+    rows = client.get(f"/accounts/{a}/transactions", params={"sortBy": "id:asc"}).json()
+    assert [r["amount"] for r in rows] == [50.0, 10.0]
@@ -0,0 +1,120 @@
+import uuid
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient # type: ignore
+from app.main import app
+from app.config import settings
+from app.database import SessionLocal
+from app.models.idempotency_key import IdempotencyKey
+from app.repositories.account_repository import AccountRepository
+from app.repositories.idempotency_repository import IdempotencyRepository
+from app.services.idempotency_service import IdempotencyService
+import app.routers.account_router as account_router
+from .conftest import make_accounts
+
+client = TestClient(app)
+
+def test_retried_transfer_posts_once():
+    a, b = make_accounts(100.0, 0.0)
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+    body = {"from_account_id": a, "to_account_id": b, "amount": 30.0}
+    first = client.post("/accounts/transfer", json=body, headers=headers)
+    again = client.post("/accounts/transfer", json=body, headers=headers)
+    assert first.status_code == again.status_code == 200
+    assert again.json() == first.json()
+    assert again.headers.get("Idempotent-Replayed") == "true"
+    assert client.get(f"/accounts/{a}").json()["balance"] == 70.0
+
+def test_errors_are_replayed_and_payload_is_checked():
+    (a,) = make_accounts(10.0)
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+    first = client.post(f"/accounts/{a}/withdraw", json={"amount": 50.0}, headers=headers)
+    assert first.status_code == 400
+    client.post(f"/accounts/{a}/deposit", json={"amount": 100.0})
+    # Same key: the stored 400 comes back even though funds would now allow it
+    again = client.post(f"/accounts/{a}/withdraw", json={"amount": 50.0}, headers=headers)
+    assert (again.status_code, again.json()) == (400, first.json())
+    other = client.post(f"/accounts/{a}/withdraw", json={"amount": 5.0}, headers=headers)
+    assert other.status_code == 422
+    assert client.get(f"/accounts/{a}").json()["balance"] == 110.0
+
+def test_expired_keys_are_purged_and_reusable():
+    (a,) = make_accounts(0.0)
+    key = str(uuid.uuid4())
+    client.post(f"/accounts/{a}/deposit", json={"amount": 1.0}, headers={"Idempotency-Key": key})
+    db = SessionLocal()
+    row = db.get(IdempotencyKey, key)
+    row.created_at = datetime.utcnow() - timedelta(seconds=settings.IDEMPOTENCY_TTL_SECONDS + 1)
+    db.commit()
+    client.post(f"/accounts/{a}/deposit", json={"amount": 1.0}, headers={"Idempotency-Key": key})
+    assert client.get(f"/accounts/{a}").json()["balance"] == 2.0
+    db.get(IdempotencyKey, key).created_at = datetime.utcnow() - timedelta(days=30)
+    db.commit()
+    assert IdempotencyRepository(db).purge_expired(settings.IDEMPOTENCY_TTL_SECONDS) >= 1
+    assert db.get(IdempotencyKey, key) is None
+    db.close()
+
+def test_unexpected_failure_moves_no_money_and_stores_no_key(monkeypatch):
+    (a,) = make_accounts(0.0)
+    key = str(uuid.uuid4())
+    def broken_body(account):
+        raise RuntimeError("serialisation failed after the balance update")
+    monkeypatch.setattr(account_router, "_account_body", broken_body)
+    failing = TestClient(app, raise_server_exceptions=False)
+    assert failing.post(f"/accounts/{a}/deposit", json={"amount": 5.0}, headers={"Idempotency-Key": key}).status_code == 500
+    monkeypatch.undo()
+    assert client.get(f"/accounts/{a}").json()["balance"] == 0.0
+    retry = client.post(f"/accounts/{a}/deposit", json={"amount": 5.0}, headers={"Idempotency-Key": key})
+    assert retry.status_code == 200 and "Idempotent-Replayed" not in retry.headers
+    assert client.get(f"/accounts/{a}").json()["balance"] == 5.0
+
+def test_abandoned_in_flight_row_is_recovered():
+    (a,) = make_accounts(0.0)
+    key = str(uuid.uuid4())
+    db = SessionLocal()
+    db.add(IdempotencyKey(key=key, fingerprint="old", created_at=datetime.utcnow()))  # no stored response
+    db.commit(); db.close()
+    res = client.post(f"/accounts/{a}/deposit", json={"amount": 3.0}, headers={"Idempotency-Key": key})
+    assert res.status_code == 200
+    assert client.get(f"/accounts/{a}").json()["balance"] == 3.0
+
+def test_losing_a_race_on_the_key_rolls_back_and_replays():
+    (a,) = make_accounts(0.0)
+    key = str(uuid.uuid4())
+    db = SessionLocal()
+    service = IdempotencyService(db)
+    fp = service.fingerprint("POST", f"/accounts/{a}/deposit", {"amount": 1.0})
+
+    def action():
+        # The racing request commits the key while this one is running
+        other = SessionLocal()
+        IdempotencyRepository(other).save(key, fp, 200, '{"winner": true}')
+        other.close()
+        AccountRepository(db).deposit(a, 1.0)
+        return {"winner": False}
+
+    assert service.execute(key, fp, action) == (200, {"winner": True}, True)
+    db.close()
+    assert client.get(f"/accounts/{a}").json()["balance"] == 0.0
+
+def test_losing_a_race_on_an_expired_key_rolls_back_and_replays():
+    (a,) = make_accounts(0.0)
+    key = str(uuid.uuid4())
+    client.post(f"/accounts/{a}/deposit", json={"amount": 1.0}, headers={"Idempotency-Key": key})
+    db = SessionLocal()
+    expired_at = datetime.utcnow() - timedelta(seconds=settings.IDEMPOTENCY_TTL_SECONDS + 1)
+    db.get(IdempotencyKey, key).created_at = expired_at
+    db.commit()
+    service = IdempotencyService(db)
+    fp = service.fingerprint("POST", f"/accounts/{a}/deposit", {"amount": 1.0})
+
+    def action():
+        # The racing request reclaims the expired key while this one is running
+        other = SessionLocal()
+        assert IdempotencyRepository(other).save(key, fp, 200, '{"winner": true}', replaces=expired_at)
+        other.close()
+        AccountRepository(db).deposit(a, 1.0)
+        return {"winner": False}
+
+    assert service.execute(key, fp, action) == (200, {"winner": True}, True)
+    db.close()
+    assert client.get(f"/accounts/{a}").json()["balance"] == 1.0
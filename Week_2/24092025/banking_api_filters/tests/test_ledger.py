@@ -0,0 +1,57 @@
+from fastapi.testclient import TestClient # type: ignore
+from sqlalchemy import func # type: ignore
+from app.main import app
+from app.backfill import backfill_opening_balances, OPENING_DESCRIPTION
+from app.database import SessionLocal
+from app.models.account import Account
+from app.models.transaction import Transaction
+from .conftest import make_accounts
+
+client = TestClient(app)
+
+def ledger_total(db, account_id):
+    return db.query(func.coalesce(func.sum(Transaction.amount), 0.0)).filter(
+        Transaction.account_id == account_id, Transaction.status == "completed").scalar()
+
+def test_every_balance_change_writes_a_ledger_row():
+    a, b = make_accounts(0.0, 0.0)
+    client.post(f"/accounts/{a}/deposit", json={"amount": 100.0})
+    client.post(f"/accounts/{a}/withdraw", json={"amount": 30.0})
+    client.post(f"/accounts/{a}/withdraw", json={"amount": 1000.0})  # rejected: no row
+    client.post("/accounts/transfer", json={"from_account_id": a, "to_account_id": b, "amount": 20.0})
+    client.post("/accounts/postings:batch", json={"operations": [
+        {"type": "deposit", "account_id": b, "amount": 5.0},
+        {"type": "withdraw", "account_id": b, "amount": 999.0},
+    ]})
+
+    rows = client.get(f"/accounts/{a}/transactions", params={"sortBy": "id:asc"}).json()
+    assert [(r["amount"], r["description"]) for r in rows] == [
+        (100.0, "Deposit"), (-30.0, "Withdrawal"), (-20.0, f"Transfer to account {b}")]
+    rows = client.get(f"/accounts/{b}/transactions", params={"sortBy": "id:asc"}).json()
+    assert [r["amount"] for r in rows] == [20.0, 5.0]
+    assert all(r["status"] == "completed" for r in rows)
+
+    db = SessionLocal()
+    for account_id in (a, b):
+        assert ledger_total(db, account_id) == db.get(Account, account_id).balance
+    db.close()
+
+def test_backfill_reconciles_pre_ledger_balances_once():
+    (a,) = make_accounts(250.0)
+    client.post(f"/accounts/{a}/deposit", json={"amount": 50.0})
+    db = SessionLocal()
+    assert backfill_opening_balances(db) >= 1
+    assert backfill_opening_balances(db) == 0
+    assert ledger_total(db, a) == 300.0
+    first = db.query(Transaction).filter(Transaction.account_id == a).order_by(Transaction.date).first()
+    assert (first.amount, first.description) == (250.0, OPENING_DESCRIPTION)
+    db.close()
+
+def test_backfill_streams_in_batches():
+    ids = make_accounts(10.0, 20.0, 30.0, 40.0, 50.0)
+    db = SessionLocal()
+    assert backfill_opening_balances(db, batch_size=2) >= 5
+    for account_id in ids:
+        assert ledger_total(db, account_id) == db.get(Account, account_id).balance
+    assert backfill_opening_balances(db, batch_size=2) == 0
+    db.close()
@@ -0,0 +1,70 @@
+import pytest # type: ignore
+from fastapi.testclient import TestClient # type: ignore
+from app.main import app
+from app.database import SessionLocal
+from app.metrics import concurrency_metrics
+from app.migrations import run_migrations
+from app.database import engine
+from app.repositories.account_repository import AccountRepository
+from app.services.account_service import AccountService, ConcurrencyConflictError
+from .conftest import make_accounts
+
+client = TestClient(app)
+
+class InterferingRepository(AccountRepository):
+    """Lets another session write the row between our read and our commit, `times` times."""
+
+    def __init__(self, db, times):
+        super().__init__(db)
+        self.times = times
+
+    def set_kyc_flag(self, account_id, value):
+        acct = self.get_by_id(account_id)
+        if self.times:
+            self.times -= 1
+            other = SessionLocal()
+            AccountRepository(other).deposit(account_id, 1.0)
+            other.close()
+        acct.kyc_compliant = bool(value)
+        self.db.commit()
+        return acct
+
+def test_version_bumps_on_every_write():
+    (account_id,) = make_accounts(10.0, kyc_compliant=False)
+    v1 = client.get(f"/accounts/{account_id}").json()["version"]
+    client.post(f"/accounts/{account_id}/deposit", json={"amount": 1.0})
+    client.put(f"/accounts/{account_id}/kyc-status", json={"kyc_compliant": True})
+    assert client.get(f"/accounts/{account_id}").json()["version"] == v1 + 2
+
+def test_stale_write_is_retried():
+    (account_id,) = make_accounts(10.0, kyc_compliant=False)
+    concurrency_metrics.reset()
+    db = SessionLocal()
+    acct = AccountService(InterferingRepository(db, times=2)).set_kyc_compliant(account_id, True)
+    assert acct.kyc_compliant is True
+    assert acct.balance == 12.0  # the concurrent deposits were not overwritten
+    db.close()
+    stats = concurrency_metrics.snapshot()
+    assert (stats["operations"], stats["retries"], stats["conflicts"]) == (1, 2, 0)
+
+def test_persistent_contention_raises_conflict():
+    (account_id,) = make_accounts(10.0, kyc_compliant=False)
+    concurrency_metrics.reset()
+    db = SessionLocal()
+    with pytest.raises(ConcurrencyConflictError):
+        AccountService(InterferingRepository(db, times=100)).set_kyc_compliant(account_id, True)
+    db.close()
+    assert client.get("/metrics/concurrency").json()["conflicts"] == 1
+
+def test_migration_adds_version_to_old_schema(tmp_path):
+    from sqlalchemy import create_engine, text # type: ignore
+    old = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with old.begin() as conn:
+        conn.execute(text("CREATE TABLE accounts (id INTEGER PRIMARY KEY, owner_name VARCHAR NOT NULL, "
+                          "balance FLOAT NOT NULL, kyc_compliant BOOLEAN NOT NULL)"))
+        conn.execute(text("INSERT INTO accounts VALUES (1, 'Old', 5.0, 1)"))
+    assert run_migrations(old) == [1, 2, 3]
+    assert run_migrations(old) == []
+    with old.connect() as conn:
+        assert conn.execute(text("SELECT version FROM accounts")).scalar() == 1
+    assert run_migrations(engine) == []
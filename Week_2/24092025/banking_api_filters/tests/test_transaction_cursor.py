@@ -0,0 +1,77 @@
+from fastapi.testclient import TestClient # type: ignore
+from app.main import app
+from app.database import SessionLocal, engine
+from app.models.transaction import Transaction
+from app.migrations import _transaction_date_fractions
+from sqlalchemy import text # type: ignore
+from .conftest import make_accounts
+from datetime import datetime, timedelta
+
+client = TestClient(app)
+
+def seed_transactions(db, account_id, n=23):
+    base = datetime(2025, 1, 1)
+    statuses = ["completed", "pending", "failed"]
+    # Repeated dates, amounts and statuses so ordering depends on the id tie-breaker
+    db.add_all([
+        Transaction(account_id=account_id, amount=float(i % 4) * 10, status=statuses[i % 3],
+                    date=base + timedelta(days=i // 3), description=f"T{i}")
+        for i in range(n)
+    ])
+    db.commit()
+
+def walk(account_id, params):
+    ids, cursor = [], None
+    for _ in range(100):  # a cursor that does not advance must fail, not hang
+        resp = client.get(f"/accounts/{account_id}/transactions", params={**params, "limit": 5, **({"cursor": cursor} if cursor else {})})
+        assert resp.status_code == 200
+        ids += [t["id"] for t in resp.json()]
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            return ids
+    raise AssertionError(f"cursor walk did not end: {ids[:20]}...")
+
+def test_cursor_pages_cover_every_sort_exactly_once():
+    db = SessionLocal()
+    (account_id,) = make_accounts(0.0)
+    seed_transactions(db, account_id)
+    for sort_by in ["date:desc", "date:asc", "amount:desc", "amount:asc", "id:desc", "status:asc"]:
+        full = client.get(f"/accounts/{account_id}/transactions", params={"sortBy": sort_by, "limit": 100}).json()
+        assert walk(account_id, {"sortBy": sort_by}) == [t["id"] for t in full]
+        assert len(full) == 23
+    completed = walk(account_id, {"sortBy": "date:desc", "status": "completed"})
+    assert len(completed) == 8
+    db.close()
+
+def test_cursor_rejects_mismatched_sort():
+    db = SessionLocal()
+    (account_id,) = make_accounts(0.0)
+    seed_transactions(db, account_id, n=6)
+    resp = client.get(f"/accounts/{account_id}/transactions", params={"sortBy": "amount:asc", "limit": 2})
+    cursor = resp.headers["X-Next-Cursor"]
+    bad = client.get(f"/accounts/{account_id}/transactions", params={"sortBy": "date:desc", "cursor": cursor})
+    assert bad.status_code == 400
+    assert client.get(f"/accounts/{account_id}/transactions", params={"cursor": "not-a-cursor"}).status_code == 400
+    db.close()
+
+def test_cursor_walk_ends_for_rows_without_an_explicit_date():
+    db = SessionLocal()
+    (account_id,) = make_accounts(0.0)
+    db.add_all([Transaction(account_id=account_id, amount=1.0, status="completed") for _ in range(12)])
+    db.commit()
+    expected = {t.id for t in db.query(Transaction).filter(Transaction.account_id == account_id)}
+    ids = walk(account_id, {})
+    assert len(ids) == len(set(ids)) and set(ids) == expected
+    db.close()
+
+def test_server_default_dates_are_normalised_for_cursors():
+    db = SessionLocal()
+    (account_id,) = make_accounts(0.0)
+    with engine.begin() as conn:
+        for _ in range(12):
+            conn.execute(text("INSERT INTO transactions (account_id, amount, status) VALUES (:a, 1.0, 'completed')"),
+                         {"a": account_id})
+        _transaction_date_fractions(conn)
+    ids = walk(account_id, {"sortBy": "date:desc"})
+    assert len(ids) == len(set(ids)) == 12
+    db.close()
@@ -0,0 +1,32 @@
+import pytest # type: ignore
+from datetime import datetime
+from sqlalchemy import text # type: ignore
+from app.database import SessionLocal, engine
+from app.repositories.transaction_repository import COLUMN_MAP, _after, _filtered, _ordered, decode_cursor, encode_cursor
+from app.models.transaction import Transaction
+
+def query_plan(db, query) -> str:
+    sql = str(query.statement.compile(engine, compile_kwargs={"literal_binds": True}))
+    return "\n".join(row[-1] for row in db.execute(text("EXPLAIN QUERY PLAN " + sql)))
+
+SAMPLE = {"date": datetime(2025, 1, 1), "amount": 10.0, "id": 5, "status": "completed"}
+
+@pytest.mark.parametrize("status", [None, "completed"])
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+@pytest.mark.parametrize("field", sorted(COLUMN_MAP))
+def test_listing_is_served_in_index_order(field, direction, status):
+    db = SessionLocal()
+    try:
+        query = _ordered(_filtered(db, 1, status), field, direction).limit(26)
+        plan = query_plan(db, query)
+        assert "USE TEMP B-TREE" not in plan, plan
+        assert "USING" in plan and "INDEX" in plan, plan
+
+        # Next page via cursor: same index, still no sort
+        row = Transaction(id=SAMPLE["id"], **{k: v for k, v in SAMPLE.items() if k != "id"})
+        value, last_id = decode_cursor(encode_cursor(row, field, direction), field, direction)
+        query = _ordered(_after(_filtered(db, 1, status), field, direction, value, last_id, status), field, direction).limit(26)
+        plan = query_plan(db, query)
+        assert "USE TEMP B-TREE" not in plan, plan
+    finally:
+        db.close()
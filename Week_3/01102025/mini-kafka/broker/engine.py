@@ -0,0 +1,239 @@
+import asyncio
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from broker.quotas import QuotaManager
+
+class BrokerError(Exception):
+    """Base class for broker engine errors."""
+
+class TopicNotFoundError(BrokerError):
+    pass
+
+class UnknownConsumerError(BrokerError):
+    pass
+
+class UnknownTransactionError(BrokerError):
+    pass
+
+class TransactionStateError(BrokerError):
+    pass
+
+class ThrottledError(BrokerError):
+    def __init__(self, throttle_time_ms: int):
+        super().__init__(f"Quota exceeded; retry after {throttle_time_ms} ms")
+        self.throttle_time_ms = throttle_time_ms
+
+# Like Kafka's transaction.timeout.ms: an open transaction older than this is
+# aborted, so a producer that dies mid-transaction cannot stall its topics.
+TRANSACTION_TIMEOUT_SECONDS = 60.0
+
+def _message_size(value: str, key: Optional[str]) -> int:
+    return len(value.encode()) + (len(key.encode()) if key else 0)
+
+class BrokerEngine:
+    """In-memory broker core: topics, consumer offsets, transactions and quotas.
+
+    The FastAPI app in ``broker/main.py`` is a thin HTTP wrapper around one instance.
+    Tests and single-process apps can use the engine directly and skip HTTP entirely:
+
+        engine = BrokerEngine()
+        await engine.register_topic("demo")
+        await engine.produce("demo", "hello")
+        cid = await engine.register_consumer("demo")
+        msg = await engine.consume(cid)   # {"topic", "offset", "value", "key"} or None
+
+    Messages are plain dicts; nothing is serialised.
+    """
+
+    def __init__(self, quotas: Optional[QuotaManager] = None,
+                 transaction_timeout: float = TRANSACTION_TIMEOUT_SECONDS):
+        self.topics: Dict[str, List[Dict]] = {}
+        self.consumers: Dict[str, Dict] = {}
+        self.locks: Dict[str, asyncio.Lock] = {}
+        self.quotas = quotas if quotas is not None else QuotaManager()
+        self.transaction_timeout = transaction_timeout
+        # transactions[txn_id] = {"state": "open", "producer_id": str, "started": monotonic secs,
+        #                         "ranges": [(topic, start, end), ...]}; removed once committed/aborted
+        self.transactions: Dict[str, Dict] = {}
+        # open_txns[topic][txn_id] = first offset the open transaction wrote to that topic
+        self.open_txns: Dict[str, Dict[str, int]] = {}
+
+    # ---- helpers -------------------------------------------------------
+
+    def _ensure_topic(self, topic: str) -> None:
+        if topic not in self.topics:
+            self.topics[topic] = []
+            self.locks[topic] = asyncio.Lock()
+            self.open_txns[topic] = {}
+
+    def _require_topic(self, topic: str) -> None:
+        if topic not in self.topics:
+            raise TopicNotFoundError(topic)
+
+    def _check_quota(self, client_type: str, client_id: str) -> None:
+        # Rejected before taking any topic lock, so a noisy client never holds up others.
+        throttle_ms = self.quotas.throttle_time_ms(client_type, client_id)
+        if throttle_ms:
+            raise ThrottledError(throttle_ms)
+
+    def _expire_transactions(self, txn_ids: Iterable[str]) -> None:
+        deadline = time.monotonic() - self.transaction_timeout
+        for txn_id in list(txn_ids):
+            if self.transactions[txn_id]["started"] < deadline:
+                self._finish(txn_id, "aborted")
+
+    def last_stable_offset(self, topic: str) -> int:
+        """First offset consumers may not read yet: the start of the oldest open transaction."""
+        pending = self.open_txns[topic]
+        self._expire_transactions(pending)
+        return min(pending.values()) if pending else len(self.topics[topic])
+
+    def _open_transaction(self, txn_id: str) -> Dict:
+        txn = self.transactions.get(txn_id)
+        if txn is None:
+            raise UnknownTransactionError(txn_id)
+        self._expire_transactions([txn_id])
+        if txn["state"] != "open":
+            raise TransactionStateError(f"Transaction already {txn['state']}.")
+        return txn
+
+    # ---- registration --------------------------------------------------
+
+    async def register_topic(self, topic: str) -> None:
+        self._ensure_topic(topic)
+
+    async def register_producer(self, topic: str, producer_id: Optional[str] = None) -> str:
+        self._ensure_topic(topic)
+        return producer_id or f"producer-{uuid.uuid4().hex[:8]}"
+
+    async def register_consumer(self, topic: str, consumer_id: Optional[str] = None) -> str:
+        self._ensure_topic(topic)
+        cid = consumer_id or f"consumer-{uuid.uuid4().hex[:8]}"
+        self.consumers[cid] = {"topic": topic, "offset": 0}
+        return cid
+
+    def set_quota(self, client_type: str, client_id: str,
+                  byte_rate: Optional[float], request_rate: Optional[float]) -> None:
+        self.quotas.set_quota(client_type, client_id, byte_rate, request_rate)
+
+    # ---- messages ------------------------------------------------------
+
+    async def produce(self, topic: str, value: str, key: Optional[str] = None,
+                      producer_id: Optional[str] = None) -> int:
+        """Append one message; returns its offset."""
+        self._require_topic(topic)
+        pid = producer_id or "anonymous"
+        self._check_quota("producer", pid)
+        self.quotas.record("producer", pid, _message_size(value, key))
+        msg = {"topic": topic, "value": value, "key": key}
+        async with self.locks[topic]:
+            offset = len(self.topics[topic])
+            msg["offset"] = offset
+            self.topics[topic].append(msg)
+        return offset
+
+    async def consume(self, consumer_id: str) -> Optional[Dict]:
+        """Return the next committed message for the consumer, or None if there is none yet."""
+        if consumer_id not in self.consumers:
+            raise UnknownConsumerError(consumer_id)
+        self._check_quota("consumer", consumer_id)
+        state = self.consumers[consumer_id]
+        topic = state["topic"]
+        current_offset = state["offset"]
+        async with self.locks[topic]:
+            messages = self.topics[topic]
+            # Read committed: never go past the last stable offset, and skip aborted records
+            lso = self.last_stable_offset(topic)
+            while current_offset < lso:
+                msg = messages[current_offset]
+                current_offset += 1
+                if msg.get("aborted"):
+                    continue
+                state["offset"] = current_offset
+                self.quotas.record("consumer", consumer_id, _message_size(msg["value"], msg["key"]))
+                return msg
+            state["offset"] = current_offset
+        self.quotas.record("consumer", consumer_id, 0)
+        return None
+
+    # ---- transactions --------------------------------------------------
+
+    async def begin_transaction(self, producer_id: Optional[str] = None) -> str:
+        txn_id = f"txn-{uuid.uuid4().hex[:12]}"
+        self.transactions[txn_id] = {
+            "state": "open",
+            "producer_id": producer_id or "anonymous",
+            "started": time.monotonic(),
+            "ranges": [],
+        }
+        return txn_id
+
+    async def produce_transactional(
+        self, txn_id: str, messages: Iterable[Tuple[str, str, Optional[str]]]
+    ) -> Dict[str, List[int]]:
+        """Write (topic, value, key) records inside a transaction; returns offsets per topic."""
+        txn = self._open_transaction(txn_id)
+        by_topic: Dict[str, List[Dict]] = {}
+        nbytes = 0
+        for topic, value, key in messages:
+            self._require_topic(topic)
+            by_topic.setdefault(topic, []).append({"topic": topic, "value": value, "key": key, "txn_id": txn_id})
+            nbytes += _message_size(value, key)
+        pid = txn["producer_id"]
+        self._check_quota("producer", pid)
+        self.quotas.record("producer", pid, nbytes)
+
+        # Records go straight into the topic logs (same cost as a plain batch append);
+        # the LSO keeps them invisible to consumers until the transaction commits.
+        offsets: Dict[str, List[int]] = {}
+        for topic in sorted(by_topic):
+            async with self.locks[topic]:
+                if txn["state"] != "open":
+                    raise TransactionStateError(f"Transaction already {txn['state']}.")
+                log = self.topics[topic]
+                base = len(log)
+                self.open_txns[topic].setdefault(txn_id, base)
+                for i, msg in enumerate(by_topic[topic]):
+                    msg["offset"] = base + i
+                log.extend(by_topic[topic])
+                txn["ranges"].append((topic, base, len(log)))
+                offsets[topic] = list(range(base, len(log)))
+        return offsets
+
+    def _finish(self, txn_id: str, state: str) -> None:
+        # Settle the outcome on the records themselves, then forget the transaction.
+        # Nothing is visible to consumers until the open_txns entries go, so every
+        # record of the transaction becomes committed/aborted at once.
+        txn = self.transactions.pop(txn_id)
+        txn["state"] = state
+        for topic, start, end in txn["ranges"]:
+            log = self.topics[topic]
+            for offset in range(start, end):
+                msg = log[offset]
+                del msg["txn_id"]
+                if state == "aborted":
+                    msg["aborted"] = True
+            self.open_txns[topic].pop(txn_id, None)
+
+    def _end_transaction(self, txn_id: str, state: str) -> None:
+        self._open_transaction(txn_id)
+        self._finish(txn_id, state)
+
+    async def commit_transaction(self, txn_id: str) -> None:
+        self._end_transaction(txn_id, "committed")
+
+    async def abort_transaction(self, txn_id: str) -> None:
+        self._end_transaction(txn_id, "aborted")
+
+    # ---- introspection -------------------------------------------------
+
+    def stats(self) -> Dict:
+        self._expire_transactions(self.transactions)
+        return {
+            "topics": {t: len(msgs) for t, msgs in self.topics.items()},
+            "last_stable_offsets": {t: self.last_stable_offset(t) for t in self.topics},
+            "open_transactions": len(self.transactions),
+            "consumers": self.consumers,
+        }
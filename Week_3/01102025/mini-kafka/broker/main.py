@@ -1,7 +1,5 @@
-import asyncio
-import uuid
-from typing import Dict, List, Optional
-from fastapi import FastAPI, HTTPException, Response # pyright: ignore[reportMissingImports]
+from typing import Optional
+from fastapi import FastAPI, Request, Response # pyright: ignore[reportMissingImports]
 from fastapi.responses import JSONResponse # type: ignore
 from fastapi.middleware.cors import CORSMiddleware # type: ignore
 import uvicorn # type: ignore
@@ -16,8 +14,21 @@ from shared.schemas import (
     ConsumerRegistration,
     PublishRequest,
     ConsumeRequest,
+    BeginTransaction,
+    TransactionalPublishRequest,
+    EndTransaction,
+    QuotaConfig,
+    ThrottleResponse,
     Message,
 )
+from broker.engine import (
+    BrokerEngine,
+    TopicNotFoundError,
+    UnknownConsumerError,
+    UnknownTransactionError,
+    TransactionStateError,
+    ThrottledError,
+)
 
 app = FastAPI(
     title="Mini Kafka Broker",
@@ -27,7 +38,9 @@ app = FastAPI(
         "**Key notes**\n\n"
         "- In-memory only (data lost on restart)\n"
         "- Single topic list (no partitions/replication)\n"
-        "- Per-consumer offset tracking\n\n"
+        "- Per-consumer offset tracking\n"
+        "- Per-producer/consumer byte-rate and request-rate quotas (HTTP 429 + throttle_time_ms)\n"
+        "- Multi-topic transactions; consumers only see committed data (last stable offset)\n\n"
         "Use the **/docs** page to try endpoints."
     ),
 )
@@ -40,14 +53,41 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-topics: Dict[str, List[Dict]] = {}
-consumers: Dict[str, Dict] = {}
-locks: Dict[str, asyncio.Lock] = {}
+# All broker state lives in the engine; the routes below only translate HTTP <-> engine calls.
+engine = BrokerEngine()
+
+def _producer_id(given: Optional[str], request: Request) -> str:
+    # Unnamed producers get one quota bucket per client address, so a noisy
+    # unnamed client only throttles itself, not every other unnamed client.
+    if given:
+        return given
+    host = request.client.host if request.client else "unknown"
+    return f"anonymous@{host}"
+
+@app.exception_handler(TopicNotFoundError)
+async def _topic_not_found(request: Request, exc: TopicNotFoundError):
+    return JSONResponse(status_code=404, content={"detail": f"Topic not found: {exc}. Register it first."})
+
+@app.exception_handler(UnknownConsumerError)
+async def _unknown_consumer(request: Request, exc: UnknownConsumerError):
+    return JSONResponse(status_code=404, content={"detail": "Unknown consumer. Register first."})
+
+@app.exception_handler(UnknownTransactionError)
+async def _unknown_transaction(request: Request, exc: UnknownTransactionError):
+    return JSONResponse(status_code=404, content={"detail": "Unknown transaction (it may have already committed, aborted or timed out)."})
+
+@app.exception_handler(TransactionStateError)
+async def _transaction_state(request: Request, exc: TransactionStateError):
+    return JSONResponse(status_code=409, content={"detail": str(exc)})
 
-def _ensure_topic(topic: str):
-    if topic not in topics:
-        topics[topic] = []
-        locks[topic] = asyncio.Lock()
+@app.exception_handler(ThrottledError)
+async def _throttled(request: Request, exc: ThrottledError):
+    body = ThrottleResponse(detail="Quota exceeded; retry after throttle_time_ms", throttle_time_ms=exc.throttle_time_ms)
+    return JSONResponse(
+        status_code=429,
+        content=body.model_dump(),
+        headers={"Retry-After": str(max(1, -(-exc.throttle_time_ms // 1000)))},
+    )
 
 @app.get("/", tags=["meta"], summary="Welcome")
 async def root():
@@ -59,54 +99,65 @@ async def health():
 
 @app.post("/topics/register", tags=["topics"], summary="Create/ensure a topic")
 async def register_topic(payload: TopicRegistration):
-    _ensure_topic(payload.topic)
+    await engine.register_topic(payload.topic)
     return {"status": "ok", "topic": payload.topic}
 
 @app.post("/producers/register", tags=["producers"], summary="Register a producer (optional)")
 async def register_producer(payload: ProducerRegistration):
-    _ensure_topic(payload.topic)
-    pid = payload.producer_id or f"producer-{uuid.uuid4().hex[:8]}"
+    pid = await engine.register_producer(payload.topic, payload.producer_id)
     return {"status": "ok", "topic": payload.topic, "producer_id": pid}
 
 @app.post("/consumers/register", tags=["consumers"], summary="Register a consumer and start at offset 0")
 async def register_consumer(payload: ConsumerRegistration):
-    _ensure_topic(payload.topic)
-    cid = payload.consumer_id or f"consumer-{uuid.uuid4().hex[:8]}"
-    consumers[cid] = {"topic": payload.topic, "offset": 0}
+    cid = await engine.register_consumer(payload.topic, payload.consumer_id)
     return {"status": "ok", "topic": payload.topic, "consumer_id": cid}
 
-@app.post("/produce", tags=["messages"], summary="Publish a message to a topic")
-async def produce(payload: PublishRequest):
-    if payload.topic not in topics:
-        raise HTTPException(status_code=404, detail="Topic not found. Register it first.")
-    msg = {"topic": payload.topic, "value": payload.value, "key": payload.key}
-    async with locks[payload.topic]:
-        offset = len(topics[payload.topic])
-        msg["offset"] = offset
-        topics[payload.topic].append(msg)
+@app.post("/quotas", tags=["quotas"], summary="Set byte-rate/request-rate quota for a producer or consumer id")
+async def set_quota(payload: QuotaConfig):
+    engine.set_quota(payload.client_type, payload.client_id, payload.byte_rate, payload.request_rate)
+    return {"status": "ok", **payload.model_dump()}
+
+@app.post("/produce", tags=["messages"], summary="Publish a message to a topic",
+          responses={429: {"model": ThrottleResponse}})
+async def produce(payload: PublishRequest, request: Request):
+    offset = await engine.produce(payload.topic, payload.value, payload.key, _producer_id(payload.producer_id, request))
     return {"status": "ok", "offset": offset}
 
-@app.post("/consume", response_model=Optional[Message], tags=["messages"], summary="Fetch next message for a consumer")
+@app.post("/consume", response_model=Optional[Message], tags=["messages"], summary="Fetch next message for a consumer",
+          responses={429: {"model": ThrottleResponse}})
 async def consume(req: ConsumeRequest):
-    if req.consumer_id not in consumers:
-        raise HTTPException(status_code=404, detail="Unknown consumer. Register first.")
-    topic = consumers[req.consumer_id]["topic"]
-    current_offset = consumers[req.consumer_id]["offset"]
-    async with locks[topic]:
-        messages = topics.get(topic, [])
-        if current_offset < len(messages):
-            msg = messages[current_offset]
-            consumers[req.consumer_id]["offset"] = current_offset + 1
-            return Message(**msg)
+    msg = await engine.consume(req.consumer_id)
+    if msg is not None:
+        return Message(**msg)
     # Important: 204 must not include a body
     return Response(status_code=204)
 
+@app.post("/transactions/begin", tags=["transactions"], summary="Begin a multi-topic transaction")
+async def begin_transaction(payload: BeginTransaction, request: Request):
+    txn_id = await engine.begin_transaction(_producer_id(payload.producer_id, request))
+    return {"status": "ok", "transaction_id": txn_id}
+
+@app.post("/transactions/produce", tags=["transactions"], summary="Write a batch of messages inside a transaction",
+          responses={429: {"model": ThrottleResponse}})
+async def produce_transactional(payload: TransactionalPublishRequest):
+    offsets = await engine.produce_transactional(
+        payload.transaction_id, [(m.topic, m.value, m.key) for m in payload.messages]
+    )
+    return {"status": "ok", "transaction_id": payload.transaction_id, "offsets": offsets}
+
+@app.post("/transactions/commit", tags=["transactions"], summary="Commit a transaction")
+async def commit_transaction(payload: EndTransaction):
+    await engine.commit_transaction(payload.transaction_id)
+    return {"status": "ok", "transaction_id": payload.transaction_id, "state": "committed"}
+
+@app.post("/transactions/abort", tags=["transactions"], summary="Abort a transaction")
+async def abort_transaction(payload: EndTransaction):
+    await engine.abort_transaction(payload.transaction_id)
+    return {"status": "ok", "transaction_id": payload.transaction_id, "state": "aborted"}
+
 @app.get("/stats", tags=["meta"], summary="Broker stats")
 async def stats():
-    return {
-        "topics": {t: len(msgs) for t, msgs in topics.items()},
-        "consumers": consumers,
-    }
+    return engine.stats()
 
 if __name__ == "__main__":
     uvicorn.run(app, host="127.0.0.1", port=8000)
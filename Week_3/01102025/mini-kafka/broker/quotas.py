@@ -0,0 +1,111 @@
+import math
+import time
+from typing import Dict, Optional, Tuple
+
+# Default per-client quotas (None = unlimited). Overridable per client via POST /quotas.
+DEFAULT_BYTE_RATE = 1024 * 1024  # bytes/second
+DEFAULT_REQUEST_RATE = 200.0     # requests/second
+# How often idle client buckets are swept out of QuotaManager (seconds).
+SWEEP_INTERVAL = 60.0
+
+class TokenBucket:
+    """Token bucket that may go into debt; the client is throttled until it is repaid.
+
+    Charging after the fact (like Kafka) means one large request is never rejected
+    outright, but the next requests wait until the bucket refills.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else rate)
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+
+    def throttle_time(self) -> float:
+        """Seconds until the bucket is out of debt (0 if the client may proceed)."""
+        self._refill()
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def record(self, amount: float) -> None:
+        self._refill()
+        self.tokens -= amount
+
+    def full_at(self) -> float:
+        """Monotonic time at which the bucket is full again if left unused."""
+        return self.last + (self.capacity - self.tokens) / self.rate
+
+class ClientQuota:
+    """Byte-rate and request-rate buckets for one producer or consumer id."""
+
+    def __init__(self, byte_rate: Optional[float], request_rate: Optional[float]):
+        self.bytes = TokenBucket(byte_rate) if byte_rate else None
+        self.requests = TokenBucket(request_rate) if request_rate else None
+
+    def throttle_time(self) -> float:
+        return max(
+            self.bytes.throttle_time() if self.bytes else 0.0,
+            self.requests.throttle_time() if self.requests else 0.0,
+        )
+
+    def record(self, nbytes: int) -> None:
+        if self.bytes:
+            self.bytes.record(nbytes)
+        if self.requests:
+            self.requests.record(1)
+
+    def full_at(self) -> float:
+        return max((bucket.full_at() for bucket in (self.bytes, self.requests) if bucket), default=0.0)
+
+class QuotaManager:
+    """Tracks one ClientQuota per (client_type, client_id).
+
+    Buckets that have refilled completely are indistinguishable from new ones,
+    so they are dropped (at most every ``SWEEP_INTERVAL`` seconds, on lookup);
+    churning client ids such as ``anonymous@host`` or generated consumer ids
+    then cost nothing once they go quiet.
+    """
+
+    def __init__(self, byte_rate: Optional[float] = DEFAULT_BYTE_RATE,
+                 request_rate: Optional[float] = DEFAULT_REQUEST_RATE):
+        self.default = {"byte_rate": byte_rate, "request_rate": request_rate}
+        self.overrides: Dict[Tuple[str, str], Dict[str, Optional[float]]] = {}
+        self._quotas: Dict[Tuple[str, str], ClientQuota] = {}
+        self._next_sweep = time.monotonic() + SWEEP_INTERVAL
+
+    def set_quota(self, client_type: str, client_id: str,
+                  byte_rate: Optional[float], request_rate: Optional[float]) -> None:
+        key = (client_type, client_id)
+        self.overrides[key] = {"byte_rate": byte_rate, "request_rate": request_rate}
+        self._quotas.pop(key, None)  # rebuilt with the new rates on next use
+
+    def _evict_idle(self, now: float) -> None:
+        for key in [k for k, quota in self._quotas.items() if quota.full_at() <= now]:
+            del self._quotas[key]
+        self._next_sweep = now + SWEEP_INTERVAL
+
+    def _get(self, client_type: str, client_id: str) -> ClientQuota:
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._evict_idle(now)
+        key = (client_type, client_id)
+        quota = self._quotas.get(key)
+        if quota is None:
+            rates = self.overrides.get(key, self.default)
+            quota = ClientQuota(rates["byte_rate"], rates["request_rate"])
+            self._quotas[key] = quota
+        return quota
+
+    def throttle_time_ms(self, client_type: str, client_id: str) -> int:
+        """Milliseconds the client must back off before its next request (0 = allowed)."""
+        secs = self._get(client_type, client_id).throttle_time()
+        return math.ceil(secs * 1000)
+
+    def record(self, client_type: str, client_id: str, nbytes: int) -> None:
+        self._get(client_type, client_id).record(nbytes)
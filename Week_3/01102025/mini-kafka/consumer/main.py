@@ -27,6 +27,9 @@ async def main():
                 print(f"Consumed: topic={msg['topic']} offset={msg['offset']} value={msg['value']}")            
             elif res.status_code == 204:                
                 await asyncio.sleep(args.poll_interval)            
+            elif res.status_code == 429:
+                # Broker quota exceeded: back off for the requested throttle time
+                await asyncio.sleep(res.json()["throttle_time_ms"] / 1000)
             else:                
                 print("Error:", res.status_code, res.text)                
                 await asyncio.sleep(args.poll_interval)
@@ -5,7 +5,15 @@ from pathlib import Path
 import sys
 BASE = Path(__file__).resolve().parents[1]
 sys.path.append(str(BASE))
-from shared.schemas import ProducerRegistration, PublishRequest, TopicRegistration
+from shared.schemas import (
+    BeginTransaction,
+    EndTransaction,
+    ProducerRegistration,
+    PublishRequest,
+    TopicRegistration,
+    TransactionalPublishRequest,
+    TransactionMessage,
+)
 
 async def main():
     parser = argparse.ArgumentParser(description="Mini Kafka Producer")
@@ -13,6 +21,7 @@ async def main():
     parser.add_argument("--topic", required=True)
     parser.add_argument("--count", type=int, default=10)
     parser.add_argument("--producer-id", default=None)
+    parser.add_argument("--transactional", action="store_true", help="Send all messages in one committed transaction")
     args = parser.parse_args()
 
     async with httpx.AsyncClient(timeout=10.0) as client:        
@@ -21,12 +30,40 @@ async def main():
         producer_id = r.json().get("producer_id")        
         print(f"Producer registered: {producer_id} on topic '{args.topic}'")
 
+        if args.transactional:
+            await produce_transactional(client, args, producer_id)
+            return
+
         for i in range(args.count):            
-            payload = PublishRequest(topic=args.topic, value=f"message-{i}") 
-            res = await client.post(f"{args.broker}/produce", json=payload.model_dump())            
-            res.raise_for_status()            
+            payload = PublishRequest(topic=args.topic, value=f"message-{i}", producer_id=producer_id) 
+            res = await post_honouring_quota(client, f"{args.broker}/produce", payload.model_dump())
             print(f"Produced offset={res.json()['offset']} value='{payload.value}'")            
             await asyncio.sleep(0.5)
 
+async def post_honouring_quota(client, url: str, body: dict):
+    """POST, sleeping for throttle_time_ms and retrying while the broker answers 429; raises on other errors."""
+    res = await client.post(url, json=body)
+    while res.status_code == 429:
+        await asyncio.sleep(res.json()["throttle_time_ms"] / 1000)
+        res = await client.post(url, json=body)
+    res.raise_for_status()
+    return res
+
+async def produce_transactional(client, args, producer_id: str):
+    r = await post_honouring_quota(client, f"{args.broker}/transactions/begin", BeginTransaction(producer_id=producer_id).model_dump())
+    txn_id = r.json()["transaction_id"]
+    messages = [TransactionMessage(topic=args.topic, value=f"message-{i}") for i in range(args.count)]
+    try:
+        res = await post_honouring_quota(
+            client,
+            f"{args.broker}/transactions/produce",
+            TransactionalPublishRequest(transaction_id=txn_id, messages=messages).model_dump(),
+        )
+    except Exception:
+        await post_honouring_quota(client, f"{args.broker}/transactions/abort", EndTransaction(transaction_id=txn_id).model_dump())
+        raise
+    await post_honouring_quota(client, f"{args.broker}/transactions/commit", EndTransaction(transaction_id=txn_id).model_dump())
+    print(f"Committed {txn_id}: offsets={res.json()['offsets']}")
+
 if __name__ == "__main__":
     asyncio.run(main())
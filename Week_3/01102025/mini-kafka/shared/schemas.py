@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Literal, Optional
 
 class TopicRegistration(BaseModel):
     topic: str
@@ -16,10 +16,36 @@ class PublishRequest(BaseModel):
     topic: str
     value: str  # keep it simple (string payload)
     key: Optional[str] = None
+    producer_id: Optional[str] = None  # used for quota accounting
 
 class ConsumeRequest(BaseModel):
     consumer_id: str
 
+class BeginTransaction(BaseModel):
+    producer_id: Optional[str] = None
+
+class TransactionMessage(BaseModel):
+    topic: str
+    value: str
+    key: Optional[str] = None
+
+class TransactionalPublishRequest(BaseModel):
+    transaction_id: str
+    messages: List[TransactionMessage]  # may span several topics
+
+class EndTransaction(BaseModel):
+    transaction_id: str
+
+class QuotaConfig(BaseModel):
+    client_type: Literal["producer", "consumer"]
+    client_id: str
+    byte_rate: Optional[float] = None     # bytes/second; None = unlimited
+    request_rate: Optional[float] = None  # requests/second; None = unlimited
+
+class ThrottleResponse(BaseModel):
+    detail: str
+    throttle_time_ms: int  # client should wait this long before retrying
+
 class Message(BaseModel):
     topic: str
     offset: int
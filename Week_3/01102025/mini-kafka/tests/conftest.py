@@ -0,0 +1,4 @@
+from pathlib import Path
+import sys
+BASE = Path(__file__).resolve().parents[1]
+sys.path.append(str(BASE))
@@ -0,0 +1,71 @@
+import asyncio
+import pytest # type: ignore
+
+from broker.engine import (
+    BrokerEngine,
+    BrokerError,
+    ThrottledError,
+    TopicNotFoundError,
+    TransactionStateError,
+    UnknownConsumerError,
+    UnknownTransactionError,
+)
+from broker.quotas import QuotaManager
+
+def make_engine():
+    return BrokerEngine(QuotaManager(byte_rate=None, request_rate=None))
+
+async def _roundtrip():
+    engine = make_engine()
+    await engine.register_topic("demo")
+    pid = await engine.register_producer("demo")
+    assert pid.startswith("producer-")
+    assert await engine.produce("demo", "hello", key="k", producer_id=pid) == 0
+    assert await engine.produce("demo", "world", producer_id=pid) == 1
+    cid = await engine.register_consumer("demo", consumer_id="c1")
+    first = await engine.consume(cid)
+    second = await engine.consume(cid)
+    empty = await engine.consume(cid)
+    return engine, first, second, empty
+
+def test_register_produce_consume():
+    engine, first, second, empty = asyncio.run(_roundtrip())
+    assert first == {"topic": "demo", "offset": 0, "value": "hello", "key": "k"}
+    assert second["offset"] == 1 and second["value"] == "world"
+    assert empty is None  # the HTTP layer answers 204
+    assert engine.consumers["c1"] == {"topic": "demo", "offset": 2}
+    assert engine.stats()["topics"] == {"demo": 2}
+
+def test_consumers_track_their_own_offsets():
+    async def run():
+        engine = make_engine()
+        await engine.register_topic("t")
+        await engine.produce("t", "m0")
+        a = await engine.register_consumer("t")
+        b = await engine.register_consumer("t")
+        return (await engine.consume(a))["value"], await engine.consume(a), (await engine.consume(b))["value"]
+    assert asyncio.run(run()) == ("m0", None, "m0")
+
+def test_concurrent_producers_get_distinct_offsets():
+    async def run():
+        engine = make_engine()
+        await engine.register_topic("t")
+        return sorted(await asyncio.gather(*(engine.produce("t", f"m{i}") for i in range(50))))
+    assert asyncio.run(run()) == list(range(50))
+
+def test_error_classes():
+    engine = make_engine()
+    with pytest.raises(TopicNotFoundError):
+        asyncio.run(engine.produce("missing", "x"))
+    with pytest.raises(UnknownConsumerError):
+        asyncio.run(engine.consume("nobody"))
+    with pytest.raises(UnknownTransactionError):
+        asyncio.run(engine.commit_transaction("txn-unknown"))
+    asyncio.run(engine.register_topic("t"))
+    txn = asyncio.run(engine.begin_transaction())
+    with pytest.raises(TopicNotFoundError):
+        asyncio.run(engine.produce_transactional(txn, [("missing", "x", None)]))
+    for cls in (TopicNotFoundError, UnknownConsumerError, UnknownTransactionError,
+                TransactionStateError, ThrottledError):
+        assert issubclass(cls, BrokerError)
+    assert ThrottledError(120).throttle_time_ms == 120
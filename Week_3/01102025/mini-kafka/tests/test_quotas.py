@@ -0,0 +1,122 @@
+import asyncio
+import pytest # type: ignore
+from fastapi.testclient import TestClient # type: ignore
+
+import broker.quotas
+from broker.engine import BrokerEngine, ThrottledError
+from broker.quotas import QuotaManager
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(broker.quotas.time, "monotonic", fake)
+    return fake
+
+def make_engine(byte_rate=None, request_rate=None):
+    engine = BrokerEngine(QuotaManager(byte_rate=byte_rate, request_rate=request_rate))
+    asyncio.run(engine.register_topic("t"))
+    return engine
+
+def test_throttled_producer_gets_throttle_time(clock):
+    engine = make_engine(byte_rate=10)
+    asyncio.run(engine.produce("t", "x" * 30, producer_id="noisy"))  # 20 bytes of debt at 10 B/s
+    with pytest.raises(ThrottledError) as exc:
+        asyncio.run(engine.produce("t", "y", producer_id="noisy"))
+    assert exc.value.throttle_time_ms == 2000
+    assert len(engine.topics["t"]) == 1
+
+def test_other_clients_are_unaffected(clock):
+    engine = make_engine(byte_rate=10)
+    asyncio.run(engine.produce("t", "x" * 30, producer_id="noisy"))
+    assert asyncio.run(engine.produce("t", "quiet", producer_id="polite")) == 1
+
+def test_bucket_refills(clock):
+    engine = make_engine(byte_rate=10)
+    asyncio.run(engine.produce("t", "x" * 30, producer_id="noisy"))
+    clock.now += 1.0
+    assert engine.quotas.throttle_time_ms("producer", "noisy") == 1000
+    clock.now += 1.0
+    assert asyncio.run(engine.produce("t", "y", producer_id="noisy")) == 1
+
+def test_request_rate_and_per_client_override(clock):
+    engine = make_engine(request_rate=100)
+    engine.set_quota("producer", "slow", byte_rate=None, request_rate=1)
+    asyncio.run(engine.produce("t", "a", producer_id="slow"))
+    asyncio.run(engine.produce("t", "b", producer_id="slow"))  # goes one request into debt
+    with pytest.raises(ThrottledError) as exc:
+        asyncio.run(engine.produce("t", "c", producer_id="slow"))
+    assert exc.value.throttle_time_ms == 1000
+
+def test_idle_buckets_are_evicted(clock):
+    engine = make_engine(byte_rate=10)
+    for i in range(50):
+        asyncio.run(engine.produce("t", "x" * 5, producer_id=f"churn-{i}"))
+    asyncio.run(engine.produce("t", "x" * 30, producer_id="noisy"))
+    clock.now += broker.quotas.SWEEP_INTERVAL
+    asyncio.run(engine.produce("t", "y", producer_id="fresh"))
+    # Every earlier bucket, including the 2 s of debt, has refilled and is dropped
+    assert set(engine.quotas._quotas) == {("producer", "fresh")}
+
+def test_indebted_buckets_survive_a_sweep(clock):
+    engine = make_engine(byte_rate=10)
+    engine.set_quota("producer", "noisy", byte_rate=1, request_rate=None)
+    asyncio.run(engine.produce("t", "x" * 120, producer_id="noisy"))  # 119 s of debt
+    clock.now += broker.quotas.SWEEP_INTERVAL
+    asyncio.run(engine.produce("t", "y", producer_id="fresh"))
+    assert ("producer", "noisy") in engine.quotas._quotas
+    assert engine.quotas.throttle_time_ms("producer", "noisy") == 59000
+
+def test_http_429_with_throttle_time(clock, monkeypatch):
+    import broker.main
+    monkeypatch.setattr(broker.main, "engine", make_engine(byte_rate=10))
+    client = TestClient(broker.main.app)
+    body = {"topic": "t", "value": "x" * 30, "producer_id": "noisy"}
+    assert client.post("/produce", json=body).status_code == 200
+    res = client.post("/produce", json=body)
+    assert res.status_code == 429
+    assert res.json()["throttle_time_ms"] == 2000
+    assert res.headers["Retry-After"] == "2"
+    # Unnamed producers are bucketed per client address, not all together
+    assert client.post("/produce", json={"topic": "t", "value": "ok"}).status_code == 200
+
+class FakeResponse:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self._body = body
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+class FakeClient:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def post(self, url, json):
+        self.calls += 1
+        return self.responses.pop(0)
+
+def test_producer_backs_off_for_throttle_time(monkeypatch):
+    from producer.main import post_honouring_quota
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    client = FakeClient([FakeResponse(429, {"throttle_time_ms": 250}), FakeResponse(200, {"offset": 0})])
+    res = asyncio.run(post_honouring_quota(client, "http://broker/produce", {}))
+    assert res.status_code == 200
+    assert client.calls == 2
+    assert slept == [0.25]
@@ -0,0 +1,84 @@
+import asyncio
+import pytest # type: ignore
+
+import broker.engine
+from broker.engine import BrokerEngine, TransactionStateError, UnknownTransactionError
+from broker.quotas import QuotaManager
+
+def make_engine(*topics, timeout=60.0):
+    engine = BrokerEngine(QuotaManager(byte_rate=None, request_rate=None), transaction_timeout=timeout)
+    for topic in topics:
+        asyncio.run(engine.register_topic(topic))
+    return engine
+
+def drain(engine, consumer_id):
+    values = []
+    while (msg := asyncio.run(engine.consume(consumer_id))) is not None:
+        values.append(msg["value"])
+    return values
+
+def test_open_transaction_holds_back_later_records():
+    engine = make_engine("a")
+    asyncio.run(engine.produce("a", "before"))
+    txn = asyncio.run(engine.begin_transaction("p"))
+    asyncio.run(engine.produce_transactional(txn, [("a", "t1", None), ("a", "t2", None)]))
+    asyncio.run(engine.produce("a", "after"))
+    cid = asyncio.run(engine.register_consumer("a"))
+    assert engine.last_stable_offset("a") == 1
+    assert drain(engine, cid) == ["before"]
+    asyncio.run(engine.commit_transaction(txn))
+    assert drain(engine, cid) == ["t1", "t2", "after"]
+
+def test_aborted_records_are_skipped():
+    engine = make_engine("a")
+    txn = asyncio.run(engine.begin_transaction("p"))
+    asyncio.run(engine.produce_transactional(txn, [("a", "lost", None)]))
+    asyncio.run(engine.produce("a", "kept"))
+    asyncio.run(engine.abort_transaction(txn))
+    cid = asyncio.run(engine.register_consumer("a"))
+    assert drain(engine, cid) == ["kept"]
+
+def test_multi_topic_commit_is_atomic():
+    engine = make_engine("orders", "payments")
+    txn = asyncio.run(engine.begin_transaction("p"))
+    offsets = asyncio.run(engine.produce_transactional(txn, [("orders", "o1", None), ("payments", "p1", None)]))
+    assert offsets == {"orders": [0], "payments": [0]}
+    orders = asyncio.run(engine.register_consumer("orders"))
+    payments = asyncio.run(engine.register_consumer("payments"))
+    assert drain(engine, orders) == [] and drain(engine, payments) == []
+    asyncio.run(engine.commit_transaction(txn))
+    assert drain(engine, orders) == ["o1"] and drain(engine, payments) == ["p1"]
+    assert engine.transactions == {}
+
+def test_finished_transaction_cannot_be_reused():
+    engine = make_engine("a")
+    txn = asyncio.run(engine.begin_transaction("p"))
+    asyncio.run(engine.commit_transaction(txn))
+    with pytest.raises(UnknownTransactionError):
+        asyncio.run(engine.produce_transactional(txn, [("a", "x", None)]))
+
+def test_abandoned_transaction_times_out(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(broker.engine.time, "monotonic", lambda: now[0])
+    engine = make_engine("a", timeout=30.0)
+    txn = asyncio.run(engine.begin_transaction("dead-producer"))
+    asyncio.run(engine.produce_transactional(txn, [("a", "orphan", None)]))
+    asyncio.run(engine.produce("a", "plain"))
+    cid = asyncio.run(engine.register_consumer("a"))
+    assert drain(engine, cid) == []
+    now[0] += 31.0
+    assert drain(engine, cid) == ["plain"]
+    assert engine.stats()["last_stable_offsets"] == {"a": 2}
+    assert engine.stats()["open_transactions"] == 0
+    with pytest.raises(UnknownTransactionError):
+        asyncio.run(engine.commit_transaction(txn))
+
+def test_expired_transaction_rejects_more_writes(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(broker.engine.time, "monotonic", lambda: now[0])
+    engine = make_engine("a", timeout=30.0)
+    txn = asyncio.run(engine.begin_transaction("p"))
+    now[0] += 31.0
+    with pytest.raises(TransactionStateError):
+        asyncio.run(engine.produce_transactional(txn, [("a", "late", None)]))
+    assert engine.topics["a"] == []